@@ -0,0 +1,106 @@
+import asyncio
+import random
+import time
+import os
+
+import httpx
+
+from benchmarks.common import run_server, summarize, percentile
+
+# 동기 DB(스레드풀) vs 비동기 DB(AsyncSession) 처리량/지연 시간 비교: python -m benchmarks.async_db
+# - DB_MODE=sync, DB_MODE=async 서버를 차례로 띄워서 같은 부하를 보냄
+# - 목록 캐시는 끄고 (CACHE_TTL=0) 매 요청이 DB를 조회하도록 함
+# - 부하: 게시글 목록/상세/댓글/태그 목록/문제 목록 조회 + BENCH_WRITE_RATIO 비율의 댓글 작성
+#   (async 모드에서도 댓글 작성은 동기 핸들러, 조회만 비동기 핸들러)
+# - 동시 요청 수 BENCH_CONCURRENCY, 측정 시간 BENCH_DURATION 초
+
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "64"))
+DURATION = float(os.getenv("BENCH_DURATION", "10"))
+WRITE_RATIO = float(os.getenv("BENCH_WRITE_RATIO", "0.1"))
+POST_COUNT = int(os.getenv("BENCH_POST_COUNT", "200"))
+MODES = os.getenv("BENCH_DB_MODES", "sync,async").split(",")
+
+
+def seed(url: str, headers: dict) -> list[int]:
+    """게시글 POST_COUNT개 (태그 2개씩), 앞쪽 게시글 10개에 댓글 5개씩"""
+    post_ids = []
+    with httpx.Client(base_url=url, headers=headers, timeout=30) as client:
+        for i in range(POST_COUNT):
+            response = client.post("/blog", json={
+                "title": f"영어 문법 정리 {i}",
+                "content": f"관계대명사와 분사구문 설명 {i} " * 20,
+                "category": "영어지식" if i % 2 else "입시정보",
+                "tags": ["문법", f"태그{i % 10}"]
+            })
+            response.raise_for_status()
+            post_ids.append(response.json()["id"])
+        for post_id in post_ids[:10]:
+            for j in range(5):
+                client.post(f"/blog/{post_id}/comments", json={"content": f"댓글 {j}"}).raise_for_status()
+    return post_ids
+
+
+def next_request(post_ids: list[int]):
+    """(메서드, 주소, 본문) 하나를 무작위로 선택"""
+    if random.random() < WRITE_RATIO:
+        return "POST", f"/blog/{random.choice(post_ids[:10])}/comments", {"content": "부하 테스트 댓글"}
+    choice = random.randrange(5)
+    if choice == 0:
+        return "GET", f"/blog?limit=20&page={random.randint(1, 10)}", None
+    if choice == 1:
+        return "GET", f"/blog/{random.choice(post_ids)}", None
+    if choice == 2:
+        return "GET", f"/blog/{random.choice(post_ids[:10])}/comments", None
+    if choice == 3:
+        return "GET", f"/blog/tags/태그{random.randrange(10)}?limit=20", None
+    return "GET", "/problems/", None
+
+
+async def worker(client: httpx.AsyncClient, post_ids: list[int], until: float, latencies: list, errors: dict):
+    while time.monotonic() < until:
+        method, path, body = next_request(post_ids)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        if status in (200, 201):
+            latencies.append((time.perf_counter() - started) * 1000)
+        else:
+            errors[status] = errors.get(status, 0) + 1
+
+
+async def load(url: str, headers: dict, post_ids: list[int]) -> tuple[list[float], dict, float]:
+    limits = httpx.Limits(max_connections=CONCURRENCY)
+    async with httpx.AsyncClient(base_url=url, headers=headers, timeout=60, limits=limits) as client:
+        # 연결/캐시 준비 (측정에서 제외)
+        warmup_until = time.monotonic() + 1
+        await asyncio.gather(*[worker(client, post_ids, warmup_until, [], {}) for _ in range(CONCURRENCY)])
+
+        latencies, errors = [], {}
+        started = time.monotonic()
+        until = started + DURATION
+        await asyncio.gather(*[worker(client, post_ids, until, latencies, errors) for _ in range(CONCURRENCY)])
+        return latencies, errors, time.monotonic() - started
+
+
+def run(mode: str) -> dict:
+    with run_server(DB_MODE=mode, CACHE_TTL=0) as server:
+        headers = server.create_user("bench", "bench-password", role="admin")
+        post_ids = seed(server.url, headers)
+        latencies, errors, elapsed = asyncio.run(load(server.url, headers, post_ids))
+
+    print(f"[{mode}] {len(latencies) / elapsed:.0f} req/s, {summarize(latencies)}, 오류 {errors or '없음'}")
+    return {"throughput": len(latencies) / elapsed, "p99": percentile(latencies, 99) if latencies else None}
+
+
+if __name__ == "__main__":
+    print(f"동시 요청 {CONCURRENCY}개, {DURATION:.0f}초, 쓰기 비율 {WRITE_RATIO:.0%}, 게시글 {POST_COUNT}개")
+    results = {mode: run(mode) for mode in MODES}
+    if {"sync", "async"} <= results.keys():
+        sync, async_ = results["sync"], results["async"]
+        print(
+            f"async / sync: 처리량 {async_['throughput'] / sync['throughput']:.2f}배, "
+            f"p99 {async_['p99'] / sync['p99']:.2f}배"
+        )
@@ -0,0 +1,96 @@
+from contextlib import contextmanager
+import subprocess
+import tempfile
+import sqlite3
+import shutil
+import time
+import sys
+import os
+
+import httpx
+
+# 벤치마크 공통 도구
+# - 임시 폴더의 빈 DB로 uvicorn 서버를 별도 프로세스로 실행 (blog.db는 건드리지 않음)
+# - 측정하는 쪽(이 프로세스)과 서버가 GIL/이벤트 루프를 나눠 쓰지 않도록 서버는 항상 별도 프로세스
+# - 지연 시간 백분위 요약
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_PORT = int(os.getenv("BENCH_PORT", "8765"))
+
+
+class Server:
+    def __init__(self, url: str, db_path: str):
+        self.url = url
+        self.db_path = db_path
+
+    def create_user(self, name: str, password: str, role: str = "user") -> dict:
+        """회원가입 API로 사용자를 만들고 (관리자면 DB에서 권한 변경) 로그인 헤더 반환"""
+        with httpx.Client(base_url=self.url, timeout=30) as client:
+            response = client.post("/auth/register", json={
+                "name": name, "email": f"{name}@bench.com", "password": password, "nickname": name
+            })
+            response.raise_for_status()
+            if role != "user":
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute('UPDATE "User" SET role = ? WHERE name = ?', (role, name))
+            response = client.post("/auth/login", json={"name": name, "password": password})
+            response.raise_for_status()
+            return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@contextmanager
+def run_server(port: int = BENCH_PORT, **env):
+    """임시 DB로 서버 실행 (env: 서버에 넘길 환경변수, 예: DB_MODE="async")"""
+    work_dir = tempfile.mkdtemp(prefix="blog-bench-")
+    db_path = os.path.join(work_dir, "blog.db")
+    environment = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "CACHE_BACKEND": "memory",
+        **{key: str(value) for key, value in env.items()},
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT_DIR,
+        env=environment,
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(url, process)
+        yield Server(url, db_path)
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def wait_until_ready(url: str, process, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("서버가 시작되지 않았습니다.")
+        try:
+            if httpx.get(f"{url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("서버 시작 대기 시간 초과")
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def summarize(latencies_ms: list[float]) -> str:
+    if not latencies_ms:
+        return "요청 없음"
+    return (
+        f"{len(latencies_ms)}개, "
+        f"p50 {percentile(latencies_ms, 50):.1f}ms, "
+        f"p95 {percentile(latencies_ms, 95):.1f}ms, "
+        f"p99 {percentile(latencies_ms, 99):.1f}ms, "
+        f"max {max(latencies_ms):.1f}ms"
+    )
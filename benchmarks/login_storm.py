@@ -0,0 +1,71 @@
+import asyncio
+import time
+import os
+
+import httpx
+
+from benchmarks.common import run_server, summarize
+
+# 로그인 폭주 중 다른 API의 응답 시간 측정: python -m benchmarks.login_storm
+# 1. 로그인 없이 다른 API(게시글 목록, 서버 렌더링 목록, 문제 목록)의 응답 시간 측정
+# 2. 동시 로그인 요청 BENCH_LOGIN_CONCURRENCY개를 계속 보내는 동안 같은 API의 응답 시간 측정
+# - 비밀번호 해싱 작업 풀 설정은 PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE (utils/passwords.py)
+# - 작업 풀이 가득 차서 거절된 로그인은 503으로 집계 (브라우저처럼 Retry-After 만큼 기다렸다가 다시 시도)
+
+LOGIN_CONCURRENCY = int(os.getenv("BENCH_LOGIN_CONCURRENCY", "64"))
+DURATION = float(os.getenv("BENCH_DURATION", "10"))
+PROBE_PATHS = ["/blog", "/posts", "/problems/"]
+
+
+async def probe(client: httpx.AsyncClient, until: float) -> list[float]:
+    """다른 API를 하나씩 번갈아 호출하며 응답 시간 기록 (ms)"""
+    latencies = []
+    i = 0
+    while time.monotonic() < until:
+        started = time.perf_counter()
+        response = await client.get(PROBE_PATHS[i % len(PROBE_PATHS)])
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+        i += 1
+    return latencies
+
+
+async def login_loop(client: httpx.AsyncClient, until: float, statuses: dict):
+    while time.monotonic() < until:
+        response = await client.post("/auth/login", json={"name": "storm", "password": "storm-password"})
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        if response.status_code == 503:
+            await asyncio.sleep(float(response.headers.get("retry-after", "1")))
+
+
+async def run(url: str):
+    limits = httpx.Limits(max_connections=LOGIN_CONCURRENCY + 8)
+    async with httpx.AsyncClient(base_url=url, timeout=60, limits=limits) as client:
+        # 1. 기준 응답 시간
+        baseline = await probe(client, time.monotonic() + DURATION / 2)
+
+        # 2. 로그인 폭주 중 응답 시간
+        statuses = {}
+        until = time.monotonic() + DURATION
+        storm = [asyncio.create_task(login_loop(client, until, statuses)) for _ in range(LOGIN_CONCURRENCY)]
+        await asyncio.sleep(0.5)  # 로그인 요청이 쌓인 뒤부터 측정
+        during = await probe(client, until)
+        await asyncio.gather(*storm)
+
+        health = (await client.get("/health")).json()
+
+    print(f"다른 API 응답 시간 (기준):      {summarize(baseline)}")
+    print(f"다른 API 응답 시간 (로그인 중): {summarize(during)}")
+    print(f"로그인 응답 코드: {dict(sorted(statuses.items()))} (동시 {LOGIN_CONCURRENCY}개, {DURATION:.0f}초)")
+    stats = health["password_hash"]
+    print(
+        f"해싱 작업 풀: 완료 {stats['completed']}, 거절 {stats['rejected']}, "
+        f"대기 평균 {stats['queue_wait_ms_avg']:.1f}ms / 최대 {stats['queue_wait_ms_max']:.1f}ms, "
+        f"해싱 평균 {stats['hash_ms_avg']:.1f}ms / 최대 {stats['hash_ms_max']:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    with run_server() as server:
+        server.create_user("storm", "storm-password")
+        asyncio.run(run(server.url))
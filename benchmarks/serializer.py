@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+import statistics
+import tempfile
+import shutil
+import atexit
+import time
+import os
+
+# 게시글 목록 응답 직렬화 비교 (캐시에 없을 때의 경로): python -m benchmarks.serializer
+# - before: make_post_response → jsonable_encoder (캐시 저장용 dict) → json_response
+# - after:  make_post_response → json_data (상세 조회와 같은 TypeAdapter) → json_response
+# - 게시글 BENCH_POST_COUNT개 (DB 없이 ORM 객체만 만들어서 측정), BENCH_REPEAT번 반복한 중앙값
+# - 두 경로의 응답 본문이 같은지도 확인
+
+POST_COUNT = int(os.getenv("BENCH_POST_COUNT", "100"))
+REPEAT = int(os.getenv("BENCH_REPEAT", "200"))
+
+# 라우터를 임포트하기 전에 임시 DB/메모리 캐시로 설정 (blog.db, Redis는 사용하지 않음)
+BENCH_DB_DIR = tempfile.mkdtemp(prefix="blog-bench-")
+atexit.register(shutil.rmtree, BENCH_DB_DIR, ignore_errors=True)
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{BENCH_DB_DIR}/blog.db")
+os.environ.setdefault("CACHE_BACKEND", "memory")
+os.environ.setdefault("REDIS_PORT", "1")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from models.comment import Comment  # noqa: E402,F401 (관계 설정에 필요한 모델)
+from models.post import Post, Tag  # noqa: E402
+from models.problem import UserProblem  # noqa: E402,F401
+from models.user import User  # noqa: E402
+from routers.blog import PostListResponse, make_post_response  # noqa: E402
+from utils.serialization import json_data, json_response  # noqa: E402
+
+
+def make_posts() -> list[Post]:
+    author = User(user_id=1, name="admin", email="admin@bench.com", password="-", nickname="관리자", role="admin")
+    tags = [Tag(tag_id=i, name=f"태그{i}") for i in range(10)]
+    started = datetime(2024, 1, 1, 9, 0, 0, 123456)
+    return [
+        Post(
+            post_id=i,
+            user_id=author.user_id,
+            author=author,
+            title=f"영어 문법 정리 {i}",
+            content=f"관계대명사와 분사구문 설명 {i} " * 5,
+            category="영어지식" if i % 2 else "입시정보",
+            tags=[tags[0], tags[i % 10]],
+            image_url=f"/uploads/posts/{i:064x}.jpg" if i % 3 == 0 else None,
+            view_count=i * 7,
+            created_at=started + timedelta(minutes=i),
+            updated_at=started + timedelta(minutes=i, seconds=30)
+        )
+        for i in range(POST_COUNT)
+    ]
+
+
+def page(posts: list[Post]) -> dict:
+    return {
+        "total": len(posts),
+        "page": 1,
+        "limit": len(posts),
+        "next_cursor": None,
+        "posts": [make_post_response(post, "thumbnail") for post in posts]
+    }
+
+
+def before(posts: list[Post]) -> bytes:
+    return json_response(PostListResponse, jsonable_encoder(page(posts))).body
+
+
+def after(posts: list[Post]) -> bytes:
+    return json_response(PostListResponse, json_data(PostListResponse, page(posts))).body
+
+
+def measure(serialize, posts: list[Post]) -> float:
+    """한 번 직렬화하는 데 걸린 시간의 중앙값 (ms)"""
+    serialize(posts)  # 준비 (TypeAdapter 생성 등)
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        serialize(posts)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    posts = make_posts()
+    assert before(posts) == after(posts), "두 경로의 응답 본문이 다름"
+
+    print(f"게시글 {POST_COUNT}개 목록 응답, {REPEAT}번 반복 중앙값")
+    before_ms = measure(before, posts)
+    after_ms = measure(after, posts)
+    print(f"before (jsonable_encoder): {before_ms:.2f}ms")
+    print(f"after  (TypeAdapter):      {after_ms:.2f}ms")
+    print(f"after / before: {after_ms / before_ms:.2f}배")
@@ -3,9 +3,7 @@ from models.user import User
 from models.post import Post, Tag, PostTag  
 from models.comment import Comment  
 from models.problem import Problem, UserProblem 
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from utils.passwords import pwd_context
 
 def create_admin():
     # 테이블이 없으면 생성
@@ -1,39 +1,252 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, TextClause
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from redis.retry import Retry
+from redis.backoff import NoBackoff
 import redis
+import threading
 import os
 from dotenv import load_dotenv
 
 # 환경변수 로드
 load_dotenv()
 
-# SQLite 데이터베이스 URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./blog.db"
+# SQLite 데이터베이스 URL (테스트 등에서 다른 DB 파일을 쓰려면 DATABASE_URL 환경변수로 변경)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./blog.db")
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# SQLite 엔진 프로필 (SQLITE_PROFILE 환경변수)
+# - default: SQLite 기본 설정, 엔진 하나 (기존 방식, 기본값)
+# - production: WAL 모드 + PRAGMA 튜닝, 읽기 전용 연결 풀과 쓰기 연결 1개로 분리
+#   (쓰기는 연결 1개를 순서대로 사용하므로 "database is locked" 오류 대신 대기, 운영 서버에서 선택)
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "default")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", str(-64 * 1024)))  # 음수 = KB 단위 (64MB)
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+SQLITE_WRITE_TIMEOUT = int(os.getenv("SQLITE_WRITE_TIMEOUT", "30"))  # 쓰기 연결 대기 최대 시간 (초)
 
-# 세션 로컬 클래스 생성
-SessionLocal = sessionmaker(bind=engine)
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record, writer=True):
+    cursor = dbapi_connection.cursor()
+    if writer:
+        # WAL 모드는 DB 파일에 저장되므로 쓰기 연결에서만 설정
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+    cursor.close()
+
+
+def is_write_statement(clause) -> bool:
+    if clause is None:
+        return False
+    if getattr(clause, "is_dml", False):
+        return True
+    if isinstance(clause, TextClause):
+        return not clause.text.lstrip().upper().startswith("SELECT")
+    return False
+
+
+class RoutingSession(Session):
+    """
+    읽기는 읽기 전용 연결 풀(read_bind), 쓰기는 쓰기 연결(bind)로 보내는 세션
+    - 트랜잭션 안에서 한 번 쓰기를 하면 커밋/롤백 전까지는 읽기도 쓰기 연결 사용
+      (아직 커밋하지 않은 내용을 읽을 수 있도록)
+    """
+    _writing = False
+
+    def __init__(self, *args, read_bind=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_bind = read_bind if read_bind is not None else self.bind
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._writing or self._flushing or is_write_statement(clause):
+            self._writing = True
+            return self.bind
+        return self.read_bind
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def reset_writing(session, transaction):
+    if transaction.parent is None:
+        session._writing = False
+
+
+def read_only_url(url: str) -> str:
+    """읽기 전용으로 여는 SQLite URI (sqlite:///경로 → sqlite:///file:경로?mode=ro&uri=true)"""
+    prefix, path = url.split(":///", 1)
+    return f"{prefix}:///file:{path}?mode=ro&uri=true"
+
+
+def create_sqlite_engines(url: str, profile: str = SQLITE_PROFILE):
+    """프로필에 맞는 (쓰기 엔진, 읽기 엔진, 세션 클래스) 생성 (default면 두 엔진이 같음)"""
+    if profile != "production":
+        engine = create_engine(url)
+        return engine, engine, sessionmaker(bind=engine)
+
+    # 쓰기 전용: 연결 1개를 순서대로 사용
+    engine = create_engine(
+        url,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=SQLITE_WRITE_TIMEOUT
+    )
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+
+    # 읽기 전용 엔진
+    read_engine = create_engine(
+        read_only_url(url),
+        pool_size=SQLITE_READ_POOL_SIZE,
+        max_overflow=SQLITE_READ_POOL_SIZE
+    )
+    event.listen(read_engine, "connect", lambda conn, record: apply_sqlite_pragmas(conn, record, writer=False))
+
+    return engine, read_engine, sessionmaker(bind=engine, class_=RoutingSession, read_bind=read_engine)
+
+
+# SQLAlchemy 엔진, 세션 로컬 클래스 생성
+engine, read_engine, SessionLocal = create_sqlite_engines(SQLALCHEMY_DATABASE_URL)
+
+# DB 접근 방식 선택 (DB_MODE 환경변수)
+# - sync: 기존 방식 (핸들러가 Starlette 스레드풀에서 실행)
+# - async: 조회 API(routers/*_async.py)만 aiosqlite 비동기 엔진 + AsyncSession 사용
+#   (핸들러가 스레드풀을 거치지 않고 이벤트 루프에서 실행, 쓰기 API는 sync와 같음)
+DB_MODE = os.getenv("DB_MODE", "sync")
+
+ASYNC_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+async_engine = None
+AsyncSessionLocal = None
+if DB_MODE == "async":
+    if SQLITE_PROFILE == "production":
+        # 비동기 세션은 조회 API에서만 사용 → 동기 세션의 읽기 연결과 같은 읽기 전용 연결 풀
+        # (쓰기는 동기 라우터의 쓰기 연결 1개로만 일어남)
+        async_engine = create_async_engine(
+            read_only_url(ASYNC_DATABASE_URL),
+            pool_size=SQLITE_READ_POOL_SIZE,
+            max_overflow=SQLITE_READ_POOL_SIZE
+        )
+        event.listen(
+            async_engine.sync_engine, "connect",
+            lambda conn, record: apply_sqlite_pragmas(conn, record, writer=False)
+        )
+    else:
+        async_engine = create_async_engine(ASYNC_DATABASE_URL)
+    # 커밋 후에도 불러온 값 유지 (비동기 세션에서는 만료된 속성을 다시 불러올 수 없음)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
 
 # Base 클래스 생성 (모든 모델의 부모 클래스)
 Base = declarative_base()
 
 # Redis 연결 설정 (캐싱 및 인기 문제 추적용)
-try:
-    redis_client = redis.Redis(
-        host='localhost',
-        port=6379,
-        db=0,
-        decode_responses=True
-    )
-    # Redis 연결 테스트
-    redis_client.ping()
-    print("Redis 연결 성공!")
-except redis.ConnectionError:
-    print("Redis 연결 실패! Redis 서버가 실행 중인지 확인하세요.")
-    redis_client = None
+# - import 시에는 접속하지 않음: 연결은 처음 명령을 보낼 때 만들어지고, 끊기면 다음 명령에서 다시 연결
+# - 접속/응답 대기 시간을 제한하고 재시도하지 않음 (Redis가 없어도 서버 시작과 요청이 멈추지 않음)
+# - 사용 가능 여부는 check()(PING) 결과: 서버 시작 시 한 번, 이후 REDIS_HEALTH_INTERVAL 초마다 백그라운드에서 확인
+# - if redis_client: 로 Redis 사용 여부를 판단하던 코드는 그대로 동작 (마지막 확인 결과가 불리언 값)
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "0.5"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1"))
+REDIS_HEALTH_INTERVAL = float(os.getenv("REDIS_HEALTH_INTERVAL", "15"))
+
+
+class RedisPipeline(redis.client.Pipeline):
+    """RedisClient.pipeline(): 파이프라인 실행 중 연결이 끊겨도 클라이언트를 사용 불가로 표시"""
+
+    def __init__(self, owner, *args):
+        super().__init__(*args)
+        self._owner = owner
+
+    def execute(self, raise_on_error: bool = True):
+        try:
+            return super().execute(raise_on_error)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._owner.available = False
+            raise
+
+
+class RedisClient(redis.Redis):
+    def __init__(self, *args, health_interval: float = REDIS_HEALTH_INTERVAL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.available = False
+        self.checked = False
+        self.health_interval = health_interval
+        self._recover_callbacks = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __bool__(self):
+        return self.available
+
+    def execute_command(self, *args, **options):
+        try:
+            return super().execute_command(*args, **options)
+        except (redis.ConnectionError, redis.TimeoutError):
+            # 연결이 끊겼으면 다음 상태 확인까지 Redis를 사용하지 않음 (요청마다 대기하지 않도록)
+            self.available = False
+            raise
+
+    def pipeline(self, transaction=True, shard_hint=None) -> RedisPipeline:
+        # 파이프라인은 execute_command를 거치지 않으므로 연결 오류 처리를 따로 함
+        return RedisPipeline(self, self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+    def on_recover(self, callback):
+        """Redis를 사용할 수 없다가 다시 연결됐을 때 실행할 함수 등록"""
+        self._recover_callbacks.append(callback)
+
+    def check(self) -> bool:
+        """PING으로 사용 가능 여부 확인, 끊겼다가 다시 연결됐으면 등록된 함수 실행"""
+        was_down = self.checked and not self.available
+        try:
+            self.ping()
+            available = True
+        except Exception:
+            # 연결 오류 외의 예외(응답 형식 오류 등)도 사용 불가로 처리 (상태 확인 스레드가 멈추지 않도록)
+            available = False
+
+        if available != self.available or not self.checked:
+            print("Redis 연결 성공!" if available else "Redis 연결 실패! Redis 서버가 실행 중인지 확인하세요.")
+        self.available = available
+        self.checked = True
+
+        if available and was_down:
+            for callback in self._recover_callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Redis 재연결 후 처리 실패: {callback} ({e})")
+        return available
+
+    def _run(self):
+        while not self._stop.wait(self.health_interval):
+            self.check()
+
+    def start(self):
+        """백그라운드 상태 확인 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="redis-health", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+
+redis_client = RedisClient(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    db=0,
+    decode_responses=True,
+    socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+    socket_timeout=REDIS_SOCKET_TIMEOUT,
+    retry=Retry(NoBackoff(), 0)
+)
 
 # 데이터베이스 세션 의존성
 def get_db():
@@ -41,4 +254,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# 비동기 데이터베이스 세션 의존성 (DB_MODE=async)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
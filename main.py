@@ -1,19 +1,86 @@
-from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
+import time
+IMPORT_STARTED = time.perf_counter()
+
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from database import engine, Base
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from contextlib import asynccontextmanager
+from database import engine, Base, SessionLocal, DB_MODE, redis_client
+from utils.search import create_search_index
+from utils.view_counter import view_counter
+from utils.post_counts import ensure_post_counts
+from utils.popularity import ensure_popularity, popularity_buffer
+from utils.image_pipeline import image_pipeline
+from utils.assets import asset_manifest, AssetFiles, TemplateFiles, UploadFiles
+from utils.encoding import NegotiatedGZipMiddleware
+from utils.uploads import UploadLimitMiddleware, MAX_IMAGE_SIZE, MAX_PROBLEM_FILE_SIZE
+from utils.fragments import template_env
+from utils.dependencies import user_cache_summary
+from utils.passwords import password_hasher
+from utils.migrations import run_migrations
+from utils.startup import startup_report
 import os
-from routers import comment 
 from models.user import User
-from models.post import Post, Tag, PostTag
+from models.post import Post, Tag, PostTag, PostCount
 from models.comment import Comment
-from models.problem import Problem, UserProblem
+from models.problem import Problem, UserProblem, ProblemPopularity
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버 시작/종료 처리
+    - DB 스키마 확인, Redis 연결 등은 import 시가 아니라 여기서 실행
+      (스크립트나 다른 모듈에서 main을 임포트해도 DB/Redis에 접속하지 않음)
+    - 단계별 소요 시간은 utils/startup.py의 startup_report에 기록
+    """
+    # SQLite 첫 연결 (PRAGMA 설정 포함)
+    with startup_report.step("sqlite"):
+        with engine.connect():
+            pass
+
+    with startup_report.step("schema"):
+        # 데이터베이스 테이블 자동 생성 (모든 모델이 임포트된 후 실행)
+        Base.metadata.create_all(bind=engine)
+        # 기존 DB에 새 인덱스 등 스키마 변경 적용 (utils/migrations.py)
+        run_migrations(engine)
+        # 게시글 전문 검색 인덱스 생성 (기존 DB라면 게시글로 채워짐)
+        create_search_index(engine)
+
+    # Redis 연결 확인 (접속 대기 시간 제한, 실패해도 Redis 없이 시작)
+    with startup_report.step("redis"):
+        redis_client.check()
+
+    with startup_report.step("counters"):
+        # 게시글 수 카운터가 비어 있으면 (기존 DB) 한 번 계산
+        ensure_post_counts(SessionLocal)
+        # 문제 인기도: 기존 DB면 ProblemPopularity를 채우고, Redis 인기 순위를 SQL 기준으로 다시 만듦
+        ensure_popularity(SessionLocal)
+
+    # 정적 파일 해시 주소 + 미리 압축 (utils/assets.py)
+    if os.path.exists("static"):
+        with startup_report.step("assets"):
+            asset_manifest.build()
+
+    # 조회수/인기도 주기 반영, Redis 상태 주기 확인 시작
+    view_counter.start()
+    popularity_buffer.start()
+    redis_client.start()
+
+    startup_report.print()
+    yield
+
+    # 종료: 남은 조회수/인기도 반영, 진행 중인 이미지 변환 작업을 마치고 프로세스 풀 종료
+    redis_client.stop()
+    popularity_buffer.stop()
+    view_counter.stop()
+    image_pipeline.shutdown()
 
 
 # FastAPI 앱 생성
-app = FastAPI()
+# dict를 반환하는 핸들러도 orjson으로 직렬화 (응답 스키마가 있는 핸들러는 utils/serialization.py의 json_response 사용)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS 설정 (프론트엔드와 백엔드가 다른 포트에서 실행될 경우)
 app.add_middleware(
@@ -24,31 +91,69 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 애플리케이션 시작 시 데이터베이스 테이블 자동 생성
-# 모든 모델이 임포트된 후 실행됩니다
-Base.metadata.create_all(bind=engine)
+# 큰 JSON 응답 gzip 압축 (GZIP_MINIMUM_SIZE 바이트 이상, 0이면 사용 안 함)
+# 이미 압축된 응답(정적 파일, 문제 목록)은 Content-Encoding이 있으므로 다시 압축하지 않음
+# Accept-Encoding의 q 값을 확인 (gzip;q=0 이면 압축하지 않음, utils/encoding.py)
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+if GZIP_MINIMUM_SIZE > 0:
+    app.add_middleware(NegotiatedGZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
+# 업로드 API 요청 본문 크기 제한 (본문을 다 받기 전에 413, utils/uploads.py)
+app.add_middleware(UploadLimitMiddleware, limits={
+    "/blog/images": MAX_IMAGE_SIZE,
+    "/problems/admin/problems": MAX_PROBLEM_FILE_SIZE
+})
+
+# Redis가 끊겼다가 다시 연결되면 인기 순위를 SQL 기준으로 다시 만듦 (끊긴 동안의 선택 반영)
+redis_client.on_recover(lambda: ensure_popularity(SessionLocal))
 
-# 정적 파일 서빙 설정
+# 정적 파일 서빙 설정 (해시 주소 + immutable 캐시 + 미리 압축, utils/assets.py)
 if os.path.exists("static"):
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+    app.mount("/static", AssetFiles(), name="static")
 
-# uploads 폴더 마운트 추가 (문제 파일 다운로드용)
+# uploads 폴더 마운트 추가 (문제 파일 다운로드용, 해시 이름 파일은 immutable 캐시)
 if os.path.exists("uploads"):
-    app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+    app.mount("/uploads", UploadFiles(directory="uploads"), name="uploads")
 
-# templates 폴더도 정적 파일로 서빙 (HTML 직접 접근 가능하도록)
+# templates 폴더도 정적 파일로 서빙 (HTML 직접 접근 가능하도록, /static/ 주소는 해시 주소로 변경)
 if os.path.exists("templates"):
-    app.mount("/templates", StaticFiles(directory="templates", html=True), name="templates")
+    app.mount("/templates", TemplateFiles(template_env, directory="templates", html=True), name="templates")
 
 # Jinja2 템플릿 설정
-templates = Jinja2Templates(directory="templates")
+templates = Jinja2Templates(env=template_env)
 
 # 라우터 임포트 및 등록 
-from routers import auth, blog, comment, problem
+# DB_MODE=async 이면 조회가 가장 많은 API(게시글 목록/상세, 댓글 목록, 문제 목록/카탈로그/인기 문제)만
+# AsyncSession을 쓰는 비동기 라우터(routers/*_async.py)의 핸들러로 교체 (쓰기 API는 두 모드 모두 동기 라우터)
+# (서버 렌더링 페이지는 두 모드 모두 동기 세션 사용)
+from routers import auth, blog, comment, problem, pages
+
+
+def with_async_reads(router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """router에서 async_router에 같은 경로/메서드가 있는 핸들러만 교체한 라우터 (경로 순서는 그대로)"""
+    async_routes = {(route.path, method): route for route in async_router.routes for method in route.methods}
+    merged = APIRouter()
+    for route in router.routes:
+        keys = [(route.path, method) for method in route.methods]
+        merged.routes.append(next((async_routes.pop(key) for key in keys if key in async_routes), route))
+    assert not async_routes, f"동기 라우터에 없는 비동기 경로: {sorted(async_routes)}"
+    return merged
+
+
+blog_router, comment_router, problem_router = blog.router, comment.router, problem.router
+if DB_MODE == "async":
+    from routers import blog_async, comment_async, problem_async
+    blog_router = with_async_reads(blog.router, blog_async.router)
+    comment_router = with_async_reads(comment.router, comment_async.router)
+    problem_router = with_async_reads(problem.router, problem_async.router)
+
 app.include_router(auth.router, prefix="/auth", tags=["인증"])
-app.include_router(blog.router, prefix="/blog", tags=["게시글"])
-app.include_router(problem.router, prefix="/problems", tags=["문제"])
-app.include_router(comment.router, prefix="/blog", tags=["댓글"])
+app.include_router(blog_router, prefix="/blog", tags=["게시글"])
+app.include_router(problem_router, prefix="/problems", tags=["문제"])
+app.include_router(comment_router, prefix="/blog", tags=["댓글"])
+app.include_router(pages.router, tags=["페이지"])
+
+startup_report.record("imports", time.perf_counter() - IMPORT_STARTED)
 
 # 루트 엔드포인트
 @app.get("/", response_class=HTMLResponse)
@@ -58,7 +163,13 @@ async def root(request: Request):
 # 헬스 체크 엔드포인트
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "auth_cache": user_cache_summary(),
+        "password_hash": password_hasher.summary(),
+        "redis": "connected" if redis_client else "unavailable",
+        "startup": startup_report.summary()
+    }
 
 if __name__ == "__main__":
     import uvicorn
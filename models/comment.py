@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from datetime import datetime
 from database import Base
 
 
@@ -12,8 +12,15 @@ class Comment(Base):
     user_id = Column(Integer, ForeignKey("User.user_id"), nullable=False)
     parent_comment_id = Column(Integer, ForeignKey("Comment.comment_id"), nullable=True)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    
+    # 게시글의 댓글 트리 조회 (최상위 댓글 comment_id 역순 페이지네이션 포함) 와 대댓글 조회용 인덱스
+    __table_args__ = (
+        Index('ix_comment_post_parent', 'post_id', 'parent_comment_id', 'comment_id'),
+        Index('ix_comment_parent_comment_id', 'parent_comment_id'),
+        Index('ix_comment_user_id', 'user_id'),
+    )
     
     # 댓글이 속한 게시글
     post = relationship("Post", back_populates="comments")
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from datetime import datetime
 from database import Base
 
 
@@ -12,11 +12,20 @@ class Post(Base):
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
     category = Column(String(255), nullable=False)  # "입시정보" or "영어지식"
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     image_url = Column(String(500), nullable=True)
+    image_variants = Column(Text, nullable=True)  # 변환 이미지 URL JSON {"thumbnail": ..., "medium_webp": ...}
     view_count = Column(Integer, default=0)
     
+    # 목록 정렬 (created_at, post_id) 과 카테고리별 목록용 인덱스
+    __table_args__ = (
+        Index('ix_post_created_at', 'created_at', 'post_id'),
+        Index('ix_post_category_created_at', 'category', 'created_at', 'post_id'),
+        Index('ix_post_user_id', 'user_id'),
+        Index('ix_post_image_url', 'image_url'),
+    )
+    
     author = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     post_tags = relationship("PostTag", back_populates="post", cascade="all, delete-orphan")
@@ -34,7 +43,7 @@ class Tag(Base):
     
     tag_id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=datetime.now)
     
     post_tags = relationship("PostTag", back_populates="tag", cascade="all, delete-orphan")
     
@@ -52,11 +61,22 @@ class PostTag(Base):
     post_tag_id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("Post.post_id"), nullable=False)
     tag_id = Column(Integer, ForeignKey("Tag.tag_id"), nullable=False)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=datetime.now)
     
     __table_args__ = (
         UniqueConstraint('post_id', 'tag_id', name='unique_post_tag'),
+        # 태그별 게시글 조회용 (post_id 쪽은 unique_post_tag 인덱스 사용)
+        Index('ix_post_tag_tag_id', 'tag_id', 'post_id'),
     )
     
     post = relationship("Post", back_populates="post_tags")
-    tag = relationship("Tag", back_populates="post_tags")
\ No newline at end of file
+    tag = relationship("Tag", back_populates="post_tags")
+
+
+class PostCount(Base):
+    """게시글 수 집계 테이블 (전체/카테고리별/태그별)"""
+    __tablename__ = "PostCount"
+    
+    # "total", "category:입시정보", "tag:3" 형식
+    key = Column(String(100), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -20,6 +20,9 @@ class Problem(Base):
     # 연도, 월, 번호 조합의 유니크 제약조건
     __table_args__ = (
         UniqueConstraint('year', 'month', 'number', name='unique_problem'),
+        # 문제 목록 정렬 (year DESC, month DESC, number) 용 인덱스
+        Index('ix_problem_year_month_number', year.desc(), month.desc(), number),
+        Index('ix_problem_month', 'month'),
     )
     
     user_problems = relationship("UserProblem", back_populates="problem", cascade="all, delete-orphan")
@@ -40,7 +43,23 @@ class UserProblem(Base):
     # 사용자와 문제 조합의 유니크 제약조건
     __table_args__ = (
         UniqueConstraint('user_id', 'problem_id', name='unique_user_problem'),
+        # 내 문제 목록 (최근 선택 순) 과 문제 삭제 시 조회용 인덱스
+        Index('ix_user_problem_user_created', 'user_id', 'created_at'),
+        Index('ix_user_problem_problem_id', 'problem_id'),
     )
     
     user = relationship("User", back_populates="user_problems")
-    problem = relationship("Problem", back_populates="user_problems")
\ No newline at end of file
+    problem = relationship("Problem", back_populates="user_problems")
+
+class ProblemPopularity(Base):
+    """문제 인기도 (선택 횟수 누적, Redis 인기 순위의 원본 데이터)"""
+    __tablename__ = "ProblemPopularity"
+    
+    problem_id = Column(Integer, ForeignKey('Problem.problem_id'), primary_key=True)
+    selection_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # 인기 순위 조회용 인덱스
+    __table_args__ = (
+        Index('ix_problem_popularity_count', selection_count.desc(), 'problem_id'),
+    )
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime
 from sqlalchemy.sql import func
+from datetime import datetime
 from database import Base
 from sqlalchemy.orm import relationship
 
@@ -13,7 +14,8 @@ class User(Base):
     nickname = Column(String(255), nullable=False)
     role = Column(String(50), default="user") 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 닉네임 변경 시 게시글/댓글 응답의 검증값이 바뀌도록 사용 (utils/conditional.py)
+    updated_at = Column(DateTime(timezone=True), onupdate=datetime.now)
 
     posts = relationship("Post", back_populates="author") 
     comments = relationship("Comment", back_populates="user")
@@ -1,16 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
-from passlib.context import CryptContext
 from database import get_db
 from models.user import User
-from utils.dependencies import get_current_user, create_token
+from utils.dependencies import get_current_user, create_token, invalidate_user
+from utils.passwords import password_hasher
+from routers.blog import invalidate_user_posts
 
 router = APIRouter()
 
-# 비밀번호 해싱을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Pydantic 스키마
 class RegisterRequest(BaseModel):
     name: str
@@ -46,17 +45,15 @@ class LoginResponse(BaseModel):
     user: UserResponse
 
 
-# 1. 회원가입 API
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(request: RegisterRequest, db: Session = Depends(get_db)):
-    """
-    회원가입 API
-    - name과 email은 unique해야 함
-    - 비밀번호는 해싱 처리
-    - 기본 role은 "user"
-    """
+# 비밀번호를 다루는 API (회원가입, 로그인, 비밀번호 변경)
+# - 핸들러는 async: 해싱/검증은 전용 작업 풀(utils/passwords.py)에서 기다리므로 요청 처리용 스레드풀 자리를 차지하지 않음
+# - DB 작업은 아래 함수로 묶어서 run_in_threadpool로 실행 (이벤트 루프에서 동기 Session을 직접 쓰지 않음)
+# - 조회가 끝나면 db.close()로 연결을 반납 (해싱을 기다리는 동안 DB 연결을 잡고 있으면
+#   로그인이 몰릴 때 다른 API가 연결 풀에서 기다리게 됨, 불러온 객체의 값은 그대로 사용 가능)
+
+def check_new_user(db: Session, name: str, email: str):
     # name 중복 체크
-    existing_user = db.query(User).filter(User.name == request.name).first()
+    existing_user = db.query(User).filter(User.name == name).first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -64,12 +61,60 @@ def register(request: RegisterRequest, db: Session = Depends(get_db)):
         )
     
     # email 중복 체크
-    existing_email = db.query(User).filter(User.email == request.email).first()
+    existing_email = db.query(User).filter(User.email == email).first()
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 존재하는 이메일입니다."
         )
+
+
+def check_new_user_and_release(db: Session, name: str, email: str):
+    try:
+        check_new_user(db, name, email)
+    finally:
+        db.close()
+
+
+def save_new_user(db: Session, user: User) -> User:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def find_user_by_name(db: Session, name: str):
+    try:
+        return db.query(User).filter(User.name == name).first()
+    finally:
+        db.close()
+
+
+def load_password(db: Session, user_id: int) -> str:
+    # 캐시에서 복원한 사용자(utils/dependencies.py)에는 비밀번호 해시가 없으므로 DB에서 조회
+    try:
+        return db.query(User.password).filter(User.user_id == user_id).scalar()
+    finally:
+        db.close()
+
+
+def save_password(db: Session, user_id: int, hashed_password: str):
+    db.query(User).filter(User.user_id == user_id).update({User.password: hashed_password})
+    db.commit()
+    invalidate_user(user_id)
+
+
+# 1. 회원가입 API
+@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def register(request: RegisterRequest, db: Session = Depends(get_db)):
+    """
+    회원가입 API
+    - name과 email은 unique해야 함
+    - 비밀번호는 해싱 처리
+    - 기본 role은 "user"
+    """
+    # name, email 중복 체크
+    await run_in_threadpool(check_new_user_and_release, db, request.name, request.email)
     
     # 비밀번호 길이 검증 추가
     if len(request.password) > 50:
@@ -78,8 +123,8 @@ def register(request: RegisterRequest, db: Session = Depends(get_db)):
             detail="비밀번호는 최대 50자까지 입력 가능합니다."
         )
 
-    # 비밀번호 해싱
-    hashed_password = pwd_context.hash(request.password)
+    # 비밀번호 해싱 (전용 작업 풀에서 처리)
+    hashed_password = await password_hasher.hash(request.password)
     
     # 새 사용자 생성
     new_user = User(
@@ -90,29 +135,27 @@ def register(request: RegisterRequest, db: Session = Depends(get_db)):
         role="user"
     )
     
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    new_user = await run_in_threadpool(save_new_user, db, new_user)
     
     return new_user   # 반환된 new_user는 UserResponse 모델에 맞게 자동 변환됨
 
 
 # 2. 로그인 API
 @router.post("/login", response_model=LoginResponse)
-def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def login(request: LoginRequest, db: Session = Depends(get_db)):
     """
     로그인 API
     - name과 password로 인증
     - JWT 토큰 발급
     """
     # 사용자 조회
-    user = db.query(User).filter(User.name == request.name).first()
+    user = await run_in_threadpool(find_user_by_name, db, request.name)
 
     # 비밀번호 검증 시에도 72바이트로 제한
     password_to_verify = request.password[:72]
     
     # 사용자가 없거나 비밀번호가 틀린 경우
-    if not user or not pwd_context.verify(request.password, user.password):
+    if not user or not await password_hasher.verify(request.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 이름 또는 비밀번호입니다.",
@@ -152,16 +195,22 @@ def update_profile(
     - JWT 토큰 필요
     - nickname만 수정 가능
     """
+    nickname_changed = current_user.nickname != request.nickname
     current_user.nickname = request.nickname
     db.commit()
     db.refresh(current_user)
+    invalidate_user(current_user.user_id)
+
+    # 닉네임은 게시글 목록/상세, 댓글 목록에 들어가므로 캐시된 목록/조각도 무효화
+    if nickname_changed:
+        invalidate_user_posts(db, current_user.user_id)
     
     return current_user
 
 
 # 5. 비밀번호 변경 API
 @router.put("/password")
-def change_password(
+async def change_password(
     request: ChangePasswordRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -172,7 +221,8 @@ def change_password(
     - 현재 비밀번호 검증 후 새 비밀번호로 변경
     """
     # 현재 비밀번호 검증
-    if not pwd_context.verify(request.current_password, current_user.password):
+    current_password = await run_in_threadpool(load_password, db, current_user.user_id)
+    if not await password_hasher.verify(request.current_password, current_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다."
@@ -193,7 +243,7 @@ def change_password(
         )
 
     # 새 비밀번호 해싱 및 저장
-    current_user.password = pwd_context.hash(request.new_password)
-    db.commit()
+    hashed_password = await password_hasher.hash(request.new_password)
+    await run_in_threadpool(save_password, db, current_user.user_id, hashed_password)
     
     return {"message": "비밀번호가 성공적으로 변경되었습니다."}
\ No newline at end of file
@@ -1,18 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, BackgroundTasks, Request
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime
 from enum import Enum
 
+import json
 import os
-import shutil
+import time
 
-from database import get_db
+from database import get_db, engine, SessionLocal
 from models.post import Post, Tag, PostTag
 from models.user import User
 from models.comment import Comment
 from utils.dependencies import get_current_admin, get_current_user, get_post_check
+from utils.search import can_match, search_subquery, index_post, remove_posts
+from utils.pagination import order_posts, paginate_posts, wants_total
+from utils.view_counter import view_counter
+from utils.cache import create_cache, LRUCache
+from utils.conditional import post_validators, is_not_modified, not_modified_response
+from utils.post_counts import adjust_counts, get_count, post_keys, category_key, tag_key, TOTAL_KEY
+from utils.uploads import save_upload, recently_uploaded, upload_file_lock, MAX_IMAGE_SIZE
+from utils.image_pipeline import image_pipeline, variants_for, variant_files
+from utils.serialization import json_data, json_response
+from utils.fragments import fragment_cache, post_scope
 
 router = APIRouter()
 
@@ -41,12 +54,176 @@ class PostUpdate(BaseModel):
 class DeleteMultipleRequest(BaseModel):
     post_ids: list[int]
 
+# 응답 스키마 (utils/serialization.py의 json_response로 검증 + 직렬화)
+class AuthorResponse(BaseModel):
+    id: int
+    name: str
+    nickname: str
+
+class PostImageResponse(BaseModel):
+    src: str
+    webp: Optional[str] = None
+
+class PostResponse(BaseModel):
+    id: int
+    title: str
+    content: str
+    category: str
+    author_id: int
+    author: AuthorResponse
+    tags: list[str]
+    image_url: Optional[str] = None
+    image: Optional[PostImageResponse] = None
+    view_count: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+class PostCommentUserResponse(BaseModel):
+    nickname: str
+
+class PostCommentResponse(BaseModel):
+    id: int
+    content: str
+    user_id: int
+    user: PostCommentUserResponse
+    created_at: Optional[datetime]
+
+class PostDetailResponse(PostResponse):
+    comments: list[PostCommentResponse]
+
+class PostListResponse(BaseModel):
+    total: Optional[int]
+    page: int
+    limit: int
+    next_cursor: Optional[str]
+    keyword: Optional[str] = None
+    posts: list[PostResponse]
+
+class TagPostListResponse(PostListResponse):
+    tag: str
+
+# 게시글 응답에 필요한 작성자/태그를 한 번에 불러오는 옵션 (N+1 쿼리 방지)
+# - 작성자: 게시글 쿼리에 JOIN
+# - 태그: 조회된 게시글 ID 전체에 대해 IN 쿼리 한 번
+POST_LOAD_OPTIONS = (
+    joinedload(Post.author),
+    selectinload(Post.tags),
+)
+
+# 게시글 목록 응답 캐시 (GET /blog, GET /blog/tags/{tag_name})
+list_cache = create_cache("blog:list")
+
+def list_cache_key(**params):
+    # 쿼리 파라미터를 정렬된 JSON으로 만들어서 같은 요청은 같은 키가 되도록 함
+    return json.dumps(params, sort_keys=True, ensure_ascii=False)
+
+def post_cache_scopes(category: str, tag_names) -> list[str]:
+    # 게시글이 바뀌면 전체 목록, 해당 카테고리 목록, 해당 태그 목록만 무효화
+    scopes = ["all", f"category:{category}"]
+    scopes += [f"tag:{name}" for name in tag_names]
+    return scopes
+
+def invalidate_post_caches(scopes, post_ids=()):
+    # 목록 응답 캐시와 서버 렌더링 HTML 조각 캐시(routers/pages.py)를 같이 무효화
+    scopes = list(scopes)
+    list_cache.invalidate(scopes)
+    fragment_cache.invalidate(scopes + [post_scope(post_id) for post_id in post_ids])
+
+def post_targets_statement(condition):
+    """조건에 맞는 게시글의 (ID, 카테고리, 태그 이름) 목록 (태그가 없는 게시글은 태그 이름 None)"""
+    return (
+        select(Post.post_id, Post.category, Tag.name)
+        .outerjoin(PostTag, PostTag.post_id == Post.post_id)
+        .outerjoin(Tag, Tag.tag_id == PostTag.tag_id)
+        .where(condition)
+    )
+
+def post_targets(rows) -> tuple[set[str], set[int]]:
+    """post_targets_statement 조회 결과 → (무효화할 목록 scope, 게시글 ID)"""
+    scopes, post_ids = set(), set()
+    for post_id, category, tag_name in rows:
+        post_ids.add(post_id)
+        scopes.update(post_cache_scopes(category, [tag_name] if tag_name else []))
+    return scopes, post_ids
+
+def commented_posts_statement(user_id: int):
+    return select(Comment.post_id).where(Comment.user_id == user_id).distinct()
+
+def invalidate_user_posts(db: Session, user_id: int):
+    """
+    사용자 닉네임이 바뀌었을 때 캐시 무효화
+    - 작성한 게시글: 목록(작성자 닉네임)과 상세 조각
+    - 댓글을 단 게시글: 상세 조각 (댓글 작성자 닉네임)
+    """
+    scopes, post_ids = post_targets(db.execute(post_targets_statement(Post.user_id == user_id)))
+    post_ids.update(db.scalars(commented_posts_statement(user_id)))
+    invalidate_post_caches(scopes, post_ids)
+
+def invalidate_image_posts(image_url: str):
+    """이미지 변환 결과가 기록된 게시글의 목록/상세 캐시 무효화 (utils/image_pipeline.py에서 호출)"""
+    with engine.connect() as conn:
+        scopes, post_ids = post_targets(conn.execute(post_targets_statement(Post.image_url == image_url)))
+    invalidate_post_caches(scopes, post_ids)
+
+# 변환이 끝나면 목록 썸네일/상세 이미지 주소가 바뀌므로 캐시된 조각도 다시 만들도록
+image_pipeline.on_recorded(invalidate_image_posts)
+
 def check_post_author(post: Post, user: User):
     # 작성자 권한 확인
     if post.user_id != user.user_id:
         raise HTTPException(status_code=403, detail="게시글 수정 권한이 없습니다.")
 
-def make_post_response(post: Post):
+def post_image(post: Post, size: str):
+    # 화면에 맞는 이미지 (목록: thumbnail, 상세: medium), 변환 전이면 원본
+    if not post.image_url:
+        return None
+    variants = json.loads(post.image_variants) if post.image_variants else {}
+    return {
+        "src": variants.get(size, post.image_url),
+        "webp": variants.get(f"{size}_webp")
+    }
+
+def set_post_image(post: Post, image_url: str):
+    # 이미 변환된 이미지면 변환 URL도 같이 기록 (아직이면 변환이 끝날 때 기록됨)
+    post.image_url = image_url
+    variants = variants_for(image_url)
+    post.image_variants = json.dumps(variants) if variants else None
+
+def new_post_from(post_data: PostCreate, user: User, now: datetime) -> Post:
+    post = Post(
+        user_id=user.user_id,
+        title=post_data.title,
+        content=post_data.content,
+        category=post_data.category.value,
+        created_at=now,
+        updated_at=now
+    )
+    if post_data.image_url:
+        set_post_image(post, post_data.image_url)
+    return post
+
+def apply_post_update(post: Post, post_data: PostUpdate, now: datetime):
+    # 게시글 정보 수정
+    post.title = post_data.title
+    post.content = post_data.content
+    post.category = post_data.category.value
+
+    if post_data.image_url and post_data.image_url != post.image_url:
+        set_post_image(post, post_data.image_url)
+
+    # 수정 시간 업데이트
+    post.updated_at = now
+
+def update_count_deltas(added, removed, old_category: str, new_category: str) -> dict[str, int]:
+    # 태그/카테고리 변경에 따른 게시글 수 카운터 증감
+    deltas = {tag_key(tag_id): 1 for tag_id in added}
+    deltas.update({tag_key(tag_id): -1 for tag_id in removed})
+    if old_category != new_category:
+        deltas[category_key(old_category)] = -1
+        deltas[category_key(new_category)] = 1
+    return deltas
+
+def make_post_response(post: Post, image_size: str = "medium"):
     # 게시글 응답 딕셔너리 생성
     return {
         "id": post.post_id,
@@ -60,44 +237,225 @@ def make_post_response(post: Post):
             "nickname": post.author.nickname
         },
         "tags": [tag.name for tag in post.tags],
-        "view_count": post.view_count or 0,
+        "image_url": post.image_url,
+        "image": post_image(post, image_size),
+        "view_count": view_counter.merged(post.post_id, post.view_count),
         "created_at": post.created_at,
         "updated_at": post.updated_at
     }
 
 
-def handle_tags(db: Session, post: Post, tag_names: list[str], timestamp: str):
-    
-    # 새 태그 추가
-    for tag_name in tag_names:
-        tag_name = tag_name.strip()
-        if not tag_name:
-            continue
-        
-        # 태그가 이미 있는지 확인
-        tag = db.query(Tag).filter(Tag.name == tag_name).first()
-        
-        # 없으면 새로 만들기
-        if not tag:
-            tag = Tag(name=tag_name, created_at=timestamp)
-            db.add(tag)
-            db.flush() # 임시저장
-        
-        # 이미 연결되어 있는지 확인
-        existing = db.query(PostTag).filter(
-           PostTag.post_id == post.post_id,
-           PostTag.tag_id == tag.tag_id
-        ).first()
-
-        # 게시글-태그 연결
-        if not existing:
-            post_tag = PostTag(  
-                post_id=post.post_id,
-                tag_id=tag.tag_id,
-                created_at=timestamp
-            )
-            db.add(post_tag) 
-        
+# 게시글 상세 응답에 필요한 관계 (작성자, 태그, 댓글과 댓글 작성자)
+POST_DETAIL_OPTIONS = (
+    *POST_LOAD_OPTIONS,
+    selectinload(Post.comments).joinedload(Comment.user),
+)
+
+def make_post_detail_response(post: Post):
+    result = make_post_response(post)
+
+    # 댓글 목록 가져오기 (대댓글 제외)
+    comments = []
+    for comment in post.comments:
+        if comment.parent_comment_id is None:
+            comments.append({
+                "id": comment.comment_id,
+                "content": comment.content,
+                "user_id": comment.user_id,
+                "user": {
+                    "nickname": comment.user.nickname
+                },
+                "created_at": comment.created_at
+            })
+
+    result["comments"] = comments
+    return result
+
+
+# 태그 이름 → tag_id 캐시 (태그는 삭제되지 않으므로 오래 보관)
+tag_id_cache = LRUCache(max_entries=2048, ttl=3600)
+
+
+def resolve_tag_ids(db: Session, tag_names: list[str], timestamp) -> dict[str, int]:
+    """
+    태그 이름 목록을 tag_id로 변환 (없는 태그는 생성)
+    - 캐시에 없는 이름만 IN 쿼리 한 번으로 조회
+    - 그래도 없는 이름은 INSERT ... ON CONFLICT DO NOTHING 한 번으로 생성 후 다시 조회
+    """
+    tag_ids = {}
+    for name in tag_names:
+        tag_id = tag_id_cache.get(name)
+        if tag_id is not None:
+            tag_ids[name] = tag_id
+
+    missing = [name for name in tag_names if name not in tag_ids]
+    if missing:
+        rows = db.query(Tag.name, Tag.tag_id).filter(Tag.name.in_(missing)).all()
+        tag_ids.update(rows)
+
+        # 이미 커밋된 태그만 캐시 (이번 트랜잭션에서 만든 태그는 롤백될 수 있음)
+        for name, tag_id in rows:
+            tag_id_cache.set(name, tag_id)
+
+    missing = [name for name in tag_names if name not in tag_ids]
+    if missing:
+        db.execute(
+            sqlite_insert(Tag)
+            .values([{"name": name, "created_at": timestamp} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+        )
+        rows = db.query(Tag.name, Tag.tag_id).filter(Tag.name.in_(missing)).all()
+        tag_ids.update(rows)
+
+    return tag_ids
+
+
+def handle_tags(db: Session, post: Post, tag_names: list[str], timestamp, current_tag_ids=()):
+    """
+    게시글의 태그 연결을 tag_names와 같아지도록 변경
+    - current_tag_ids: 현재 연결되어 있는 tag_id 목록 (새 게시글이면 비어 있음)
+    - 바뀐 연결만 추가/삭제하고 (추가된 tag_id 목록, 삭제된 tag_id 목록) 반환
+    """
+    # 공백 제거, 빈 이름/중복 제거 (입력 순서 유지)
+    names = list(dict.fromkeys(name.strip() for name in tag_names if name.strip()))
+
+    tag_ids = resolve_tag_ids(db, names, timestamp) if names else {}
+    new_ids = set(tag_ids.values())
+    current_ids = set(current_tag_ids)
+
+    added = [tag_ids[name] for name in names if tag_ids[name] not in current_ids]
+    removed = sorted(current_ids - new_ids)
+
+    # 빠진 태그 연결 삭제
+    if removed:
+        db.query(PostTag).filter(
+            PostTag.post_id == post.post_id,
+            PostTag.tag_id.in_(removed)
+        ).delete(synchronize_session=False)
+
+    # 새 태그 연결 추가
+    if added:
+        db.execute(
+            sqlite_insert(PostTag)
+            .values([
+                {"post_id": post.post_id, "tag_id": tag_id, "created_at": timestamp}
+                for tag_id in added
+            ])
+            .on_conflict_do_nothing(index_elements=[PostTag.post_id, PostTag.tag_id])
+        )
+
+    return added, removed
+
+
+# 한 번에 IN 절에 넣을 게시글 ID 개수 (SQLite 바인딩 변수 제한 대비)
+DELETE_CHUNK_SIZE = 500
+
+# 이 개수 이상 삭제하면 단계별 소요 시간을 로그로 출력
+DELETE_TIMING_THRESHOLD = 100
+
+
+def bulk_delete_posts(db: Session, post_ids: list[int]) -> dict:
+    """
+    게시글 여러 개를 DELETE ... WHERE post_id IN (...) 몇 번으로 삭제
+    - ORM cascade처럼 댓글/태그 연결을 메모리에 불러오지 않음
+    - 댓글 → 태그 연결 → 검색 인덱스 → 게시글 순서로 같은 트랜잭션에서 삭제 (커밋은 호출한 쪽에서)
+    - 삭제된 게시글 ID, 캐시 scope, 이미지 URL 목록을 반환
+    """
+    timings = {}
+    started = time.perf_counter()
+
+    post_ids = list(dict.fromkeys(post_ids))
+    posts, links = [], []
+    for i in range(0, len(post_ids), DELETE_CHUNK_SIZE):
+        chunk = post_ids[i:i + DELETE_CHUNK_SIZE]
+        posts += db.query(Post.post_id, Post.category, Post.image_url).filter(Post.post_id.in_(chunk)).all()
+        links += db.query(PostTag.post_id, PostTag.tag_id, Tag.name).join(Tag).filter(PostTag.post_id.in_(chunk)).all()
+    timings["load"] = time.perf_counter() - started
+
+    deleted_ids = [post.post_id for post in posts]
+
+    # 카운터 감소량, 무효화할 캐시 scope 계산
+    tags_by_post = {}
+    for post_id, tag_id, name in links:
+        tags_by_post.setdefault(post_id, []).append((tag_id, name))
+
+    deltas, scopes = {}, set()
+    for post in posts:
+        tags = tags_by_post.get(post.post_id, [])
+        for key in post_keys(post.category, [tag_id for tag_id, _ in tags]):
+            deltas[key] = deltas.get(key, 0) - 1
+        scopes.update(post_cache_scopes(post.category, [name for _, name in tags]))
+
+    step = time.perf_counter()
+    for i in range(0, len(deleted_ids), DELETE_CHUNK_SIZE):
+        chunk = deleted_ids[i:i + DELETE_CHUNK_SIZE]
+        db.query(Comment).filter(Comment.post_id.in_(chunk)).delete(synchronize_session=False)
+        db.query(PostTag).filter(PostTag.post_id.in_(chunk)).delete(synchronize_session=False)
+        remove_posts(db, chunk)
+        db.query(Post).filter(Post.post_id.in_(chunk)).delete(synchronize_session=False)
+    timings["delete"] = time.perf_counter() - step
+
+    adjust_counts(db, deltas)
+    timings["total"] = time.perf_counter() - started
+
+    if len(deleted_ids) >= DELETE_TIMING_THRESHOLD:
+        print(
+            f"게시글 {len(deleted_ids)}개 일괄 삭제: "
+            + ", ".join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in timings.items())
+        )
+
+    return {
+        "deleted_ids": deleted_ids,
+        "scopes": scopes,
+        "image_urls": [post.image_url for post in posts if post.image_url]
+    }
+
+
+def unused_image_urls(db: Session, image_urls: list[str]) -> list[str]:
+    """다른 게시글이 아직 사용 중인 이미지는 제외"""
+    if not image_urls:
+        return []
+    in_use = {url for (url,) in db.query(Post.image_url).filter(Post.image_url.in_(image_urls))}
+    return [url for url in set(image_urls) if url not in in_use]
+
+
+def delete_posts(db: Session, post_ids: list[int]) -> tuple[dict, list[str]]:
+    """게시글 일괄 삭제 + 더 이상 쓰이지 않는 이미지 URL (커밋은 호출한 쪽에서)"""
+    result = bulk_delete_posts(db, post_ids)
+    return result, unused_image_urls(db, result["image_urls"])
+
+
+def remove_post_images(image_urls: list[str]):
+    """
+    삭제된 게시글의 업로드 이미지 파일 정리 (응답 후 백그라운드에서 실행)
+    - 같은 내용의 이미지는 파일 하나를 같이 쓰므로 (utils/uploads.py) 지우기 직전에 다시 확인:
+      그사이 다른 게시글이 사용하기 시작했거나 최근에 다시 업로드된 파일은 남김
+    - 확인과 삭제는 업로드 저장과 같은 락 안에서 실행
+    """
+    upload_root = os.path.abspath(UPLOAD_DIR)
+
+    db = SessionLocal()
+    try:
+        for image_url in image_urls:
+            # 원본과 변환 이미지 (썸네일 등) 모두 삭제
+            paths = [os.path.abspath(path) for path in [image_url.lstrip("/")] + variant_files(image_url)]
+
+            with upload_file_lock:
+                if not unused_image_urls(db, [image_url]) or recently_uploaded(paths[0]):
+                    continue
+
+                for file_path in paths:
+                    # uploads/posts 아래 파일만 삭제
+                    if os.path.dirname(file_path) != upload_root:
+                        continue
+                    try:
+                        os.remove(file_path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        print(f"이미지 삭제 실패: {file_path} ({e})")
+    finally:
+        db.close()
 
 
 # ===== 이미지 업로드 API (게시글 작성 전 사용) =====
@@ -110,6 +468,8 @@ async def upload_image(
     이미지 업로드 API
     - 게시글 작성 전에 이미지를 먼저 업로드
     - 업로드된 이미지 URL을 반환
+    - 최대 MAX_IMAGE_SIZE, 같은 이미지는 한 번만 저장 (utils/uploads.py)
+    - 썸네일/중간 크기/WebP 변환은 응답 후 프로세스 풀에서 처리 (utils/image_pipeline.py)
     """
     # 파일 확장자 검증
     allowed_extensions = ['.jpg', '.jpeg', '.png']
@@ -121,18 +481,17 @@ async def upload_image(
             detail=f"지원하지 않는 이미지 형식입니다. 업로드 가능한 형식: {', '.join(allowed_extensions)}"
         )
     
-    # 파일 저장
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_name = f"{timestamp}_{image.filename}"
-    file_path = os.path.join(UPLOAD_DIR, file_name)
+    # 파일 저장 (내용 해시를 파일 이름으로 사용)
+    file_path = await save_upload(image, UPLOAD_DIR, file_extension, MAX_IMAGE_SIZE)
+    image_url = f"/{file_path}"
     
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(image.file, buffer)
+    # 변환 이미지 생성 (기다리지 않음)
+    image_pipeline.submit(image_url)
     
-    return {"image_url": f"/{file_path}"}
+    return {"image_url": image_url}
 
 # ===== 1. 게시글 작성 (관리자만) =====
-@router.post("", status_code=201)
+@router.post("", status_code=201, response_model=PostResponse)
 def create_post(
     post_data: PostCreate,
     db: Session = Depends(get_db),
@@ -143,161 +502,262 @@ def create_post(
     now = datetime.now()
     
     # 게시글 생성
-    new_post = Post(
-        user_id=current_user.user_id,
-        title=post_data.title,
-        content=post_data.content,
-        category=post_data.category.value,
-        created_at=now,
-        updated_at=now
-    )
-    
-    if post_data.image_url and hasattr(new_post, 'image_url'):
-        new_post.image_url = post_data.image_url
-
+    new_post = new_post_from(post_data, current_user, now)
     db.add(new_post)
+    db.flush()
+
+    # 태그 연결, 검색 인덱스 등록, 게시글 수 증가 (게시글과 같은 트랜잭션에서 한 번에 커밋)
+    tag_ids, _ = handle_tags(db, new_post, post_data.tags, now)
+    index_post(db, new_post)
+    adjust_counts(db, {key: 1 for key in post_keys(new_post.category, tag_ids)})
+
     db.commit()
     db.refresh(new_post)
     
-    # 태그 처리
-    if post_data.tags:
-        handle_tags(db, new_post, post_data.tags, now)
-        db.commit()
-        db.refresh(new_post)
+    # 목록 캐시 무효화
+    invalidate_post_caches(post_cache_scopes(new_post.category, [tag.name for tag in new_post.tags]))
     
     # 응답 반환
-    return make_post_response(new_post)
+    return json_response(PostResponse, make_post_response(new_post), status_code=201)
 
 
 # ===== 2. 게시글 목록, 검색 =====
-@router.get("")
-def get_posts(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1, le=100),
-    category: Optional[CategoryEnum] = None,
-    sort: str = Query("desc"),
-    search: Optional[str] = None,
-    db: Session = Depends(get_db)
+def post_list_params(
+    page: int,
+    limit: int,
+    category: Optional[CategoryEnum],
+    sort: str,
+    search: Optional[str],
+    cursor: Optional[str],
+    include_total: Optional[bool]
 ):
-  
-    # 기본 쿼리
-    query = db.query(Post)
-    
+    """목록 요청 값 정리 → (검색어, 정렬, 전체 개수 포함 여부, 캐시 scope, 캐시 키)"""
+    # 전체 개수 포함 여부 (지정하지 않으면 커서 방식일 때 COUNT 생략)
+    include_total = wants_total(include_total, cursor)
+
+    # 검색어 앞뒤 공백 제거
+    search = search.strip() if search else None
+    if sort not in ("asc", "relevance"):
+        sort = "desc"
+
+    cache_key = list_cache_key(
+        page=page, limit=limit, category=category.value if category else None,
+        sort=sort, search=search, cursor=cursor, include_total=include_total
+    )
+    cache_scope = f"category:{category.value}" if category else "all"
+    return search, sort, include_total, cache_scope, f"{cache_scope}:{cache_key}"
+
+
+def filter_post_list(query, category: Optional[CategoryEnum], sort: str, search: Optional[str]):
+    """
+    검색/카테고리 필터와 정렬 적용 (db.query(Post), select(Post) 모두 사용 가능)
+    - (쿼리, 정렬, 커서 사용 가능 여부) 반환
+    """
+    matches = None
+
     # 검색어가 있으면 필터링
     if search:
-        # 제목이나 내용에서 검색
-        query = query.filter(
-            (Post.title.contains(search)) | (Post.content.contains(search))
-        )
-    
+        if can_match(search):
+            # 전문 검색 인덱스에서 일치하는 게시글만 조인
+            matches = search_subquery(search)
+            query = query.join(matches, matches.c.post_id == Post.post_id)
+        else:
+            # 짧은 검색어는 제목이나 내용에서 직접 검색
+            query = query.filter(
+                (Post.title.contains(search)) | (Post.content.contains(search))
+            )
+
     # 카테고리 필터
     if category:
         query = query.filter(Post.category == category.value)
-    
-    # 정렬 (최신순/오래된순)
-    if sort == "desc":
-        query = query.order_by(Post.created_at.desc())
-    else:
-        query = query.order_by(Post.created_at.asc())
-    
-    # 전체 개수
-    total = query.count()
-    
-    # 페이지네이션
-    offset = (page - 1) * limit
-    posts = query.offset(offset).limit(limit).all()
-    
-    # 응답 생성
-    result = {
-        "total": total,
-        "page": page,
-        "limit": limit,
-        "posts": [make_post_response(post) for post in posts]
-    }
-    
+
+    # 정렬 (관련도순/최신순/오래된순)
+    if sort == "relevance" and matches is not None:
+        # 관련도순은 커서 페이지네이션을 지원하지 않음
+        query = query.order_by(matches.c.rank, Post.created_at.desc(), Post.post_id.desc())
+        return query, sort, False
+
+    sort = "asc" if sort == "asc" else "desc"
+    return order_posts(query, sort), sort, True
+
+
+def post_list_count_key(category: Optional[CategoryEnum]) -> str:
+    # 검색이 아니면 전체 개수는 카운터에서 바로 조회
+    return category_key(category.value) if category else TOTAL_KEY
+
+
+def finish_post_list(result: dict, search: Optional[str], cache_scope: str, cache_key: str) -> dict:
+    """페이지 결과를 응답 딕셔너리로 만들고 목록 캐시에 저장"""
+    result["posts"] = [make_post_response(post, "thumbnail") for post in result["posts"]]
+
     # 검색어가 있으면 추가
     if search:
         result["keyword"] = search
-    
+
+    # 상세 조회와 같은 TypeAdapter로 변환 (jsonable_encoder보다 빠름, benchmarks/serializer.py)
+    result = json_data(PostListResponse, result)
+    list_cache.set(cache_key, result, [cache_scope])
     return result
 
 
-# ===== 3. 태그별 게시글 조회 =====
-@router.get("/tags/{tag_name}")
-def get_posts_by_tag(
-    tag_name: str,
+def load_post_list(
+    db: Session,
+    page: int = 1,
+    limit: int = 10,
+    category: Optional[CategoryEnum] = None,
+    sort: str = "desc",
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None
+) -> dict:
+    """게시글 목록 응답 딕셔너리 (목록 캐시 사용, API와 서버 렌더링 페이지에서 공통 사용)"""
+    search, sort, include_total, cache_scope, cache_key = post_list_params(
+        page, limit, category, sort, search, cursor, include_total
+    )
+
+    # 캐시 확인
+    cached = list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    query, sort, keyset = filter_post_list(db.query(Post).options(*POST_LOAD_OPTIONS), category, sort, search)
+
+    # 페이지네이션 (커서가 있으면 커서 방식, 없으면 페이지 번호 방식)
+    total = None
+    if include_total and not search:
+        total = get_count(db, post_list_count_key(category))
+
+    result = paginate_posts(query, page, limit, cursor, sort, include_total, keyset, total)
+    return finish_post_list(result, search, cache_scope, cache_key)
+
+
+@router.get("", response_model=PostListResponse)
+def get_posts(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    category: Optional[CategoryEnum] = None,
     sort: str = Query("desc"),
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = Query(None),
     db: Session = Depends(get_db)
 ):
+    result = load_post_list(db, page, limit, category, sort, search, cursor, include_total)
+    return json_response(PostListResponse, result)
 
-    # 태그 찾기
-    tag = db.query(Tag).filter(Tag.name == tag_name).first()
-    
+
+# ===== 3. 태그별 게시글 조회 =====
+def tag_list_params(
+    tag_name: str,
+    page: int,
+    limit: int,
+    sort: str,
+    cursor: Optional[str],
+    include_total: Optional[bool]
+):
+    """태그별 목록 요청 값 정리 → (정렬, 전체 개수 포함 여부, 캐시 scope, 캐시 키)"""
+    include_total = wants_total(include_total, cursor)
+    sort = "asc" if sort == "asc" else "desc"
+
+    cache_scope = f"tag:{tag_name}"
+    cache_key = cache_scope + ":" + list_cache_key(
+        page=page, limit=limit, sort=sort, cursor=cursor, include_total=include_total
+    )
+    return sort, include_total, cache_scope, cache_key
+
+
+def check_tag(tag: Optional[Tag]) -> Tag:
     if not tag:
         raise HTTPException(status_code=404, detail="태그를 찾을 수 없습니다.")
-    
-    # 태그에 연결된 게시글 찾기
-    query = db.query(Post).join(PostTag).filter(PostTag.tag_id == tag.tag_id)
-    
-    # 정렬 (데이터베이스 정렬)
-    if sort == "desc":
-        query = query.order_by(Post.created_at.desc())
-    else:
-        query = query.order_by(Post.created_at.asc())
-    
-    # 전체 개수
-    total = query.count()
-    
-    # 페이지네이션
-    offset = (page - 1) * limit
-    posts = query.offset(offset).limit(limit).all()
-    
-    # 응답 생성
-    return {
+    return tag
+
+
+def filter_tag_posts(query, tag: Tag, sort: str):
+    # 태그에 연결된 게시글 찾기 + 정렬 (데이터베이스 정렬)
+    return order_posts(query.join(PostTag).filter(PostTag.tag_id == tag.tag_id), sort)
+
+
+def finish_tag_post_list(tag_name: str, result: dict, cache_scope: str, cache_key: str) -> dict:
+    response = json_data(TagPostListResponse, {
         "tag": tag_name,
-        "total": total,
-        "page": page,
-        "limit": limit,
-        "posts": [make_post_response(post) for post in posts]
-    }
+        **result,
+        "posts": [make_post_response(post, "thumbnail") for post in result["posts"]]
+    })
+    list_cache.set(cache_key, response, [cache_scope])
+    return response
+
+
+def load_tag_post_list(
+    db: Session,
+    tag_name: str,
+    page: int = 1,
+    limit: int = 10,
+    sort: str = "desc",
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None
+) -> dict:
+    """태그별 게시글 목록 응답 딕셔너리 (태그가 없으면 404)"""
+    sort, include_total, cache_scope, cache_key = tag_list_params(
+        tag_name, page, limit, sort, cursor, include_total
+    )
+
+    # 캐시 확인
+    cached = list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # 태그 찾기
+    tag = check_tag(db.query(Tag).filter(Tag.name == tag_name).first())
+
+    query = filter_tag_posts(db.query(Post).options(*POST_LOAD_OPTIONS), tag, sort)
+
+    # 페이지네이션
+    total = get_count(db, tag_key(tag.tag_id)) if include_total else None
+    result = paginate_posts(query, page, limit, cursor, sort, include_total, total=total)
+    return finish_tag_post_list(tag_name, result, cache_scope, cache_key)
+
+
+@router.get("/tags/{tag_name}", response_model=TagPostListResponse)
+def get_posts_by_tag(
+    tag_name: str,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    sort: str = Query("desc"),
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = Query(None),
+    db: Session = Depends(get_db)
+):
+    result = load_tag_post_list(db, tag_name, page, limit, sort, cursor, include_total)
+    return json_response(TagPostListResponse, result)
 
 
 # ===== 4. 게시글 상세 조회 =====
-@router.get("/{post_id}")
-def get_post(post_id: int, db: Session = Depends(get_db)):
+@router.get("/{post_id}", response_model=PostDetailResponse)
+def get_post(post_id: int, request: Request, db: Session = Depends(get_db)):
  
-    post = get_post_check(db, post_id)
+    # 검증값(ETag/Last-Modified) 조회
+    validators = post_validators(db, post_id, "post")
+    if validators is None:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-    # 조회수 증가
-    post.view_count = (post.view_count or 0) + 1
-    db.commit()
-    
-    response = make_post_response(post)
-    
-    # 댓글 목록 가져오기 (대댓글 제외)
-    comments = []
-    for comment in post.comments:
-        if comment.parent_comment_id is None:
-            comments.append({
-                "id": comment.comment_id,
-                "content": comment.content,
-                "user_id": comment.user_id,
-                "user": {
-                    "nickname": comment.user.nickname
-                },
-                "created_at": comment.created_at
-            })
-    
-    response["comments"] = comments
-    
-    return response
+    # 조회수 증가 (DB에는 주기적으로 모아서 반영, 304 응답이어도 증가)
+    view_counter.increment(post_id)
+
+    # 변경이 없으면 본문 없이 304 응답
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+
+    # 작성자, 태그, 댓글과 댓글 작성자까지 한 번에 조회
+    post = db.query(Post).options(*POST_DETAIL_OPTIONS).filter(Post.post_id == post_id).first()
+    if not post:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    return json_response(PostDetailResponse, make_post_detail_response(post), headers=validators.headers())
 
 
 # ===== 5. 게시글 수정 =====
 
-@router.put("/{post_id}")
+@router.put("/{post_id}", response_model=PostResponse)
 def update_post(
     post_id: int,
     post_data: PostUpdate,
@@ -309,31 +769,33 @@ def update_post(
     
     check_post_author(post, current_user)
     
-    # 게시글 정보 수정
-    post.title = post_data.title
-    post.content = post_data.content
-    post.category = post_data.category
+    # 수정 전 카테고리/태그 (목록 캐시 무효화, 게시글 수 카운터용)
+    old_scopes = post_cache_scopes(post.category, [tag.name for tag in post.tags])
+    old_category = post.category
+    old_tag_ids = [tag.tag_id for tag in post.tags]
     
-    if post_data.image_url and hasattr(post, 'image_url'):
-        post.image_url = post_data.image_url
-
-        
-    # 수정 시간 업데이트
+    # 게시글 정보 수정
     now = datetime.now()
-    post.updated_at = now
+    apply_post_update(post, post_data, now)
+    
+    # 태그 연결 변경 (바뀐 태그만 추가/삭제)
+    added, removed = handle_tags(db, post, post_data.tags, now, old_tag_ids)
     
-    # 항상 기존 태그 연결 삭제
-    db.query(PostTag).filter(PostTag.post_id == post.post_id).delete()
+    # 게시글 수 카운터 갱신
+    adjust_counts(db, update_count_deltas(added, removed, old_category, post_data.category.value))
     
-    # 새로운 태그 추가 
-    if post_data.tags:
-        handle_tags(db, post, post_data.tags, now)
+    # 검색 인덱스 갱신
+    index_post(db, post)
     
     db.commit()
     db.refresh(post)
     
+    # 목록 캐시 무효화 (수정 전/후 카테고리와 태그)
+    new_scopes = post_cache_scopes(post_data.category.value, [tag.name for tag in post.tags])
+    invalidate_post_caches(set(old_scopes + new_scopes), [post_id])
+    
     # 응답 반환
-    return make_post_response(post)
+    return json_response(PostResponse, make_post_response(post))
 
 
 # ===== 6. 게시글 삭제 =====
@@ -341,6 +803,7 @@ def update_post(
 @router.delete("/delete-multiple")
 def delete_multiple_posts(
     request: DeleteMultipleRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -349,20 +812,24 @@ def delete_multiple_posts(
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="관리자만 게시글을 삭제할 수 있습니다.")
 
-    deleted_count = 0
-
-    for post_id in request.post_ids:
-        post = db.query(Post).filter(Post.post_id == post_id).first()
-        if post:
-            db.delete(post)
-            deleted_count += 1
+    # 일괄 삭제
+    result, image_urls = delete_posts(db, request.post_ids)
+    deleted_count = len(result["deleted_ids"])
 
     db.commit()
+    view_counter.discard(result["deleted_ids"])
+    invalidate_post_caches(result["scopes"], result["deleted_ids"])
+
+    # 이미지 파일은 응답 후 백그라운드에서 삭제
+    if image_urls:
+        background_tasks.add_task(remove_post_images, image_urls)
+
     return {"message": f"{deleted_count}개의 게시글이 삭제되었습니다."}
 
 @router.delete("/{post_id}")
 def delete_post(
     post_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -372,8 +839,13 @@ def delete_post(
     check_post_author(post, current_user)
     
     # 삭제 
-    db.delete(post)
+    result, image_urls = delete_posts(db, [post_id])
     db.commit()
+    view_counter.discard([post_id])
+    invalidate_post_caches(result["scopes"], [post_id])
+    
+    if image_urls:
+        background_tasks.add_task(remove_post_images, image_urls)
     
     return {"message": "게시물이 삭제되었습니다."}
 
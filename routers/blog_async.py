@@ -0,0 +1,143 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from database import get_async_db
+from models.post import Post, Tag
+from utils.pagination import paginate_posts_async
+from utils.view_counter import view_counter
+from utils.conditional import post_validators_async, is_not_modified, not_modified_response
+from utils.post_counts import get_count_async, tag_key
+from utils.serialization import json_response
+from utils.cache import run_cache_io
+from routers.blog import (
+    CategoryEnum, PostDetailResponse, PostListResponse, TagPostListResponse,
+    POST_LOAD_OPTIONS, POST_DETAIL_OPTIONS, list_cache, make_post_detail_response,
+    post_list_params, filter_post_list, post_list_count_key, finish_post_list,
+    tag_list_params, check_tag, filter_tag_posts, finish_tag_post_list
+)
+
+# 게시글 조회 API의 비동기 DB 버전 (DB_MODE=async 일 때 routers/blog.py의 같은 경로를 대신함)
+# - 목록/태그 목록/상세 조회만 비동기 버전이 있음 (요청이 가장 많은 조회 API)
+#   작성/수정/삭제는 두 모드 모두 routers/blog.py의 핸들러 사용 (main.py의 with_async_reads)
+# - 핸들러는 async def, DB는 AsyncSession(aiosqlite)으로 조회 → 스레드풀을 거치지 않음
+# - 요청 값 정리, 필터/정렬, 응답 생성, 캐시는 routers/blog.py의 함수를 그대로 사용
+#   (목록 캐시 조회/저장은 run_cache_io로 호출: Redis 캐시면 스레드풀에서 실행)
+# - 비동기 세션은 지연 로딩을 할 수 없으므로 응답에 필요한 관계는 모두 옵션으로 함께 조회
+
+router = APIRouter()
+
+
+async def load_post_async(db: AsyncSession, post_id: int, options=POST_LOAD_OPTIONS) -> Optional[Post]:
+    """게시글과 응답에 필요한 관계를 다시 조회 (세션에 있는 객체도 DB 값으로 갱신)"""
+    return await db.scalar(
+        select(Post).options(*options).where(Post.post_id == post_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+# ===== 2. 게시글 목록, 검색 =====
+async def load_post_list_async(
+    db: AsyncSession,
+    page: int = 1,
+    limit: int = 10,
+    category: Optional[CategoryEnum] = None,
+    sort: str = "desc",
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None
+) -> dict:
+    """load_post_list의 비동기 세션 버전 (같은 목록 캐시 사용)"""
+    search, sort, include_total, cache_scope, cache_key = post_list_params(
+        page, limit, category, sort, search, cursor, include_total
+    )
+
+    cached = await run_cache_io(list_cache, list_cache.get, cache_key)
+    if cached is not None:
+        return cached
+
+    stmt, sort, keyset = filter_post_list(select(Post).options(*POST_LOAD_OPTIONS), category, sort, search)
+
+    total = None
+    if include_total and not search:
+        total = await get_count_async(db, post_list_count_key(category))
+
+    result = await paginate_posts_async(db, stmt, page, limit, cursor, sort, include_total, keyset, total)
+    return await run_cache_io(list_cache, finish_post_list, result, search, cache_scope, cache_key)
+
+
+@router.get("", response_model=PostListResponse)
+async def get_posts(
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    category: Optional[CategoryEnum] = None,
+    sort: str = Query("desc"),
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    result = await load_post_list_async(db, page, limit, category, sort, search, cursor, include_total)
+    return json_response(PostListResponse, result)
+
+
+# ===== 3. 태그별 게시글 조회 =====
+async def load_tag_post_list_async(
+    db: AsyncSession,
+    tag_name: str,
+    page: int = 1,
+    limit: int = 10,
+    sort: str = "desc",
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None
+) -> dict:
+    """load_tag_post_list의 비동기 세션 버전 (태그가 없으면 404)"""
+    sort, include_total, cache_scope, cache_key = tag_list_params(
+        tag_name, page, limit, sort, cursor, include_total
+    )
+
+    cached = await run_cache_io(list_cache, list_cache.get, cache_key)
+    if cached is not None:
+        return cached
+
+    tag = check_tag(await db.scalar(select(Tag).where(Tag.name == tag_name)))
+    stmt = filter_tag_posts(select(Post).options(*POST_LOAD_OPTIONS), tag, sort)
+
+    total = await get_count_async(db, tag_key(tag.tag_id)) if include_total else None
+    result = await paginate_posts_async(db, stmt, page, limit, cursor, sort, include_total, total=total)
+    return await run_cache_io(list_cache, finish_tag_post_list, tag_name, result, cache_scope, cache_key)
+
+
+@router.get("/tags/{tag_name}", response_model=TagPostListResponse)
+async def get_posts_by_tag(
+    tag_name: str,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    sort: str = Query("desc"),
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    result = await load_tag_post_list_async(db, tag_name, page, limit, sort, cursor, include_total)
+    return json_response(TagPostListResponse, result)
+
+
+# ===== 4. 게시글 상세 조회 =====
+@router.get("/{post_id}", response_model=PostDetailResponse)
+async def get_post(post_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    validators = await post_validators_async(db, post_id, "post")
+    if validators is None:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    # 조회수 증가 (304 응답이어도 증가)
+    view_counter.increment(post_id)
+
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+
+    post = await load_post_async(db, post_id, POST_DETAIL_OPTIONS)
+    if not post:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    return json_response(PostDetailResponse, make_post_detail_response(post), headers=validators.headers())
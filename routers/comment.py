@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from sqlalchemy import select, or_, func
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
 from pydantic import BaseModel
+from typing import Optional
 
 from database import get_db
 from models.comment import Comment
 from models.post import Post
 from models.user import User
 from utils.dependencies import get_current_user, get_post_check
+from utils.pagination import encode_cursor, decode_cursor
+from utils.conditional import post_validators, is_not_modified, not_modified_response
+from utils.serialization import json_response
+from utils.fragments import fragment_cache, post_scope
 
 router = APIRouter()
 
@@ -21,23 +27,66 @@ class CommentUpdate(BaseModel):
     content: str
 
 
+# 응답 스키마 (utils/serialization.py의 json_response로 검증 + 직렬화)
+class CommentUserResponse(BaseModel):
+    id: int
+    name: str
+    nickname: str
+
+
+class CommentResponse(BaseModel):
+    id: int
+    content: str
+    post_id: int
+    user_id: int
+    user: CommentUserResponse
+    parent_id: Optional[int]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+class CommentTreeResponse(CommentResponse):
+    reply_count: int
+    replies: list[CommentResponse]
+
+
+class CommentListResponse(BaseModel):
+    post_id: int
+    total: int
+    next_cursor: Optional[str]
+    comments: list[CommentTreeResponse]
+
+
 # 댓글 존재 확인
-def get_comment_check(db: Session, post_id: int, comment_id: int):
-    comment = db.query(Comment).filter(
-        Comment.comment_id == comment_id,
-        Comment.post_id == post_id
-    ).first()
+def comment_statement(post_id: int, comment_id: int):
+    return select(Comment).where(Comment.comment_id == comment_id, Comment.post_id == post_id)
+
+
+def check_comment_found(comment: Optional[Comment]):
     if not comment:
         raise HTTPException(status_code=404, detail="댓글을 찾을 수 없습니다.")
     return comment
 
 
+def get_comment_check(db: Session, post_id: int, comment_id: int):
+    return check_comment_found(db.scalar(comment_statement(post_id, comment_id)))
+
+
 # 작성자 권한 확인
 def check_comment_author(comment: Comment, user: User):
     if comment.user_id != user.user_id:
         raise HTTPException(status_code=403, detail="댓글 수정/삭제 권한이 없습니다.")
 
 
+# 대댓글의 대댓글 방지 (1단계 제한)
+def check_reply_target(parent_comment: Comment):
+    if parent_comment.parent_comment_id is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="대댓글에는 답글을 달 수 없습니다. 답글은 한 단계까지만 허용됩니다."
+        )
+
+
 # 댓글 응답 딕셔너리 생성
 def make_comment_response(comment: Comment):
     return {
@@ -57,7 +106,7 @@ def make_comment_response(comment: Comment):
 
 
 # 1. 댓글 작성
-@router.post("/{post_id}/comments", status_code=201)
+@router.post("/{post_id}/comments", status_code=201, response_model=CommentResponse)
 def create_comment(
     post_id: int,
     comment_data: CommentCreate,
@@ -79,49 +128,200 @@ def create_comment(
     db.commit()
     db.refresh(new_comment)
     
-    return make_comment_response(new_comment)
+    # 서버 렌더링 페이지의 게시글 HTML 조각 무효화 (routers/pages.py)
+    fragment_cache.invalidate([post_scope(post_id)])
+    
+    return json_response(CommentResponse, make_comment_response(new_comment), status_code=201)
 
 
-# 2. 댓글 목록 조회 (계층형 구조)
-@router.get("/{post_id}/comments")
-def get_comments(post_id: int, db: Session = Depends(get_db)):
-    """특정 게시글의 모든 댓글을 계층형 구조로 조회"""
-    
-    get_post_check(db, post_id)
-    
-    # 일반 댓글만 조회
-    parent_comments = db.query(Comment).filter(
+def filter_comment_page(query, post_id: int, limit: Optional[int], cursor: Optional[str]):
+    """
+    이번 페이지의 최상위 댓글과 그 대댓글만 남기는 조건 (db.query, select() 모두 사용 가능)
+    - limit/cursor가 없으면 전체 조회
+    """
+    if limit is None and cursor is None:
+        return query
+
+    # 이번 페이지의 최상위 댓글 ID (최신 댓글이 제일 위로, ID 순서 = 작성 순서)
+    page_ids = select(Comment.comment_id).where(
         Comment.post_id == post_id,
         Comment.parent_comment_id == None
-    ).order_by(Comment.created_at.desc()).all()  # 최신 댓글이 제일 위로
+    )
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        page_ids = page_ids.where(Comment.comment_id < last_id)
+    page_ids = page_ids.order_by(Comment.comment_id.desc())
+    if limit:
+        # 한 개 더 가져와서 다음 페이지가 있는지 확인
+        page_ids = page_ids.limit(limit + 1)
+
+    # 최상위 댓글과 그 대댓글만 조회
+    return query.filter(or_(
+        Comment.comment_id.in_(page_ids),
+        Comment.parent_comment_id.in_(page_ids)
+    ))
+
+
+def limit_replies(stmt, post_id: int, replies_limit: Optional[int]):
+    """
+    대댓글을 부모 댓글마다 replies_limit개까지만 남기는 조건 (SQL에서 자름)
+    - ROW_NUMBER() OVER (PARTITION BY parent_comment_id ORDER BY created_at, comment_id)
+    """
+    if replies_limit is None:
+        return stmt
+
+    reply_rank = func.row_number().over(
+        partition_by=Comment.parent_comment_id,
+        order_by=(Comment.created_at.asc(), Comment.comment_id.asc())
+    )
+    ranked = (
+        select(Comment.comment_id, reply_rank.label("reply_rank"))
+        .where(Comment.post_id == post_id, Comment.parent_comment_id != None)
+        .subquery()
+    )
+    shown_reply_ids = select(ranked.c.comment_id).where(ranked.c.reply_rank <= replies_limit)
+
+    return stmt.where(or_(
+        Comment.parent_comment_id == None,
+        Comment.comment_id.in_(shown_reply_ids)
+    ))
+
+
+def comment_rows_statement(
+    post_id: int,
+    limit: Optional[int],
+    cursor: Optional[str],
+    replies_limit: Optional[int] = None
+):
+    """게시글의 댓글 + 작성자 조회 (쿼리 한 번, 대댓글은 replies_limit개까지)"""
+    stmt = select(Comment).options(joinedload(Comment.user)).where(Comment.post_id == post_id)
+    stmt = filter_comment_page(stmt, post_id, limit, cursor)
+    stmt = limit_replies(stmt, post_id, replies_limit)
+    return stmt.order_by(Comment.created_at.asc(), Comment.comment_id.asc())
+
+
+def comment_total_statement(post_id: int):
+    return select(func.count(Comment.comment_id)).where(Comment.post_id == post_id)
+
+
+def needs_comment_total(limit: Optional[int], cursor: Optional[str], replies_limit: Optional[int]) -> bool:
+    """불러온 댓글 수가 전체 개수와 다를 수 있으면 (페이지/대댓글 개수 제한) 따로 COUNT"""
+    return limit is not None or cursor is not None or replies_limit is not None
+
+
+def reply_counts_statement(rows: list):
+    """
+    불러온 최상위 댓글마다 전체 대댓글 수 (GROUP BY, 쿼리 한 번)
+    - 대댓글을 replies_limit개까지만 불러왔을 때 reply_count 계산용
+    """
+    parent_ids = [comment.comment_id for comment in rows if comment.parent_comment_id is None]
+    return (
+        select(Comment.parent_comment_id, func.count(Comment.comment_id))
+        .where(Comment.parent_comment_id.in_(parent_ids))
+        .group_by(Comment.parent_comment_id)
+    )
+
+
+def build_comment_tree(
+    post_id: int,
+    rows: list,
+    total: Optional[int],
+    limit: Optional[int],
+    reply_counts: Optional[dict] = None
+) -> dict:
+    """
+    불러온 댓글로 메모리에서 트리 구성 (total이 None이면 불러온 댓글 수)
+    - reply_counts: 부모 댓글 ID → 전체 대댓글 수 (없으면 불러온 대댓글 수)
+    """
+    parents = []
+    replies = {}
+    for comment in rows:
+        if comment.parent_comment_id is None:
+            parents.append(comment)
+        else:
+            replies.setdefault(comment.parent_comment_id, []).append(comment)
+    parents.sort(key=lambda comment: comment.comment_id, reverse=True)
     
-    result = []
+    next_cursor = None
+    if limit and len(parents) > limit:
+        parents = parents[:limit]
+        next_cursor = encode_cursor(parents[-1].comment_id)
     
-    for comment in parent_comments:
-        # 대댓글 조회
-        replies = db.query(Comment).filter(
-            Comment.parent_comment_id == comment.comment_id # 현재 댓글의 ID를 보고 그 ID를 부모로 가진 댓글들을 찾아라
-        ).order_by(Comment.created_at.asc()).all()
-        
-        # 대댓글 리스트 생성
-        reply_list = [make_comment_response(reply) for reply in replies]
+    result = []
+    for comment in parents:
+        reply_list = replies.get(comment.comment_id, [])
         
         # 댓글 + 대댓글 추가
         comment_dict = make_comment_response(comment)
-        comment_dict["replies"] = reply_list
+        if reply_counts is not None:
+            comment_dict["reply_count"] = reply_counts.get(comment.comment_id, 0)
+        else:
+            comment_dict["reply_count"] = len(reply_list)
+        comment_dict["replies"] = [make_comment_response(reply) for reply in reply_list]
         result.append(comment_dict)
     
-    total = db.query(Comment).filter(Comment.post_id == post_id).count()
-    
     return {
         "post_id": post_id,
-        "total": total,
+        "total": total if total is not None else len(rows),
+        "next_cursor": next_cursor,
         "comments": result
     }
 
 
+def load_comments(
+    db: Session,
+    post_id: int,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    replies_limit: Optional[int] = None
+) -> dict:
+    """계층형 댓글 목록 딕셔너리 (API와 서버 렌더링 페이지에서 공통 사용)"""
+    rows = db.scalars(comment_rows_statement(post_id, limit, cursor, replies_limit)).all()
+    
+    # 전체 조회면 불러온 댓글 수가 곧 전체 개수
+    total = None
+    if needs_comment_total(limit, cursor, replies_limit):
+        total = db.scalar(comment_total_statement(post_id))
+    
+    reply_counts = None
+    if replies_limit is not None:
+        reply_counts = dict(db.execute(reply_counts_statement(rows)).all())
+    
+    return build_comment_tree(post_id, rows, total, limit, reply_counts)
+
+
+# 2. 댓글 목록 조회 (계층형 구조)
+@router.get("/{post_id}/comments", response_model=CommentListResponse)
+def get_comments(
+    post_id: int,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    replies_limit: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    특정 게시글의 댓글을 계층형 구조로 조회
+    - 댓글과 대댓글, 작성자를 쿼리 한 번으로 불러와서 메모리에서 트리 구성
+    - limit/cursor: 최상위 댓글 기준 커서 페이지네이션 (없으면 전체 조회)
+    - replies_limit: 댓글마다 포함할 대댓글 최대 개수 (SQL에서 자르고, reply_count는 GROUP BY로 전체 개수 제공)
+    - 댓글이 바뀌지 않았으면 304 응답 (ETag / Last-Modified)
+    """
+    
+    # 게시글 존재 확인 + 검증값 조회
+    validators = post_validators(db, post_id, "comments")
+    if validators is None:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+    
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    
+    result = load_comments(db, post_id, limit, cursor, replies_limit)
+    return json_response(CommentListResponse, result, headers=validators.headers())
+
+
 # 3. 댓글 수정
-@router.put("/{post_id}/comments/{comment_id}")
+@router.put("/{post_id}/comments/{comment_id}", response_model=CommentResponse)
 def update_comment(
     post_id: int,
     comment_id: int,
@@ -140,7 +340,9 @@ def update_comment(
     db.commit()
     db.refresh(comment)
     
-    return make_comment_response(comment)
+    fragment_cache.invalidate([post_scope(post_id)])
+    
+    return json_response(CommentResponse, make_comment_response(comment))
 
 
 # 4. 댓글 삭제
@@ -178,6 +380,7 @@ def delete_comment(
                 db.delete(parent_comment)
                 db.commit()
         
+        fragment_cache.invalidate([post_scope(post_id)])
         return {"message": "댓글이 삭제되었습니다"}
     
     # 🔹 이 댓글이 최상위 댓글인 경우 (기존 로직 유지)
@@ -190,16 +393,18 @@ def delete_comment(
         comment.content = "삭제된 댓글입니다"
         comment.updated_at = datetime.now()
         db.commit()
+        fragment_cache.invalidate([post_scope(post_id)])
         return {"message": "이 댓글은 삭제되어 더 이상 볼 수 없습니다."}
     else:
         # 대댓글이 없으면 완전 삭제
         db.delete(comment)
         db.commit()
+        fragment_cache.invalidate([post_scope(post_id)])
         return {"message": "댓글이 삭제되었습니다"}
 
 
 # 5. 대댓글 작성
-@router.post("/{post_id}/comments/{comment_id}/replies", status_code=201)
+@router.post("/{post_id}/comments/{comment_id}/replies", status_code=201, response_model=CommentResponse)
 def create_reply(
     post_id: int,
     comment_id: int,
@@ -212,12 +417,7 @@ def create_reply(
     get_post_check(db, post_id)
     parent_comment = get_comment_check(db, post_id, comment_id)
 
-    # 대댓글의 대댓글 방지 (1단계 제한)
-    if parent_comment.parent_comment_id is not None:
-        raise HTTPException(
-            status_code=400,
-            detail="대댓글에는 답글을 달 수 없습니다. 답글은 한 단계까지만 허용됩니다."
-        )
+    check_reply_target(parent_comment)
     
     new_reply = Comment(
         post_id=post_id,
@@ -230,4 +430,6 @@ def create_reply(
     db.commit()
     db.refresh(new_reply)
     
-    return make_comment_response(new_reply)
\ No newline at end of file
+    fragment_cache.invalidate([post_scope(post_id)])
+    
+    return json_response(CommentResponse, make_comment_response(new_reply), status_code=201)
\ No newline at end of file
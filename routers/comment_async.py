@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from database import get_async_db
+from utils.conditional import post_validators_async, is_not_modified, not_modified_response
+from utils.serialization import json_response
+from routers.comment import (
+    CommentListResponse, comment_rows_statement, comment_total_statement, needs_comment_total,
+    reply_counts_statement, build_comment_tree
+)
+
+# 댓글 조회 API의 비동기 DB 버전 (DB_MODE=async 일 때 routers/comment.py의 같은 경로를 대신함)
+# - 댓글 목록 조회만 비동기 버전이 있음 (작성/수정/삭제는 두 모드 모두 routers/comment.py 사용)
+# - 조회 조건, 트리 구성, 응답 생성은 routers/comment.py의 함수를 그대로 사용
+
+router = APIRouter()
+
+
+async def load_comments_async(
+    db: AsyncSession,
+    post_id: int,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    replies_limit: Optional[int] = None
+) -> dict:
+    """load_comments의 비동기 세션 버전"""
+    rows = (await db.scalars(comment_rows_statement(post_id, limit, cursor, replies_limit))).all()
+
+    total = None
+    if needs_comment_total(limit, cursor, replies_limit):
+        total = await db.scalar(comment_total_statement(post_id))
+
+    reply_counts = None
+    if replies_limit is not None:
+        reply_counts = dict((await db.execute(reply_counts_statement(rows))).all())
+
+    return build_comment_tree(post_id, rows, total, limit, reply_counts)
+
+
+# 2. 댓글 목록 조회 (계층형 구조)
+@router.get("/{post_id}/comments", response_model=CommentListResponse)
+async def get_comments(
+    post_id: int,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    replies_limit: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """특정 게시글의 댓글을 계층형 구조로 조회 (routers/comment.py의 get_comments 참고)"""
+    validators = await post_validators_async(db, post_id, "comments")
+    if validators is None:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+
+    result = await load_comments_async(db, post_id, limit, cursor, replies_limit)
+    return json_response(CommentListResponse, result, headers=validators.headers())
@@ -0,0 +1,154 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import HTMLResponse
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from database import get_db
+from models.post import Post
+from routers.blog import (
+    CategoryEnum, PostResponse, POST_LOAD_OPTIONS, list_cache_key, load_post_list, load_tag_post_list, make_post_response
+)
+from routers.comment import CommentListResponse, load_comments
+from utils.fragments import cached_fragment, post_scope, render, POST_FRAGMENT_TTL
+from utils.view_counter import view_counter
+from utils.serialization import json_data
+
+router = APIRouter()
+
+# 서버 렌더링 페이지
+# - index.html(목록), view.html(상세)을 데이터가 채워진 상태로 응답 → 첫 화면에 API 요청이 필요 없음
+# - 페이지에 같은 데이터를 JSON으로 넣어두고, 브라우저는 그 데이터로 로그인 사용자별 버튼 등만 다시 그림
+# - 본문/목록 HTML 조각은 utils/fragments.py의 조각 캐시에 보관
+# - 게시글 상세의 조회수는 조각 밖에서 매번 계산해서 페이지 데이터(INITIAL_DATA)에 덮어씀
+# - 페이지 데이터는 API 응답과 같은 스키마로 직렬화 (목록: PostListResponse, 상세: PostResponse + CommentListResponse)
+# - 없는 게시글/태그는 JSON이 아닌 404 HTML 페이지(not-found.html)로 응답
+# - /templates/index.html, /templates/view.html 로 접근하면 기존처럼 빈 틀 + API 요청으로 동작
+
+PAGE_SIZE = 10  # index.html 스크립트의 한 페이지 게시글 수와 같아야 함
+
+
+def page_links(total: int, page: int, limit: int) -> dict:
+    """페이지 번호 목록 (현재 페이지 기준 ±2, index.html의 displayPagination과 같은 규칙)"""
+    total_pages = -(-(total or 0) // limit)
+    return {
+        "page": page,
+        "total_pages": total_pages,
+        "numbers": list(range(max(1, page - 2), min(total_pages, page + 2) + 1))
+    }
+
+
+def not_found_page(error: HTTPException) -> HTMLResponse:
+    """404 HTTPException → 404 HTML 페이지 (다른 오류는 그대로)"""
+    if error.status_code != 404:
+        raise error
+    return HTMLResponse(render("not-found.html", message=error.detail), status_code=404)
+
+
+# ===== 게시글 목록 페이지 =====
+@router.get("/posts", response_class=HTMLResponse)
+def post_list_page(
+    page: int = Query(1, ge=1),
+    category: Optional[CategoryEnum] = None,
+    sort: str = Query("desc"),
+    search: Optional[str] = None,
+    tag: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    sort = "asc" if sort == "asc" else "desc"
+    search = search.strip() if search else None
+
+    # 태그 목록이면 태그만, 아니면 카테고리/검색어로 조회 (index.html의 loadPosts와 같은 규칙)
+    if tag:
+        scope = f"tag:{tag}"
+        params = dict(page=page, sort=sort, tag=tag)
+    else:
+        scope = f"category:{category.value}" if category else "all"
+        params = dict(page=page, sort=sort, category=category.value if category else None, search=search)
+
+    def build():
+        if tag:
+            data = load_tag_post_list(db, tag, page, PAGE_SIZE, sort)
+        else:
+            data = load_post_list(db, page, PAGE_SIZE, category, sort, search)
+        # 번호는 최신순 기준 전체 개수에서 거꾸로 (index.html과 같은 규칙)
+        offset = (data["total"] or 0) - (page - 1) * PAGE_SIZE
+        return {
+            "total": data["total"],
+            "rows_html": render("fragments/post-rows.html", posts=data["posts"], offset=offset),
+            "pagination_html": render(
+                "fragments/pagination.html",
+                links=page_links(data["total"], page, PAGE_SIZE),
+                query={key: value for key, value in params.items() if key != "page" and value}
+            ),
+            "data_json": htmlsafe_json_dumps(data)
+        }
+
+    try:
+        fragment = cached_fragment("list:" + list_cache_key(**params), [scope], build)
+    except HTTPException as e:
+        # 없는 태그
+        return not_found_page(e)
+
+    return render(
+        "index.html",
+        total=fragment["total"],
+        rows_html=Markup(fragment["rows_html"]),
+        pagination_html=Markup(fragment["pagination_html"]),
+        initial_data=Markup(fragment["data_json"]),
+        tag=tag,
+        category=category.value if category else "",
+        sort=sort,
+        search=search or ""
+    )
+
+
+# ===== 게시글 상세 페이지 =====
+@router.get("/posts/{post_id}", response_class=HTMLResponse)
+def post_detail_page(post_id: int, db: Session = Depends(get_db)):
+    stored_view_count = {}
+
+    def build():
+        post = db.query(Post).options(*POST_LOAD_OPTIONS).filter(Post.post_id == post_id).first()
+        if not post:
+            raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+        stored_view_count["value"] = post.view_count
+        # 브라우저가 API(/blog/{id}, /blog/{id}/comments)로 받는 것과 같은 형식
+        data = {
+            "post": json_data(PostResponse, make_post_response(post)),
+            "comments": json_data(CommentListResponse, load_comments(db, post_id))
+        }
+        return {
+            "comment_count": data["comments"]["total"],
+            "post_html": render("fragments/post.html", post=data["post"]),
+            "comments_html": render("fragments/comments.html", comments=data["comments"]["comments"]),
+            "data_json": htmlsafe_json_dumps(data)
+        }
+
+    try:
+        fragment = cached_fragment(f"post:{post_id}", [post_scope(post_id)], build, ttl=POST_FRAGMENT_TTL)
+    except HTTPException as e:
+        return not_found_page(e)
+
+    # 조회수는 조각에 넣지 않고 매번 DB 값 + 반영 대기 중인 증가분으로 (조각은 POST_FRAGMENT_TTL 동안 보관되므로)
+    # 조각을 방금 만들었으면 그때 불러온 값 사용, 캐시된 조각이면 기본 키 조회 한 번
+    if "value" not in stored_view_count:
+        row = db.execute(select(Post.view_count).where(Post.post_id == post_id)).first()
+        if row is None:
+            return not_found_page(HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다."))
+        stored_view_count["value"] = row.view_count
+    view_count = view_counter.merged(post_id, stored_view_count["value"])
+
+    # 조회수 증가 (캐시된 페이지여도 증가)
+    view_counter.increment(post_id)
+
+    return render(
+        "view.html",
+        comment_count=fragment["comment_count"],
+        post_html=Markup(fragment["post_html"]),
+        comments_html=Markup(fragment["comments_html"]),
+        initial_data=Markup(fragment["data_json"]),
+        view_count=view_count
+    )
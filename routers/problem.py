@@ -1,15 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import select
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
-from database import get_db, redis_client
+from enum import Enum
+from database import get_db
 from models.problem import Problem, UserProblem
 from models.user import User
 from utils.dependencies import get_current_user, get_current_admin
+from utils.cache import create_cache, LRUCache
+from utils.popularity import record_selection, publish_selection, top_problems
+from utils.conditional import Validators, is_not_modified, not_modified_response
+from utils.uploads import save_upload, download_url, MAX_PROBLEM_FILE_SIZE
+from utils.encoding import accepts_encoding
+import hashlib
+import json
+import gzip
 import os
-import shutil
 
 router = APIRouter()
 
@@ -17,6 +25,104 @@ router = APIRouter()
 UPLOAD_DIR = "uploads/problems"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# 인기 문제 조회 캐시
+# - popular_cache: 완성된 Top 10 응답 (짧은 TTL, 선택 수가 잠깐 늦게 반영될 수 있음)
+# - problem_info_cache: 문제 정보 (프로세스 내부, 문제 등록 시 비움)
+# → 캐시가 살아 있는 동안 인기 문제 조회는 캐시 조회 한 번, SQL 0번
+POPULAR_CACHE_TTL = int(os.getenv("POPULAR_CACHE_TTL", "10"))
+POPULAR_LIMIT = 10
+popular_cache = create_cache("problems:popular", ttl=POPULAR_CACHE_TTL)
+problem_info_cache = LRUCache(max_entries=4096, ttl=3600)
+
+def problem_info(problem: Problem) -> dict:
+    return {
+        "problem_id": problem.problem_id,
+        "year": problem.year,
+        "month": problem.month,
+        "number": problem.number,
+        "title": problem.title,
+        "difficulty": problem.difficulty
+    }
+
+def cached_problem_infos(problem_ids: list[int]) -> tuple[dict[int, dict], list[int]]:
+    """캐시에 있는 문제 정보와 캐시에 없는 문제 ID 목록"""
+    infos = {}
+    missing = []
+    for problem_id in problem_ids:
+        info = problem_info_cache.get(str(problem_id))
+        if info is None:
+            missing.append(problem_id)
+        else:
+            infos[problem_id] = info
+    return infos, missing
+
+def remember_problem_infos(infos: dict[int, dict], problems):
+    for problem in problems:
+        info = problem_info(problem)
+        problem_info_cache.set(str(problem.problem_id), info, scopes=["problems"])
+        infos[problem.problem_id] = info
+    return infos
+
+def load_problem_infos(db: Session, problem_ids: list[int]) -> dict[int, dict]:
+    """문제 정보 조회 (캐시에 없는 문제만 IN 쿼리 한 번으로 조회)"""
+    infos, missing = cached_problem_infos(problem_ids)
+    if missing:
+        remember_problem_infos(infos, db.scalars(select(Problem).where(Problem.problem_id.in_(missing))))
+    return infos
+
+# 문제 선택 화면용 카탈로그 (연도 → 월 → [번호, 문제 ID, 제목, 난이도])
+# - 직렬화한 JSON과 gzip 압축본, 각각의 ETag를 미리 만들어 프로세스 내부에 보관
+# - 문제 등록 시 비우고, 다른 워커에서 등록된 문제는 CATALOG_TTL 안에 반영
+CATALOG_TTL = int(os.getenv("CATALOG_TTL", "300"))
+catalog_cache = LRUCache(max_entries=1, ttl=CATALOG_TTL)
+
+CATALOG_STATEMENT = select(
+    Problem.year, Problem.month, Problem.number, Problem.problem_id, Problem.title, Problem.difficulty
+).order_by(Problem.year.desc(), Problem.month.desc(), Problem.number)
+
+def build_catalog(rows) -> dict:
+    """카탈로그 JSON 본문/gzip 압축본/ETag 생성 (rows: CATALOG_STATEMENT 조회 결과)"""
+    years = {}
+    for year, month, number, problem_id, title, difficulty in rows:
+        years.setdefault(str(year), {}).setdefault(str(month), []).append([number, problem_id, title, difficulty])
+
+    body = json.dumps({"years": years}, ensure_ascii=False, separators=(",", ":")).encode()
+    digest = hashlib.md5(body).hexdigest()
+    return {
+        "body": body,
+        "gzip": gzip.compress(body),
+        "etag": f'"{digest}"',
+        "gzip_etag": f'"{digest}-gz"'  # 압축본은 바이트가 다르므로 ETag도 따로
+    }
+
+def get_catalog(db: Session) -> dict:
+    catalog = catalog_cache.get("catalog")
+    if catalog is None:
+        catalog = build_catalog(db.execute(CATALOG_STATEMENT))
+        catalog_cache.set("catalog", catalog, scopes=["problems"])
+    return catalog
+
+def catalog_response(request: Request, catalog: dict) -> Response:
+    """Accept-Encoding(q 값 포함)에 맞는 본문과 그 본문의 ETag로 응답"""
+    use_gzip = accepts_encoding(request.headers.get("accept-encoding", ""), "gzip")
+    validators = Validators(catalog["gzip_etag"] if use_gzip else catalog["etag"])
+    if is_not_modified(request, validators):
+        response = not_modified_response(validators)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    headers = validators.headers()
+    headers["Vary"] = "Accept-Encoding"
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=catalog["gzip"], media_type="application/json", headers=headers)
+    return Response(content=catalog["body"], media_type="application/json", headers=headers)
+
+def invalidate_problem_caches():
+    problem_info_cache.invalidate(["problems"])
+    catalog_cache.invalidate(["problems"])
+    popular_cache.invalidate(["popular"])
+
 # Pydantic 스키마
 class ProblemResponse(BaseModel):
     problem_id: int
@@ -58,6 +164,12 @@ class MyProblemListResponse(BaseModel):
 class SelectProblemRequest(BaseModel):
     problem_id: int
 
+class PopularWindowEnum(str, Enum):
+    ALL = "all"
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
 class PopularProblemResponse(BaseModel):
     problem_id: int
     year: int
@@ -68,6 +180,99 @@ class PopularProblemResponse(BaseModel):
     selection_count: int
 
 
+# 문제 등록 검증
+def check_problem_month(month: int):
+    if month not in [3, 6, 9, 11]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="3,6,9,11월만 문제 등록이 가능합니다."
+        )
+
+def problem_statement(year: int, month: int, number: int):
+    return select(Problem).where(Problem.year == year, Problem.month == month, Problem.number == number)
+
+def check_new_problem(existing_problem: Optional[Problem]):
+    if existing_problem:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="문제가 이미 존재합니다."
+        )
+
+def problem_file_extension(filename: str) -> str:
+    allowed_extensions = ['.hwp', '.pdf', '.png', '.jpg', '.jpeg']
+    file_extension = os.path.splitext(filename)[1].lower() # 파일명과 확장자 분리시켜서 확장자만 선택하고 소문자 처리
+    
+    if file_extension not in allowed_extensions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 파일 형식입니다. 업로드 가능한 파일 형식: {', '.join(allowed_extensions)}" # 리스트의 요소들을 합쳐서 하나의 문자열로 만듦
+        )
+    return file_extension
+
+def problem_file_url(file_path: str, year: int, month: int, number: int, file_extension: str) -> str:
+    """해시 이름으로 저장된 문제 파일 주소 (다운로드 이름은 {연도}_{월}_{번호}.확장자)"""
+    return download_url(file_path, f"{year}_{month}_{number}{file_extension}")
+
+def filter_problems(query, year: Optional[int], month: Optional[int]):
+    # 연도/월 필터 (db.query, select() 모두 사용 가능)
+    if year:
+        query = query.filter(Problem.year == year)
+    if month:
+        query = query.filter(Problem.month == month)
+    return query
+
+PROBLEM_ORDER = (Problem.year.desc(), Problem.month.desc(), Problem.number)
+
+def check_problem_found(problem: Optional[Problem]):
+    if not problem:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="문제를 찾을 수 없습니다."
+        )
+    return problem
+
+def count_selection(user_problem: Optional[UserProblem], user_id: int, problem_id: int) -> UserProblem:
+    """이미 선택한 문제면 카운트 증가, 아니면 새 UserProblem (세션에 추가는 호출한 쪽에서)"""
+    now = datetime.utcnow()
+    if user_problem:
+        user_problem.selection_count += 1
+        user_problem.last_selected_at = now
+        return user_problem
+    return UserProblem(
+        user_id=user_id,
+        problem_id=problem_id,
+        selection_count=1,
+        first_selected_at=now,
+        last_selected_at=now
+    )
+
+def user_problem_statement(user_id: int, problem_id: int):
+    return select(UserProblem).where(UserProblem.user_id == user_id, UserProblem.problem_id == problem_id)
+
+def check_my_problem(user_problem: Optional[UserProblem], user: User) -> UserProblem:
+    if not user_problem:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="선택된 문제가 없습니다."
+        )
+    
+    # 권한 체크
+    if user_problem.user_id != user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="문제를 삭제할 권한이 없습니다."
+        )
+    return user_problem
+
+def popular_response(window: str, leaders: list[tuple[int, int]], infos: dict[int, dict]) -> dict:
+    popular_problems = []
+    for problem_id, selection_count in leaders:
+        info = infos.get(problem_id)
+        if info:
+            popular_problems.append({**info, "selection_count": selection_count})
+    return {"window": window, "popular_problems": popular_problems}
+
+
 # 1. 관리자 전용 문제 등록 API
 @router.post("/admin/problems", response_model=ProblemResponse, status_code=status.HTTP_201_CREATED)
 async def create_problem(
@@ -85,43 +290,19 @@ async def create_problem(
     - 파일 업로드 지원 (한글/PDF/PNG)
     - year, month, number 조합은 unique해야 함
     - month는 3, 6, 9, 11만 허용
+    - 파일은 최대 MAX_PROBLEM_FILE_SIZE, 같은 파일은 한 번만 저장 (utils/uploads.py)
     """
     # 월 검증
-    if month not in [3, 6, 9, 11]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="3,6,9,11월만 문제 등록이 가능합니다."
-        )
+    check_problem_month(month)
     
     # 중복 체크
-    existing_problem = db.query(Problem).filter(
-        Problem.year == year,
-        Problem.month == month,
-        Problem.number == number
-    ).first()
-    
-    if existing_problem:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="문제가 이미 존재합니다."
-        )
+    check_new_problem(db.scalar(problem_statement(year, month, number)))
     
     # 파일 확장자 검증
-    allowed_extensions = ['.hwp', '.pdf', '.png', '.jpg', '.jpeg']
-    file_extension = os.path.splitext(file.filename)[1].lower() # 파일명과 확장자 분리시켜서 확장자만 선택하고 소문자 처리
-    
-    if file_extension not in allowed_extensions:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"지원하지 않는 파일 형식입니다. 업로드 가능한 파일 형식: {', '.join(allowed_extensions)}" # 리스트의 요소들을 합쳐서 하나의 문자열로 만듦
-        )
+    file_extension = problem_file_extension(file.filename)
     
-    # 파일 저장
-    file_name = f"{year}_{month}_{number}{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, file_name)
-    
-    with open(file_path, "wb") as buffer: # 업로드된 파일을 바이너리 쓰기 모드로 열기 (파일을 열어서 buffer라는 이름으로 사용)
-        shutil.copyfileobj(file.file, buffer) # 업로드된 파일의 내용을 버퍼에 복사 (파일 저장)
+    # 파일 저장 (스레드풀에서 나눠 쓰기, 내용 해시를 파일 이름으로 사용, 다운로드 이름은 {연도}_{월}_{번호})
+    file_path = await save_upload(file, UPLOAD_DIR, file_extension, MAX_PROBLEM_FILE_SIZE)
     
     # 문제 생성
     new_problem = Problem(
@@ -130,13 +311,16 @@ async def create_problem(
         number=number,
         title=title,
         difficulty=difficulty,
-        file_url=f"/{file_path}"
+        file_url=problem_file_url(file_path, year, month, number, file_extension)
     )
     
     db.add(new_problem)
     db.commit()
     db.refresh(new_problem)
     
+    # 인기 문제 응답에 쓰이는 문제 정보 캐시 비우기
+    invalidate_problem_caches()
+    
     return new_problem
 
 
@@ -154,20 +338,14 @@ def get_problems(
     - year, month로 필터링 가능
     - 페이지네이션 지원
     """
-    query = db.query(Problem)
-    
-    # 필터링
-    if year:
-        query = query.filter(Problem.year == year)
-    if month:
-        query = query.filter(Problem.month == month)
+    query = filter_problems(db.query(Problem), year, month)
     
     # 총 개수
     total = query.count()
     
     # 페이지네이션
     offset = (page - 1) * limit
-    problems = query.order_by(Problem.year.desc(), Problem.month.desc(), Problem.number).offset(offset).limit(limit).all()
+    problems = query.order_by(*PROBLEM_ORDER).offset(offset).limit(limit).all()
     
     return {
         "total": total,
@@ -177,6 +355,18 @@ def get_problems(
     }
 
 
+# 문제 카탈로그 조회 API (문제 선택 화면용)
+@router.get("/catalog")
+def get_problem_catalog(request: Request, db: Session = Depends(get_db)):
+    """
+    문제 카탈로그 조회 API
+    - 연도 → 월 → [번호, 문제 ID, 제목, 난이도] 형태의 전체 문제 목록
+    - 미리 만들어 둔 응답을 그대로 반환 (문제 등록 시 다시 생성)
+    - ETag 지원 (바뀌지 않았으면 304), gzip 지원
+    """
+    return catalog_response(request, get_catalog(db))
+
+
 # 3. 문제 선택 API (내 문제에 추가)
 @router.post("/my", response_model=UserProblemResponse, status_code=status.HTTP_201_CREATED)
 def select_problem(
@@ -188,7 +378,8 @@ def select_problem(
     문제 선택 API
     - 특정 문제를 내 문제 목록에 추가
     - 이미 선택한 문제면 selection_count 증가
-    - Redis 인기도는 선택할 때마다 +1 (실제 서비스 이용 횟수)
+    - 인기도는 선택할 때마다 +1 (실제 서비스 이용 횟수)
+      ProblemPopularity 테이블에 같은 트랜잭션으로 저장 → 커밋 후 Redis/내부 순위표에 반영
     
     ※ 비즈니스 로직:
       - 같은 문제 3번 선택 = 3번의 서비스 이용 (변형문제, 분석 등)
@@ -196,40 +387,19 @@ def select_problem(
       - 인기도 = 실제 서비스 이용 횟수 = 수요 지표
     """
     # 문제 존재 확인
-    problem = db.query(Problem).filter(Problem.problem_id == request.problem_id).first()
-    if not problem:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="문제를 찾을 수 없습니다."
-        )
+    check_problem_found(db.get(Problem, request.problem_id))
     
-    # 이미 선택한 문제인지 확인
-    user_problem = db.query(UserProblem).filter(
-        UserProblem.user_id == current_user.user_id,
-        UserProblem.problem_id == request.problem_id
-    ).first()
-    
-    if user_problem:
-        # 이미 선택한 문제면 카운트 증가
-        user_problem.selection_count += 1
-        user_problem.last_selected_at = datetime.utcnow()
-    else:
-        # 새로 선택
-        user_problem = UserProblem(
-            user_id=current_user.user_id,
-            problem_id=request.problem_id,
-            selection_count=1,
-            first_selected_at=datetime.utcnow(),
-            last_selected_at=datetime.utcnow()
-        )
-        db.add(user_problem)
+    # 이미 선택한 문제면 카운트 증가, 아니면 새로 선택
+    user_problem = db.scalar(user_problem_statement(current_user.user_id, request.problem_id))
+    user_problem = count_selection(user_problem, current_user.user_id, request.problem_id)
+    db.add(user_problem)
     
+    record_selection(db, request.problem_id)
     db.commit()
     db.refresh(user_problem)
     
-    # Redis에 인기도 카운트 증가
-    if redis_client:
-        redis_client.zincrby("popular_problems", 1, request.problem_id)
+    # Redis/내부 순위표에 인기도 카운트 증가
+    publish_selection(request.problem_id)
     
     return user_problem
 
@@ -274,29 +444,14 @@ def delete_my_problem(
     문제 선택 취소 API
     - 내 문제 목록에서 삭제
     - 본인이 선택한 문제만 삭제 가능
-    - Redis 인기도는 유지 (과거 수요 데이터 보존)
+    - 인기도는 유지 (과거 수요 데이터 보존)
     
     ※ 비즈니스 로직:
       - 삭제 = 마이페이지 정리용
       - 이미 서비스 이용 완료 & 과금 완료
       - 인기도는 '실제 서비스 이용 횟수'이므로 삭제와 무관
     """
-    user_problem = db.query(UserProblem).filter(
-        UserProblem.user_problem_id == user_problem_id
-    ).first()
-    
-    if not user_problem:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="선택된 문제가 없습니다."
-        )
-    
-    # 권한 체크
-    if user_problem.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="문제를 삭제할 권한이 없습니다."
-        )
+    user_problem = check_my_problem(db.get(UserProblem, user_problem_id), current_user)
     
     # 삭제
     db.delete(user_problem)
@@ -307,36 +462,26 @@ def delete_my_problem(
 
 # 6. 인기 문제 Top 10 조회 API
 @router.get("/popular")
-def get_popular_problems(db: Session = Depends(get_db)):
+def get_popular_problems(
+    window: PopularWindowEnum = PopularWindowEnum.ALL,
+    db: Session = Depends(get_db)
+):
     """
     인기 문제 Top 10 조회 API
-    - Redis 캐싱 활용
+    - window: all(전체 기간), hour(현재 1시간), day(최근 24시간), week(최근 7일)
+    - Redis 캐싱 활용 (Redis가 없거나 오류가 나면 프로세스 내부 순위표 사용)
+    - 완성된 응답을 POPULAR_CACHE_TTL 초 동안 캐시
+    - 문제 정보는 캐시 → 없는 것만 IN 쿼리 한 번으로 조회
     """
-    if not redis_client:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Redis 서버에 연결할 수 없습니다."
-        )
-    
-    # Redis에서 인기 문제 Top 10 조회 (점수 높은 순)
-    popular_problem_ids = redis_client.zrevrange("popular_problems", 0, 9, withscores=True)
-    
-    if not popular_problem_ids:
-        return {"popular_problems": []}
-    
-    # DB에서 문제 정보 조회
-    popular_problems = []
-    for problem_id, selection_count in popular_problem_ids: # Redis에서 가져온 데이터는 전부 문자열
-        problem = db.query(Problem).filter(Problem.problem_id == int(problem_id)).first()
-        if problem:
-            popular_problems.append({
-                "problem_id": problem.problem_id,
-                "year": problem.year,
-                "month": problem.month,
-                "number": problem.number,
-                "title": problem.title,
-                "difficulty": problem.difficulty,
-                "selection_count": int(selection_count)
-            })
-    
-    return {"popular_problems": popular_problems}
\ No newline at end of file
+    cache_key = f"top:{window.value}"
+    cached = popular_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # 인기 문제 Top 10 조회 (점수 높은 순)
+    leaders = top_problems(POPULAR_LIMIT, window.value)
+    infos = load_problem_infos(db, [problem_id for problem_id, _ in leaders])
+    
+    result = popular_response(window.value, leaders, infos)
+    popular_cache.set(cache_key, result, scopes=["popular"])
+    return result
\ No newline at end of file
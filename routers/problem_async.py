@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, Request
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from database import get_async_db
+from models.problem import Problem
+from utils.popularity import top_problems
+from utils.cache import run_cache_io
+from routers.problem import (
+    ProblemListResponse, PopularWindowEnum, POPULAR_LIMIT, PROBLEM_ORDER, CATALOG_STATEMENT,
+    popular_cache, catalog_cache, cached_problem_infos, remember_problem_infos, build_catalog, catalog_response,
+    filter_problems, popular_response
+)
+
+# 문제 조회 API의 비동기 DB 버전 (DB_MODE=async 일 때 routers/problem.py의 같은 경로를 대신함)
+# - 문제 목록/카탈로그/인기 문제 조회만 비동기 버전이 있음
+#   (문제 등록, 내 문제 선택/조회/취소는 두 모드 모두 routers/problem.py 사용)
+# - 캐시, 응답 생성은 routers/problem.py의 함수를 그대로 사용
+#   (Redis를 쓰는 인기 문제 캐시는 run_cache_io로 호출: Redis 캐시면 스레드풀에서 실행)
+
+router = APIRouter()
+
+
+# 2. 문제 목록 조회 API
+@router.get("/", response_model=ProblemListResponse)
+async def get_problems(
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    page: int = 1,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """문제 목록 조회 API (year, month 필터, 페이지네이션)"""
+    stmt = filter_problems(select(Problem), year, month)
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    offset = (page - 1) * limit
+    problems = (await db.scalars(stmt.order_by(*PROBLEM_ORDER).offset(offset).limit(limit))).all()
+
+    return {
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "problems": problems
+    }
+
+
+# 문제 카탈로그 조회 API (문제 선택 화면용)
+@router.get("/catalog")
+async def get_problem_catalog(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """문제 카탈로그 조회 API (미리 만들어 둔 응답, ETag/gzip 지원)"""
+    catalog = catalog_cache.get("catalog")
+    if catalog is None:
+        catalog = build_catalog(await db.execute(CATALOG_STATEMENT))
+        catalog_cache.set("catalog", catalog, scopes=["problems"])
+    return catalog_response(request, catalog)
+
+
+# 6. 인기 문제 Top 10 조회 API
+@router.get("/popular")
+async def get_popular_problems(
+    window: PopularWindowEnum = PopularWindowEnum.ALL,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """인기 문제 Top 10 조회 API (routers/problem.py의 get_popular_problems 참고)"""
+    cache_key = f"top:{window.value}"
+    cached = await run_cache_io(popular_cache, popular_cache.get, cache_key)
+    if cached is not None:
+        return cached
+
+    # Redis 조회는 동기 클라이언트이므로 스레드풀에서 (응답이 늦어져도 이벤트 루프를 막지 않도록)
+    leaders = await run_in_threadpool(top_problems, POPULAR_LIMIT, window.value)
+    infos, missing = cached_problem_infos([problem_id for problem_id, _ in leaders])
+    if missing:
+        remember_problem_infos(infos, await db.scalars(select(Problem).where(Problem.problem_id.in_(missing))))
+
+    result = popular_response(window.value, leaders, infos)
+    await run_cache_io(popular_cache, popular_cache.set, cache_key, result, ["popular"])
+    return result
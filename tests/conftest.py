@@ -0,0 +1,102 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+# 테스트용 DB/캐시 설정 (database.py를 임포트하기 전에 적용)
+# - 임시 폴더의 빈 SQLite 파일 사용 (blog.db는 건드리지 않음)
+# - 응답 캐시는 프로세스 내부 LRU, Redis는 사용하지 않음 (Redis가 없을 때의 동작으로 확인)
+# - 조회수/인기도 주기 반영은 사실상 끔 (백그라운드 반영이 쿼리 예산 측정에 섞이지 않도록, 테스트에서 직접 flush)
+# - DB_MODE 환경변수는 그대로 사용 (DB_MODE=async python -m pytest 로 비동기 라우터 확인)
+TEST_DB_DIR = tempfile.mkdtemp(prefix="blog-test-")
+atexit.register(shutil.rmtree, TEST_DB_DIR, ignore_errors=True)
+
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_DIR}/blog.db"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["REDIS_PORT"] = "1"
+os.environ["VIEW_COUNT_FLUSH_INTERVAL"] = "3600"
+os.environ["POPULAR_FLUSH_INTERVAL"] = "3600"
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from database import SessionLocal
+from models.user import User
+from routers.blog import list_cache
+from utils.dependencies import create_token, user_cache
+from utils.fragments import fragment_cache
+from utils.view_counter import view_counter
+
+
+@pytest.fixture(scope="session")
+def client():
+    # lifespan 실행 (테이블/인덱스 생성, 카운터 초기화 등)
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def seed(client):
+    """
+    테스트 데이터 (API로 생성해서 게시글 수 카운터, 검색 인덱스도 같이 채워짐)
+    - 게시글 30개 (카테고리 2개, 게시글마다 태그 2개)
+    - 첫 번째 게시글에 댓글 10개, 댓글마다 대댓글 2개
+    """
+    db = SessionLocal()
+    admin = User(name="admin", email="admin@test.com", password="-", nickname="관리자", role="admin")
+    user = User(name="user", email="user@test.com", password="-", nickname="사용자", role="user")
+    db.add_all([admin, user])
+    db.commit()
+    admin_headers = {"Authorization": f"Bearer {create_token(admin.user_id)}"}
+    user_headers = {"Authorization": f"Bearer {create_token(user.user_id)}"}
+    admin_id, user_id = admin.user_id, user.user_id
+    db.close()
+
+    post_ids = []
+    for i in range(30):
+        response = client.post("/blog", headers=admin_headers, json={
+            "title": f"영어 문법 정리 {i}",
+            "content": f"관계대명사와 분사구문 설명 {i}",
+            "category": "영어지식" if i % 2 else "입시정보",
+            "tags": ["문법", f"태그{i % 3}"]
+        })
+        assert response.status_code == 201, response.text
+        post_ids.append(response.json()["id"])
+
+    post_id = post_ids[0]
+    comment_ids = []
+    for i in range(10):
+        response = client.post(f"/blog/{post_id}/comments", headers=user_headers, json={"content": f"댓글 {i}"})
+        assert response.status_code == 201, response.text
+        comment_id = response.json()["id"]
+        comment_ids.append(comment_id)
+        for j in range(2):
+            response = client.post(
+                f"/blog/{post_id}/comments/{comment_id}/replies",
+                headers=admin_headers if j else user_headers,
+                json={"content": f"대댓글 {i}-{j}"}
+            )
+            assert response.status_code == 201, response.text
+
+    # 조회수 증가분이 남아 있지 않도록 반영
+    view_counter.flush()
+
+    return {
+        "admin_id": admin_id,
+        "user_id": user_id,
+        "admin_headers": admin_headers,
+        "user_headers": user_headers,
+        "post_ids": post_ids,
+        "post_id": post_id,
+        "comment_ids": comment_ids,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # 테스트마다 캐시 없이 시작 (캐시 적중 여부에 따라 쿼리 수가 달라지지 않도록)
+    list_cache.clear()
+    fragment_cache.clear()
+    user_cache.clear()
+    yield
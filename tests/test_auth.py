@@ -0,0 +1,27 @@
+def test_register_login_and_change_password(client):
+    response = client.post("/auth/register", json={
+        "name": "learner", "email": "learner@test.com", "password": "first-pw", "nickname": "학생"
+    })
+    assert response.status_code == 201, response.text
+
+    response = client.post("/auth/login", json={"name": "learner", "password": "first-pw"})
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    # 캐시된 사용자(비밀번호 해시 없음)로도 비밀번호 변경 가능
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    response = client.put("/auth/password", headers=headers, json={
+        "current_password": "first-pw", "new_password": "second-pw", "new_password_confirm": "second-pw"
+    })
+    assert response.status_code == 200, response.text
+
+    assert client.post("/auth/login", json={"name": "learner", "password": "first-pw"}).status_code == 401
+    assert client.post("/auth/login", json={"name": "learner", "password": "second-pw"}).status_code == 200
+
+
+def test_register_rejects_duplicate_name(client):
+    payload = {"name": "twin", "email": "twin@test.com", "password": "pw", "nickname": "쌍둥이"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+
+    response = client.post("/auth/register", json={**payload, "email": "other@test.com"})
+    assert response.status_code == 400
@@ -0,0 +1,138 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import asyncio
+import time
+
+from sqlalchemy import update
+
+from database import engine, redis_client
+from models.post import Post
+from routers.blog import list_cache
+from utils.cache import LRUCache, RedisCache, run_cache_io
+from utils.fragments import fragment_cache
+from utils.image_pipeline import image_pipeline
+from utils.dependencies import count_user_cache, user_cache_summary, user_cache
+
+
+def test_invalidate_removes_only_scoped_entries():
+    cache = LRUCache(max_entries=10, ttl=60)
+    cache.set("a", 1, ["all", "category:영어지식"])
+    cache.set("b", 2, ["all", "category:입시정보"])
+
+    cache.invalidate(["category:영어지식"])
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache._scopes == {"all": {"b"}, "category:입시정보": {"b"}}
+
+
+def test_evicted_keys_leave_scope_index():
+    cache = LRUCache(max_entries=3, ttl=60)
+    for i in range(100):
+        cache.set(f"search:{i}", i, ["all", f"search:{i}"])
+
+    assert len(cache._items) == 3
+    assert cache._scopes["all"] == {"search:97", "search:98", "search:99"}
+    assert len(cache._scopes) == 4
+    assert len(cache._key_scopes) == 3
+
+
+def test_expired_keys_leave_scope_index():
+    cache = LRUCache(max_entries=10, ttl=60)
+    cache.set("a", 1, ["user:1"], ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache._scopes == {}
+    assert cache._key_scopes == {}
+
+
+def test_overwrite_moves_key_to_new_scopes():
+    cache = LRUCache(max_entries=10, ttl=60)
+    cache.set("a", 1, ["tag:문법"])
+    cache.set("a", 2, ["tag:어휘"])
+
+    cache.invalidate(["tag:문법"])
+
+    assert cache.get("a") == 2
+    assert cache._scopes == {"tag:어휘": {"a"}}
+
+
+def test_user_cache_stats_from_many_threads():
+    before = user_cache_summary()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in pool.map(lambda i: count_user_cache(hit=i % 2 == 0), range(20000)):
+            pass
+
+    after = user_cache_summary()
+    assert after["hits"] - before["hits"] == 10000
+    assert after["misses"] - before["misses"] == 10000
+
+
+def test_user_cache_scopes_follow_entries(client, seed):
+    response = client.get("/auth/me", headers=seed["user_headers"])
+    assert response.status_code == 200
+    scope = f"user:{seed['user_id']}"
+    assert len(user_cache._scopes[scope]) == 1
+
+    client.put("/auth/profile", headers=seed["user_headers"], json={"nickname": "사용자"})
+    assert scope not in user_cache._scopes
+    assert user_cache._key_scopes == {}
+
+
+def test_nickname_change_refreshes_cached_posts(client, seed):
+    post_id = seed["post_ids"][-1]
+    commented_post_id = seed["post_id"]
+    client.get("/blog")
+    client.get(f"/posts/{post_id}")
+    client.get(f"/posts/{commented_post_id}")
+
+    try:
+        # 게시글 작성자: 목록 응답과 상세 페이지
+        client.put("/auth/profile", headers=seed["admin_headers"], json={"nickname": "새관리자"})
+        posts = client.get("/blog").json()["posts"]
+        assert {post["author"]["nickname"] for post in posts} == {"새관리자"}
+        assert "새관리자" in client.get(f"/posts/{post_id}").text
+
+        # 댓글 작성자: 댓글이 있는 게시글의 상세 페이지
+        client.put("/auth/profile", headers=seed["user_headers"], json={"nickname": "새사용자"})
+        assert "새사용자" in client.get(f"/posts/{commented_post_id}").text
+    finally:
+        client.put("/auth/profile", headers=seed["admin_headers"], json={"nickname": "관리자"})
+        client.put("/auth/profile", headers=seed["user_headers"], json={"nickname": "사용자"})
+
+
+def test_image_variants_refresh_cached_posts(client, seed):
+    post_id = seed["post_ids"][-1]
+    image_url = "/uploads/posts/variant-test.jpg"
+    with engine.begin() as conn:
+        conn.execute(update(Post).where(Post.post_id == post_id).values(image_url=image_url))
+
+    try:
+        listed = {post["id"]: post for post in client.get("/blog").json()["posts"]}
+        assert listed[post_id]["image"]["src"] == image_url
+        client.get(f"/posts/{post_id}")
+
+        # 변환이 끝나면 목록 썸네일, 상세 페이지 데이터가 변환 파일 주소로 바뀜
+        future = Future()
+        future.set_result({"thumbnail": "uploads/posts/variant-test_thumbnail.jpg", "medium": "uploads/posts/variant-test_medium.jpg"})
+        image_pipeline._on_done(image_url, future)
+
+        listed = {post["id"]: post for post in client.get("/blog").json()["posts"]}
+        assert listed[post_id]["image"]["src"] == "/uploads/posts/variant-test_thumbnail.jpg"
+        assert "/uploads/posts/variant-test_medium.jpg" in client.get(f"/posts/{post_id}").text
+    finally:
+        with engine.begin() as conn:
+            conn.execute(update(Post).where(Post.post_id == post_id).values(image_url=None, image_variants=None))
+        list_cache.clear()
+        fragment_cache.clear()
+
+
+def test_redis_cache_io_runs_off_event_loop():
+    """async def 핸들러의 Redis 캐시 호출은 스레드풀에서, 메모리 캐시는 이벤트 루프에서 바로 실행"""
+    async def calling_thread(cache):
+        return await run_cache_io(cache, threading.get_ident)
+
+    loop_thread = threading.get_ident()
+    assert asyncio.run(calling_thread(RedisCache(redis_client, prefix="test:io"))) != loop_thread
+    assert asyncio.run(calling_thread(LRUCache())) == loop_thread
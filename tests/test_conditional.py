@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import time
+
+import pytest
+
+from utils.view_counter import view_counter
+
+
+def test_post_revalidates_after_view_count_flush(client, seed):
+    post_id = seed["post_ids"][3]
+    first = client.get(f"/blog/{post_id}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    # 첫 조회의 조회수가 DB에 반영된 뒤에도 같은 검증값
+    view_counter.flush()
+
+    second = client.get(f"/blog/{post_id}", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+    third = client.get(f"/blog/{post_id}", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert third.status_code == 304
+
+
+def test_comments_revalidate_until_a_comment_is_added(client, seed):
+    post_id = seed["post_ids"][4]
+    first = client.get(f"/blog/{post_id}/comments")
+    etag = first.headers["etag"]
+    view_counter.flush()
+
+    assert client.get(f"/blog/{post_id}/comments", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post(f"/blog/{post_id}/comments", headers=seed["user_headers"], json={"content": "새 댓글"})
+
+    response = client.get(f"/blog/{post_id}/comments", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_catalog_etag_follows_content_encoding(client, seed):
+    gzip_response = client.get("/problems/catalog", headers={"Accept-Encoding": "gzip, deflate"})
+    assert gzip_response.headers["content-encoding"] == "gzip"
+    assert gzip_response.headers["etag"].endswith('-gz"')
+    assert gzip_response.headers["vary"] == "Accept-Encoding"
+
+    # q=0 으로 거부하면 압축하지 않은 본문과 다른 ETag
+    plain_response = client.get("/problems/catalog", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in plain_response.headers
+    assert plain_response.headers["etag"] != gzip_response.headers["etag"]
+    assert plain_response.json() == gzip_response.json()
+
+    # 압축본의 ETag는 압축본을 받는 요청에서만 304
+    revalidated = client.get("/problems/catalog", headers={
+        "Accept-Encoding": "gzip", "If-None-Match": gzip_response.headers["etag"]
+    })
+    assert revalidated.status_code == 304
+    assert revalidated.headers["vary"] == "Accept-Encoding"
+    refetched = client.get("/problems/catalog", headers={
+        "Accept-Encoding": "identity", "If-None-Match": gzip_response.headers["etag"]
+    })
+    assert refetched.status_code == 200
+    assert refetched.headers["etag"] == plain_response.headers["etag"]
+
+
+@pytest.fixture
+def seoul_time(monkeypatch):
+    """서버 로컬 시간대가 UTC가 아닌 경우 (UTC+9)"""
+    monkeypatch.setenv("TZ", "Asia/Seoul")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_last_modified_is_utc_on_non_utc_host(client, seed, seoul_time):
+    post_id = seed["post_ids"][5]
+    created = client.post(f"/blog/{post_id}/comments", headers=seed["user_headers"], json={"content": "시간대 확인"})
+    client.put(
+        f"/blog/{post_id}/comments/{created.json()['id']}", headers=seed["user_headers"], json={"content": "수정"}
+    ).raise_for_status()
+
+    response = client.get(f"/blog/{post_id}/comments")
+    last_modified = parsedate_to_datetime(response.headers["last-modified"])
+    now = datetime.now(timezone.utc)
+    assert now - timedelta(minutes=1) <= last_modified <= now + timedelta(seconds=1)
+
+    # 방금 받은 Last-Modified로 다시 요청하면 304, 댓글이 추가되면 200
+    since = {"If-Modified-Since": response.headers["last-modified"]}
+    assert client.get(f"/blog/{post_id}/comments", headers=since).status_code == 304
+    time.sleep(1)
+    client.post(f"/blog/{post_id}/comments", headers=seed["user_headers"], json={"content": "새 댓글"})
+    assert client.get(f"/blog/{post_id}/comments", headers=since).status_code == 200
+
+
+def test_nickname_change_changes_etags(client, seed):
+    post_id = seed["post_ids"][6]
+    client.post(f"/blog/{post_id}/comments", headers=seed["user_headers"], json={"content": "닉네임 확인"})
+    post_etag = client.get(f"/blog/{post_id}").headers["etag"]
+    comments_etag = client.get(f"/blog/{post_id}/comments").headers["etag"]
+
+    nickname = client.get("/auth/me", headers=seed["user_headers"]).json()["nickname"]
+    client.put("/auth/profile", headers=seed["user_headers"], json={"nickname": "바뀐닉네임"}).raise_for_status()
+    try:
+        # 게시글 상세와 댓글 목록 모두 댓글 작성자 닉네임을 포함하므로 검증값이 바뀜
+        post = client.get(f"/blog/{post_id}", headers={"If-None-Match": post_etag})
+        comments = client.get(f"/blog/{post_id}/comments", headers={"If-None-Match": comments_etag})
+        assert post.status_code == 200
+        assert comments.status_code == 200
+        assert any(comment["user"]["nickname"] == "바뀐닉네임" for comment in comments.json()["comments"])
+    finally:
+        client.put("/auth/profile", headers=seed["user_headers"], json={"nickname": nickname}).raise_for_status()
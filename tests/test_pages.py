@@ -0,0 +1,33 @@
+import json
+import re
+
+# 서버 렌더링 페이지 (routers/pages.py)
+
+
+def initial_data(html: str):
+    """페이지에 넣어 둔 INITIAL_DATA (브라우저가 API 대신 사용하는 데이터)"""
+    match = re.search(r"const INITIAL_DATA = (.*);\n", html)
+    return json.loads(match.group(1))
+
+
+def test_post_page_data_matches_api(client, seed):
+    post_id = seed["post_id"]
+    data = initial_data(client.get(f"/posts/{post_id}").text)
+
+    post = client.get(f"/blog/{post_id}").json()
+    post.pop("comments")
+    assert {**data["post"], "view_count": None} == {**post, "view_count": None}
+    assert data["comments"] == client.get(f"/blog/{post_id}/comments").json()
+
+
+def test_list_page_data_matches_api(client, seed):
+    data = initial_data(client.get("/posts", params={"category": "영어지식"}).text)
+    assert data == client.get("/blog", params={"category": "영어지식"}).json()
+
+
+def test_missing_post_and_tag_pages_are_html(client, seed):
+    for url in ("/posts/999999", "/posts?tag=없는태그"):
+        response = client.get(url)
+        assert response.status_code == 404
+        assert response.headers["content-type"].startswith("text/html")
+        assert "찾을 수 없습니다" in response.text
@@ -0,0 +1,80 @@
+import pytest
+import redis
+import threading
+
+from database import redis_client
+from utils.popularity import PopularityBuffer, hour_bucket, redis_top, top_problems
+
+# Redis가 끊긴 동안의 인기도 처리 (테스트의 Redis는 REDIS_PORT=1 이라 항상 연결 실패)
+
+
+@pytest.fixture
+def redis_marked_available():
+    # 마지막 상태 확인에서는 연결돼 있었던 것처럼 시작 (이후 첫 명령에서 끊김을 알게 됨)
+    redis_client.available = True
+    yield
+    redis_client.available = False
+
+
+def test_pipeline_connection_error_marks_redis_unavailable(redis_marked_available):
+    with pytest.raises(redis.ConnectionError):
+        redis_top(10, "day")
+    assert not redis_client
+
+    # 사용 불가로 바뀐 뒤에는 Redis를 거치지 않고 내부 순위표로 응답
+    assert isinstance(top_problems(10, "day"), list)
+
+
+def test_flush_failure_keeps_pending_and_marks_redis_unavailable(redis_marked_available):
+    buffer = PopularityBuffer()
+    hour = hour_bucket()
+    buffer.increment(1, 2, hour)
+
+    assert buffer.flush() == 0
+    assert not redis_client
+    assert buffer._pending == {(hour, 1): 2}
+    assert buffer._totals == {1: 2}
+
+
+def test_pending_is_kept_and_bounded_while_redis_is_down():
+    buffer = PopularityBuffer(max_pending=3)
+    hour = hour_bucket()
+    buffer.increment(1, 1, hour - 8 * 24)  # 일주일보다 오래된 버킷 (어느 기간에도 쓰이지 않음)
+    for i in range(4):
+        buffer.increment(2, 1, hour - i)
+    buffer.increment(3, 5, hour)
+
+    assert buffer.flush() == 0
+    # 가장 최근 시간 버킷부터 3개만 보관, 전체 기간 증가분은 문제별로 모두 보관
+    assert buffer._pending == {(hour, 2): 1, (hour, 3): 5, (hour - 1, 2): 1}
+    assert buffer._totals == {1: 1, 2: 4, 3: 5}
+
+    assert buffer.snapshot(lambda: {2: 10}) == {2: 10}
+    assert buffer._totals == {}
+    assert len(buffer._pending) == 3
+
+
+def test_reconcile_waits_for_flush_and_keeps_later_selections():
+    buffer = PopularityBuffer()
+    hour = hour_bucket()
+    buffer.increment(1, 2, hour)  # SQL 합계에 이미 들어 있는 증가분
+
+    def load():
+        # SQL 합계를 읽는 동안 들어온 선택은 기다렸다가 비운 뒤에 추가되어야 함
+        publisher.start()
+        publisher.join(0.2)
+        assert publisher.is_alive()
+        return {1: 2}
+
+    publisher = threading.Thread(target=buffer.increment, args=(1, 1, hour))
+    flusher = threading.Thread(target=buffer.flush)
+    with buffer.rebuilding():
+        assert buffer.snapshot(load) == {1: 2}
+        publisher.join()
+        assert buffer._totals == {1: 1}
+
+        # 다시 만드는 동안에는 반영하지 않음
+        flusher.start()
+        flusher.join(0.2)
+        assert flusher.is_alive()
+    flusher.join()
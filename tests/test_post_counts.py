@@ -0,0 +1,32 @@
+from sqlalchemy import event
+
+from database import engine, SessionLocal
+from models.post import Post, Tag
+from utils.post_counts import get_count, tag_key, TOTAL_KEY
+
+
+def test_create_post_commits_once_with_tag_counts(client, seed):
+    """게시글, 태그 연결, 검색 인덱스, 게시글 수 카운터를 한 트랜잭션으로 커밋"""
+    commits = []
+
+    def on_commit(conn):
+        commits.append(conn)
+
+    event.listen(engine, "commit", on_commit)
+    try:
+        response = client.post("/blog", headers=seed["admin_headers"], json={
+            "title": "한 번에 커밋", "content": "내용", "category": "영어지식", "tags": ["문법", "한번커밋"]
+        })
+    finally:
+        event.remove(engine, "commit", on_commit)
+    assert response.status_code == 201, response.text
+    assert len(commits) == 1
+
+    db = SessionLocal()
+    try:
+        tag = db.query(Tag).filter(Tag.name == "한번커밋").one()
+        assert get_count(db, tag_key(tag.tag_id)) == 1
+        assert get_count(db, TOTAL_KEY) == db.query(Post).count()
+    finally:
+        db.close()
+        client.delete(f"/blog/{response.json()['id']}", headers=seed["admin_headers"]).raise_for_status()
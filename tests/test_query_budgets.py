@@ -0,0 +1,96 @@
+import pytest
+
+from utils.query_counter import query_budget
+
+# 주요 조회 API의 쿼리 예산 (N+1 쿼리 회귀 확인)
+# - 게시글 30개, 댓글 10개 + 대댓글 20개가 있어도 쿼리 수는 항목 수와 관계없이 일정해야 함
+# - 캐시는 테스트마다 비워지므로 (conftest.py) 항상 DB 조회 경로를 측정
+
+
+def test_post_list(client, seed):
+    # 게시글 + 작성자(JOIN), 태그(IN 쿼리 한 번), 게시글 수 카운터
+    with query_budget(3):
+        response = client.get("/blog", params={"limit": 30})
+    assert response.status_code == 200
+    assert len(response.json()["posts"]) == 30
+
+
+def test_post_list_by_category(client, seed):
+    with query_budget(3):
+        response = client.get("/blog", params={"limit": 30, "category": "영어지식"})
+    assert response.status_code == 200
+    assert len(response.json()["posts"]) == 15
+
+
+def test_post_list_cursor_page(client, seed):
+    first = client.get("/blog", params={"limit": 10}).json()
+
+    # 커서 방식은 COUNT 없이 게시글 + 태그만 조회
+    with query_budget(2):
+        response = client.get("/blog", params={"limit": 10, "cursor": first["next_cursor"]})
+    assert response.status_code == 200
+    assert response.json()["total"] is None
+
+
+def test_post_list_cache_hit(client, seed):
+    client.get("/blog", params={"limit": 30})
+
+    with query_budget(0):
+        response = client.get("/blog", params={"limit": 30})
+    assert response.status_code == 200
+
+
+def test_post_detail(client, seed):
+    # 검증값, 게시글 + 작성자, 태그, 댓글 + 댓글 작성자
+    with query_budget(4):
+        response = client.get(f"/blog/{seed['post_id']}")
+    assert response.status_code == 200
+    assert len(response.json()["comments"]) == 10
+
+
+def test_comments(client, seed):
+    # 검증값, 댓글 + 작성자 (트리는 메모리에서 구성)
+    with query_budget(2):
+        response = client.get(f"/blog/{seed['post_id']}/comments")
+    assert response.status_code == 200
+    comments = response.json()["comments"]
+    assert len(comments) == 10
+    assert all(len(comment["replies"]) == 2 for comment in comments)
+
+
+def test_comments_with_replies_limit(client, seed):
+    # 검증값, 댓글 + 작성자 (대댓글은 SQL에서 1개씩만), 전체 댓글 수, 대댓글 수 (GROUP BY)
+    with query_budget(4) as counter:
+        response = client.get(f"/blog/{seed['post_id']}/comments", params={"replies_limit": 1})
+    assert response.status_code == 200
+    assert "ROW_NUMBER() OVER" in counter.statements[1].upper()
+    result = response.json()
+    assert result["total"] == 30
+    assert all(len(comment["replies"]) == 1 and comment["reply_count"] == 2 for comment in result["comments"])
+    # 먼저 작성된 대댓글부터
+    assert all(comment["replies"][0]["content"].endswith("-0") for comment in result["comments"])
+
+
+def test_comments_page(client, seed):
+    # 커서 페이지네이션이면 전체 개수 COUNT 추가
+    with query_budget(3):
+        response = client.get(f"/blog/{seed['post_id']}/comments", params={"limit": 5})
+    assert response.status_code == 200
+    assert len(response.json()["comments"]) == 5
+
+
+@pytest.mark.parametrize("tag", ["문법", "태그1"])
+def test_tag_posts(client, seed, tag):
+    # 태그, 게시글 수 카운터, 게시글 + 작성자, 태그
+    with query_budget(4):
+        response = client.get(f"/blog/tags/{tag}", params={"limit": 30})
+    assert response.status_code == 200
+    assert response.json()["posts"]
+
+
+def test_post_pages(client, seed):
+    # 서버 렌더링 페이지도 API와 같은 조회 함수 사용
+    with query_budget(3):
+        assert client.get("/posts").status_code == 200
+    with query_budget(3):
+        assert client.get(f"/posts/{seed['post_id']}").status_code == 200
@@ -0,0 +1,213 @@
+import itertools
+import sys
+
+import pytest
+from fastapi.routing import APIRoute
+
+import main
+from database import SessionLocal
+from models.problem import Problem
+from utils.query_plans import query_plan_check
+
+# 모든 API 경로의 쿼리 계획 검사 (인덱스 누락 회귀 확인)
+# - 앱에 등록된 경로(메서드 + 경로)마다 ROUTE_REQUESTS에 요청을 정의하고, 요청 중 실행된
+#   SELECT/UPDATE/DELETE 문을 EXPLAIN QUERY PLAN 으로 검사 (utils/query_plans.py)
+# - 새 API를 추가하면 ROUTE_REQUESTS에 요청을 추가하기 전까지 test_every_route_is_checked 가 실패
+#   → 새로 추가된 쿼리도 자동으로 검사 대상이 됨
+# - 삭제/수정 요청은 검사 전에 따로 만든 데이터로 실행 (다른 테스트의 seed 데이터는 그대로 유지)
+
+# DB를 조회하지 않는 경로 (이미지 업로드는 DB 없이 파일 저장 + 변환 작업 등록만 함)
+NO_SQL_ROUTES = {("POST", "/blog/images")}
+
+_names = itertools.count()
+
+
+class Context:
+    """요청을 만들 때 쓰는 seed 데이터와 검사용 데이터 생성 함수"""
+
+    def __init__(self, client, seed, problem_ids):
+        self.client = client
+        self.seed = seed
+        self.problem_ids = problem_ids
+        self.admin = seed["admin_headers"]
+        self.user = seed["user_headers"]
+
+    def new_post(self) -> int:
+        response = self.client.post("/blog", headers=self.admin, json={
+            "title": "쿼리 계획 확인용", "content": "내용", "category": "영어지식", "tags": ["문법", "계획"]
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    def new_comment(self) -> int:
+        response = self.client.post(
+            f"/blog/{self.seed['post_id']}/comments", headers=self.user, json={"content": "쿼리 계획 확인용"}
+        )
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    def new_selection(self) -> int:
+        response = self.client.post("/problems/my", headers=self.user, json={"problem_id": self.problem_ids[-1]})
+        assert response.status_code == 201, response.text
+        return response.json()["user_problem_id"]
+
+    def register_body(self) -> dict:
+        name = f"plan{next(_names)}"
+        return {"name": name, "email": f"{name}@test.com", "password": "plan-password", "nickname": name}
+
+    def new_account(self) -> dict:
+        """가입한 사용자의 로그인 요청 본문 (로그인/비밀번호 변경용)"""
+        body = self.register_body()
+        self.client.post("/auth/register", json=body).raise_for_status()
+        return {"name": body["name"], "password": body["password"]}
+
+    def login(self, account: dict) -> dict:
+        token = self.client.post("/auth/login", json=account).json()["access_token"]
+        return {"Authorization": f"Bearer {token}"}
+
+
+def get(url, headers=None, **params):
+    return dict(method="GET", url=url, headers=headers, params=params)
+
+
+def change_password(ctx):
+    account = ctx.new_account()
+    return dict(method="PUT", url="/auth/password", headers=ctx.login(account), json={
+        "current_password": account["password"], "new_password": "plan-password-2", "new_password_confirm": "plan-password-2"
+    })
+
+
+def create_problem(ctx):
+    return dict(
+        method="POST", url="/problems/admin/problems", headers=ctx.admin,
+        data={"year": 2020, "month": 6, "number": next(_names) + 1, "title": "쿼리 계획 확인용", "difficulty": "중"},
+        files={"file": ("problem.pdf", b"%PDF-1.4 plan", "application/pdf")}
+    )
+
+
+# (메서드, 경로) → 요청 목록을 만드는 함수 (검사 전에 실행되므로 필요한 데이터도 이때 생성)
+# 요청마다 allow=[테이블, ...] 로 의도적인 전체 스캔을 허용할 수 있음
+ROUTE_REQUESTS = {
+    ("GET", "/"): lambda ctx: [get("/")],
+    ("GET", "/health"): lambda ctx: [get("/health")],
+
+    ("POST", "/auth/register"): lambda ctx: [dict(method="POST", url="/auth/register", json=ctx.register_body())],
+    ("POST", "/auth/login"): lambda ctx: [dict(method="POST", url="/auth/login", json=ctx.new_account())],
+    ("GET", "/auth/me"): lambda ctx: [get("/auth/me", ctx.user)],
+    ("PUT", "/auth/profile"): lambda ctx: [
+        dict(method="PUT", url="/auth/profile", headers=ctx.user, json={"nickname": "사용자"})
+    ],
+    ("PUT", "/auth/password"): lambda ctx: [change_password(ctx)],
+
+    ("POST", "/blog"): lambda ctx: [dict(method="POST", url="/blog", headers=ctx.admin, json={
+        "title": "쿼리 계획 확인용", "content": "내용", "category": "입시정보", "tags": ["문법", "새태그"]
+    })],
+    ("GET", "/blog"): lambda ctx: [
+        get("/blog"),
+        get("/blog", sort="asc"),
+        get("/blog", category="영어지식"),
+        get("/blog", limit=10, cursor=ctx.client.get("/blog", params={"limit": 10}).json()["next_cursor"]),
+        get("/blog", search="관계대명사"),
+    ],
+    ("GET", "/blog/tags/{tag_name}"): lambda ctx: [get("/blog/tags/문법"), get("/blog/tags/태그1", sort="asc")],
+    ("GET", "/blog/{post_id}"): lambda ctx: [get(f"/blog/{ctx.seed['post_id']}")],
+    ("PUT", "/blog/{post_id}"): lambda ctx: [dict(method="PUT", url=f"/blog/{ctx.new_post()}", headers=ctx.admin, json={
+        "title": "수정", "content": "수정한 내용", "category": "입시정보", "tags": ["태그1"]
+    })],
+    ("DELETE", "/blog/delete-multiple"): lambda ctx: [dict(
+        method="DELETE", url="/blog/delete-multiple", headers=ctx.admin,
+        json={"post_ids": [ctx.new_post(), ctx.new_post()]}
+    )],
+    ("DELETE", "/blog/{post_id}"): lambda ctx: [
+        dict(method="DELETE", url=f"/blog/{ctx.new_post()}", headers=ctx.admin)
+    ],
+
+    ("POST", "/blog/{post_id}/comments"): lambda ctx: [dict(
+        method="POST", url=f"/blog/{ctx.seed['post_id']}/comments", headers=ctx.user, json={"content": "댓글"}
+    )],
+    ("GET", "/blog/{post_id}/comments"): lambda ctx: [
+        get(f"/blog/{ctx.seed['post_id']}/comments"),
+        get(f"/blog/{ctx.seed['post_id']}/comments", limit=5, page=2),
+        get(f"/blog/{ctx.seed['post_id']}/comments", limit=5, replies_limit=1),
+    ],
+    ("PUT", "/blog/{post_id}/comments/{comment_id}"): lambda ctx: [dict(
+        method="PUT", url=f"/blog/{ctx.seed['post_id']}/comments/{ctx.new_comment()}", headers=ctx.user,
+        json={"content": "수정한 댓글"}
+    )],
+    ("DELETE", "/blog/{post_id}/comments/{comment_id}"): lambda ctx: [dict(
+        method="DELETE", url=f"/blog/{ctx.seed['post_id']}/comments/{ctx.new_comment()}", headers=ctx.user
+    )],
+    ("POST", "/blog/{post_id}/comments/{comment_id}/replies"): lambda ctx: [dict(
+        method="POST", url=f"/blog/{ctx.seed['post_id']}/comments/{ctx.seed['comment_ids'][0]}/replies",
+        headers=ctx.admin, json={"content": "대댓글"}
+    )],
+
+    ("POST", "/problems/admin/problems"): lambda ctx: [create_problem(ctx)],
+    ("GET", "/problems/"): lambda ctx: [
+        get("/problems/"),
+        get("/problems/", year=2024),
+        get("/problems/", month=6),
+        get("/problems/", year=2024, month=6),
+    ],
+    ("GET", "/problems/catalog"): lambda ctx: [get("/problems/catalog")],
+    ("POST", "/problems/my"): lambda ctx: [
+        dict(method="POST", url="/problems/my", headers=ctx.user, json={"problem_id": ctx.problem_ids[0]})
+    ],
+    ("GET", "/problems/my"): lambda ctx: [get("/problems/my", ctx.user)],
+    ("DELETE", "/problems/my/{user_problem_id}"): lambda ctx: [
+        dict(method="DELETE", url=f"/problems/my/{ctx.new_selection()}", headers=ctx.user)
+    ],
+    ("GET", "/problems/popular"): lambda ctx: [get("/problems/popular"), get("/problems/popular", window="day")],
+
+    ("GET", "/posts"): lambda ctx: [
+        get("/posts"),
+        get("/posts", page=2, category="영어지식"),
+        get("/posts", search="관계대명사"),
+        get("/posts", tag="문법"),
+    ],
+    ("GET", "/posts/{post_id}"): lambda ctx: [get(f"/posts/{ctx.seed['post_id']}")],
+}
+
+
+def app_routes() -> set[tuple[str, str]]:
+    return {
+        (method, route.path)
+        for route in main.app.routes if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+
+
+@pytest.fixture(scope="module")
+def plan_context(client, seed, tmp_path_factory):
+    """seed 데이터 + 문제 40개 (2023~2024년, 3/6/9/11월, 5문제씩)"""
+    db = SessionLocal()
+    problems = [
+        Problem(year=year, month=month, number=number, title=f"{year}년 {month}월 {number}번", difficulty="중")
+        for year in (2023, 2024) for month in (3, 6, 9, 11) for number in range(1, 6)
+    ]
+    db.add_all(problems)
+    db.commit()
+    problem_ids = [problem.problem_id for problem in problems]
+    db.close()
+
+    # 문제 파일은 임시 폴더에 저장 (라우터 모듈의 UPLOAD_DIR을 바꿈)
+    route = next(route for route in main.app.routes if getattr(route, "path", None) == "/problems/admin/problems")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(sys.modules[route.endpoint.__module__], "UPLOAD_DIR", str(tmp_path_factory.mktemp("problems")))
+        yield Context(client, seed, problem_ids)
+
+
+def test_every_route_is_checked():
+    missing = app_routes() - ROUTE_REQUESTS.keys() - NO_SQL_ROUTES
+    assert not missing, f"ROUTE_REQUESTS에 요청이 없는 경로: {sorted(missing)}"
+
+
+@pytest.mark.parametrize("method,path", sorted(ROUTE_REQUESTS), ids=lambda value: value)
+def test_route_query_plans(method, path, plan_context):
+    assert (method, path) in app_routes()
+
+    for request in ROUTE_REQUESTS[(method, path)](plan_context):
+        allow = request.pop("allow", ())
+        with query_plan_check(allow=allow):
+            response = plan_context.client.request(**request)
+        assert response.status_code < 400, (request["url"], response.text)
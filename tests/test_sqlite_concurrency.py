@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import joinedload, selectinload
+
+from database import Base, create_sqlite_engines
+from models.comment import Comment
+from models.post import Post
+from models.user import User
+from utils.post_counts import adjust_counts, get_count
+from utils.view_counter import ViewCounter
+
+# 동시 쓰기/읽기 부하 테스트 (SQLite 프로필별)
+# - 쓰기 스레드: 댓글 추가 + 카운터 증가를 한 트랜잭션으로 커밋
+# - 읽기 스레드: 게시글 목록(작성자/태그 포함), 댓글 수 조회 + 조회수 증가
+# - 조회수 반영 스레드: ViewCounter.flush()를 계속 실행 (운영 서버의 백그라운드 반영과 같은 UPDATE)
+# - "database is locked" 오류, 연결 풀 대기 시간 초과가 한 번도 없어야 하고 쓴 내용이 모두 남아 있어야 함
+
+WRITERS = 8
+WRITES_PER_WRITER = 20
+READERS = 8
+POSTS = 20
+
+
+@pytest.fixture(params=["default", "production"])
+def stress_db(request, tmp_path):
+    engine, read_engine, session_factory = create_sqlite_engines(f"sqlite:///{tmp_path}/stress.db", request.param)
+    Base.metadata.create_all(bind=engine)
+
+    db = session_factory()
+    user = User(name="writer", email="writer@test.com", password="-", nickname="작성자")
+    db.add(user)
+    db.flush()
+    db.add_all([
+        Post(user_id=user.user_id, title=f"게시글 {i}", content="내용", category="영어지식", view_count=0)
+        for i in range(POSTS)
+    ])
+    db.commit()
+    post_ids = [post_id for (post_id,) in db.query(Post.post_id)]
+    user_id = user.user_id
+    db.close()
+
+    yield engine, session_factory, user_id, post_ids
+
+    engine.dispose()
+    read_engine.dispose()
+
+
+def test_concurrent_writers_and_readers(stress_db, capsys):
+    engine, session_factory, user_id, post_ids = stress_db
+    view_counter = ViewCounter(bind=engine)
+    errors = []
+    views = [0] * READERS
+    done = threading.Event()
+
+    def writer(n: int):
+        for i in range(WRITES_PER_WRITER):
+            db = session_factory()
+            try:
+                db.add(Comment(post_id=post_ids[(n + i) % POSTS], user_id=user_id, content=f"댓글 {n}-{i}"))
+                adjust_counts(db, {"stress": 1})
+                db.commit()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                db.close()
+
+    def reader(n: int):
+        while not done.is_set():
+            db = session_factory()
+            try:
+                posts = db.query(Post).options(joinedload(Post.author), selectinload(Post.tags)).order_by(
+                    Post.created_at.desc()
+                ).limit(10).all()
+                db.query(func.count(Comment.comment_id)).scalar()
+                for post in posts:
+                    view_counter.increment(post.post_id)
+                views[n] += len(posts)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                db.close()
+            time.sleep(0.001)  # 다른 스레드에 GIL 양보 (읽기만 계속 실행되지 않도록)
+
+    def flusher():
+        while not done.is_set():
+            view_counter.flush()
+            time.sleep(0.005)
+
+    readers = [threading.Thread(target=reader, args=(n,)) for n in range(READERS)]
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(WRITERS)]
+    background = threading.Thread(target=flusher)
+    for thread in readers + [background] + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers + [background]:
+        thread.join()
+    view_counter.flush()
+
+    locked = [e for e in errors if "database is locked" in str(e)]
+    timeouts = [e for e in errors if isinstance(e, PoolTimeoutError)]
+    assert not locked, locked[:3]
+    assert not timeouts, timeouts[:3]
+    assert not errors, errors[:3]
+    assert "조회수 반영 실패" not in capsys.readouterr().out
+
+    # 쓰기와 조회수 반영이 빠짐없이 남아 있는지 확인
+    db = session_factory()
+    try:
+        assert db.query(func.count(Comment.comment_id)).scalar() == WRITERS * WRITES_PER_WRITER
+        assert get_count(db, "stress") == WRITERS * WRITES_PER_WRITER
+        assert db.query(func.sum(Post.view_count)).scalar() == sum(views)
+    finally:
+        db.close()
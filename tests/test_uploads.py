@@ -0,0 +1,91 @@
+import hashlib
+import time
+import os
+from urllib.parse import urlsplit
+
+from routers.blog import UPLOAD_DIR, remove_post_images
+from utils.uploads import MAX_IMAGE_SIZE, UPLOAD_FORM_OVERHEAD, UPLOAD_GRACE_SECONDS, store_file
+
+
+def test_problem_file_downloads_with_readable_name(client, seed):
+    content = b"%PDF-1.4 download name " + os.urandom(8).hex().encode()
+    response = client.post(
+        "/problems/admin/problems", headers=seed["admin_headers"],
+        data={"year": 2019, "month": 9, "number": 7, "title": "다운로드 이름", "difficulty": "하"},
+        files={"file": ("원본 이름.pdf", content, "application/pdf")}
+    )
+    assert response.status_code == 201, response.text
+    file_url = response.json()["file_url"]
+    file_path = urlsplit(file_url).path.lstrip("/")
+
+    try:
+        # 저장은 해시 이름, 다운로드는 {연도}_{월}_{번호}.확장자
+        download = client.get(file_url)
+        assert download.status_code == 200
+        assert download.content == content
+        assert download.headers["content-disposition"] == 'attachment; filename="2019_9_7.pdf"'
+        assert download.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+        # 주소를 바꿔 넣은 이름은 무시
+        tampered = client.get(f"/{file_path}?download=a%22%3B.pdf")
+        assert "content-disposition" not in tampered.headers
+    finally:
+        os.remove(file_path)
+
+
+def age_file(path: str):
+    """업로드 후 UPLOAD_GRACE_SECONDS가 지난 파일로 만듦"""
+    old = time.time() - UPLOAD_GRACE_SECONDS - 60
+    os.utime(path, (old, old))
+
+
+def test_post_image_removal_rechecks_shared_files(client, seed):
+    """같은 내용의 이미지는 파일 하나를 같이 쓰므로 삭제 직전에 다시 확인"""
+    digest = hashlib.sha256(os.urandom(16)).hexdigest()
+    file_path = os.path.join(UPLOAD_DIR, f"{digest}.png")
+    image_url = f"/{file_path}"
+    with open(file_path, "wb") as f:
+        f.write(b"shared image")
+    age_file(file_path)
+
+    try:
+        # 정리 작업이 돌기 전에 다른 게시글이 같은 이미지를 사용하기 시작함 → 남김
+        response = client.post("/blog", headers=seed["admin_headers"], json={
+            "title": "같은 이미지", "content": "내용", "category": "영어지식", "image_url": image_url
+        })
+        assert response.status_code == 201, response.text
+        remove_post_images([image_url])
+        assert os.path.exists(file_path)
+
+        # 게시글 삭제 직전에 같은 내용이 다시 업로드됨 (작성 중인 게시글이 쓸 수 있음) → 남김
+        temp_path = os.path.join(UPLOAD_DIR, f"{digest}.part")
+        with open(temp_path, "wb") as f:
+            f.write(b"shared image")
+        store_file(temp_path, UPLOAD_DIR, digest, ".png")
+        client.delete(f"/blog/{response.json()['id']}", headers=seed["admin_headers"]).raise_for_status()
+        assert os.path.exists(file_path)
+
+        # 아무도 쓰지 않고 최근에 올리지도 않은 파일만 삭제
+        age_file(file_path)
+        remove_post_images([image_url])
+        assert not os.path.exists(file_path)
+    finally:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def test_oversized_upload_is_rejected_while_receiving(client):
+    """본문을 받는 단계에서 413 (인증 확인과 multipart 파싱 전에 거절되므로 토큰 없이도 413)"""
+    too_big = b"\0" * (MAX_IMAGE_SIZE + UPLOAD_FORM_OVERHEAD + 1)
+
+    # Content-Length로 바로 거절
+    response = client.post("/blog/images", content=too_big, headers={"Content-Type": "multipart/form-data; boundary=x"})
+    assert response.status_code == 413
+
+    # Content-Length 없이 (chunked) 보내면 받은 크기로 거절
+    def chunks():
+        for start in range(0, len(too_big), UPLOAD_FORM_OVERHEAD):
+            yield too_big[start:start + UPLOAD_FORM_OVERHEAD]
+
+    response = client.post("/blog/images", content=chunks(), headers={"Content-Type": "multipart/form-data; boundary=x"})
+    assert response.status_code == 413
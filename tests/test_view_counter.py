@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from database import engine, SessionLocal
+from models.post import Post
+from utils.view_counter import view_counter
+
+
+def stored(post_id: int):
+    db = SessionLocal()
+    try:
+        return db.query(Post.view_count, Post.updated_at).filter(Post.post_id == post_id).one()
+    finally:
+        db.close()
+
+
+def test_flush_keeps_updated_at(client, seed):
+    post_id = seed["post_ids"][1]
+    edited_at = datetime(2024, 1, 2, 3, 4, 5)
+    with engine.begin() as conn:
+        conn.execute(update(Post).where(Post.post_id == post_id).values(updated_at=edited_at))
+    before = stored(post_id).view_count
+
+    view_counter.increment(post_id, 3)
+    view_counter.flush()
+
+    view_count, updated_at = stored(post_id)
+    assert view_count == before + 3
+    assert updated_at == edited_at
+
+
+def test_flush_counts_from_zero_when_null(client, seed):
+    post_id = seed["post_ids"][2]
+    with engine.begin() as conn:
+        conn.execute(update(Post).where(Post.post_id == post_id).values(view_count=None))
+
+    view_counter.increment(post_id, 2)
+    view_counter.flush()
+
+    assert stored(post_id).view_count == 2
+
+
+def test_post_page_view_count_is_not_cached(client, seed):
+    post_id = seed["post_ids"][3]
+    view_counter.flush()
+    before = stored(post_id).view_count or 0
+
+    # 첫 요청에서 만든 조각이 캐시된 뒤에도 조회수는 최신 값 (반영된 값 + 대기 중인 증가분)
+    client.get(f"/posts/{post_id}")
+    view_counter.flush()
+    view_counter.increment(post_id, 2)
+
+    html = client.get(f"/posts/{post_id}").text
+    assert f"INITIAL_DATA.post.view_count = {before + 3};" in html
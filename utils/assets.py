@@ -0,0 +1,172 @@
+from fastapi.staticfiles import StaticFiles
+from fastapi.responses import Response, HTMLResponse
+from starlette.datastructures import Headers, QueryParams
+from jinja2 import FileSystemLoader
+from utils.encoding import accepts_encoding
+import mimetypes
+import hashlib
+import gzip
+import re
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 정적 파일 캐싱
+# - static/ 아래 파일을 서버 시작 시 읽어서 내용 해시를 붙인 이름을 만듦
+#   예) /static/css/common.css → /static/css/common.3f2a9c1b0d4e.css
+# - 해시가 붙은 주소는 내용이 바뀌면 주소도 바뀌므로 1년 동안 캐시 (immutable)
+# - 텍스트 파일(css, js 등)은 gzip/brotli(설치된 경우)로 미리 압축해두고 Accept-Encoding에 맞게 응답
+# - HTML(templates/)의 /static/... 주소는 템플릿을 불러올 때 해시가 붙은 주소로 바꿈 (HTML 자체는 매번 재검증)
+# - 해시 이름으로 저장되는 업로드 파일(utils/uploads.py, utils/images.py)도 immutable 캐시
+
+STATIC_DIR = "static"
+STATIC_URL = "/static/"
+IMMUTABLE = "public, max-age=31536000, immutable"
+COMPRESSIBLE = {".css", ".js", ".svg", ".json", ".txt", ".html", ".map"}
+MIN_COMPRESS_SIZE = 256
+
+STATIC_REF = re.compile(r"/static/([\w./-]+)")
+CONTENT_HASH_NAME = re.compile(r"^[0-9a-f]{64}(_\w+)?\.\w+$")
+DOWNLOAD_NAME = re.compile(r"^[A-Za-z0-9_-]+\.[A-Za-z0-9]+$")
+
+
+def media_type(path: str) -> str:
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+class Asset:
+    def __init__(self, path: str, content: bytes):
+        self.path = path
+        self.content = content
+        self.media_type = media_type(path)
+        self.etag = '"' + hashlib.md5(content).hexdigest() + '"'
+        self.encoded = {}
+        if os.path.splitext(path)[1] in COMPRESSIBLE and len(content) >= MIN_COMPRESS_SIZE:
+            if brotli:
+                self.encoded["br"] = brotli.compress(content, quality=11)
+            self.encoded["gzip"] = gzip.compress(content, compresslevel=9)
+
+
+class AssetManifest:
+    """static/ 파일 목록 (원래 경로 → 해시 경로) 과 미리 압축한 내용"""
+
+    def __init__(self, directory: str = STATIC_DIR):
+        self.directory = directory
+        self.urls: dict[str, str] = {}      # "css/common.css" → "css/common.3f2a9c1b0d4e.css"
+        self.assets: dict[str, Asset] = {}  # 해시 경로 → Asset
+
+    def build(self):
+        urls, assets = {}, {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                full_path = os.path.join(root, name)
+                path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+                with open(full_path, "rb") as f:
+                    content = f.read()
+                stem, extension = os.path.splitext(path)
+                hashed = f"{stem}.{hashlib.md5(content).hexdigest()[:12]}{extension}"
+                urls[path] = hashed
+                assets[hashed] = Asset(hashed, content)
+        self.urls, self.assets = urls, assets
+        print(f"정적 파일 {len(assets)}개 준비 (압축 {sum(1 for a in assets.values() if a.encoded)}개)")
+
+    def url(self, path: str) -> str:
+        """원래 경로의 해시 주소 (목록에 없으면 원래 주소)"""
+        return STATIC_URL + self.urls.get(path, path)
+
+    def rewrite(self, html: str) -> str:
+        """HTML 안의 /static/... 주소를 해시 주소로 변경"""
+        return STATIC_REF.sub(lambda match: self.url(match.group(1)), html)
+
+
+asset_manifest = AssetManifest()
+
+
+def choose_encoding(request_headers: Headers, asset: Asset):
+    accepted = request_headers.get("accept-encoding", "")
+    for encoding in ("br", "gzip"):
+        if encoding in asset.encoded and accepts_encoding(accepted, encoding):
+            return encoding
+    return None
+
+
+class AssetFiles(StaticFiles):
+    """static/ 마운트: 해시 주소는 메모리에서 immutable로, 원래 주소는 매번 재검증"""
+
+    def __init__(self, manifest: AssetManifest = asset_manifest, **kwargs):
+        super().__init__(directory=manifest.directory, **kwargs)
+        self.manifest = manifest
+
+    async def get_response(self, path: str, scope) -> Response:
+        asset = self.manifest.assets.get(path.replace(os.sep, "/"))
+        if asset is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        headers = {"Cache-Control": IMMUTABLE, "ETag": asset.etag, "Vary": "Accept-Encoding"}
+        request_headers = Headers(scope=scope)
+        if request_headers.get("if-none-match") == asset.etag:
+            return Response(status_code=304, headers=headers)
+
+        content = asset.content
+        encoding = choose_encoding(request_headers, asset)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            content = asset.encoded[encoding]
+        return Response(content=content, media_type=asset.media_type, headers=headers)
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+class TemplateFiles(StaticFiles):
+    """
+    templates/ 마운트: HTML을 Jinja2 환경(AssetLoader)으로 렌더링해서 응답
+    - /static/ 주소는 해시 주소로 바뀌고, 서버 렌더링용 변수는 비어 있으므로 빈 틀 그대로 응답
+    """
+
+    def __init__(self, env, **kwargs):
+        super().__init__(**kwargs)
+        self.env = env
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        if not str(full_path).endswith(".html"):
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        name = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        html = self.env.get_template(name).render()
+        etag = '"' + hashlib.md5(html.encode()).hexdigest() + '"'
+        headers = {"Cache-Control": "no-cache", "ETag": etag}
+        if Headers(scope=scope).get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(html, status_code=status_code, headers=headers)
+
+
+class UploadFiles(StaticFiles):
+    """uploads/ 마운트: 내용 해시 이름의 파일은 immutable 캐시, ?download=이름 이면 그 이름으로 다운로드"""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if CONTENT_HASH_NAME.match(os.path.basename(str(full_path))):
+            response.headers["Cache-Control"] = IMMUTABLE
+        # ?download=이름 이 있으면 그 이름으로 저장되도록 (utils/uploads.py의 download_url)
+        download_name = QueryParams(scope.get("query_string", b"")).get("download")
+        if download_name and DOWNLOAD_NAME.match(download_name):
+            response.headers["Content-Disposition"] = f'attachment; filename="{download_name}"'
+        return response
+
+
+class AssetLoader(FileSystemLoader):
+    """Jinja2 템플릿 로더: 템플릿의 /static/ 주소를 해시 주소로 변경"""
+
+    def __init__(self, searchpath, manifest: AssetManifest = asset_manifest):
+        super().__init__(searchpath)
+        self.manifest = manifest
+
+    def get_source(self, environment, template):
+        source, filename, uptodate = super().get_source(environment, template)
+        return self.manifest.rewrite(source), filename, uptodate
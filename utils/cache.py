@@ -0,0 +1,169 @@
+from collections import OrderedDict
+import threading
+import json
+import time
+import os
+
+import redis
+from starlette.concurrency import run_in_threadpool
+
+from database import redis_client
+
+# 응답 캐시
+# - memory: 프로세스 내부 LRU (서버 여러 대/워커 여러 개면 각자 따로 캐시)
+# - redis: database.redis_client 를 사용하는 공유 캐시
+#   (Redis를 사용할 수 없는 동안은 프로세스 내부 LRU로 대신하고, 다시 연결되면 Redis 쪽 캐시를 비움)
+# - 각 항목은 여러 개의 scope(예: "category:영어지식", "tag:문법")에 속하고,
+#   invalidate(scope)로 해당 scope에 속한 항목만 골라서 지움
+# - 캐시 메서드는 동기 함수 (redis 백엔드는 동기 redis-py 클라이언트)
+#   async def 핸들러에서는 run_cache_io()로 호출 (redis면 스레드풀에서 실행, 이벤트 루프를 막지 않도록)
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+
+
+class LRUCache:
+    """프로세스 내부 LRU 캐시"""
+
+    blocking = False  # 네트워크 I/O 없음 (이벤트 루프에서 바로 호출해도 됨)
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: int = CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._items = OrderedDict()  # key -> (만료 시각, 값)
+        self._scopes = {}            # scope -> key 집합
+        self._key_scopes = {}        # key -> 속한 scope 목록 (항목이 빠질 때 scope 집합에서도 제거)
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str):
+        """항목과 scope 색인을 같이 제거 (빈 scope 집합도 삭제, 락을 잡은 상태에서 호출)"""
+        self._items.pop(key, None)
+        for scope in self._key_scopes.pop(key, ()):
+            keys = self._scopes.get(scope)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._scopes[scope]
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, scopes: list[str] = (), ttl: int = None):
+        with self._lock:
+            # 같은 키를 다른 scope로 다시 저장하는 경우 이전 색인 제거
+            self._remove(key)
+            self._items[key] = (time.monotonic() + (ttl or self.ttl), value)
+            if scopes:
+                self._key_scopes[key] = tuple(scopes)
+                for scope in scopes:
+                    self._scopes.setdefault(scope, set()).add(key)
+
+            # 가장 오래 사용되지 않은 항목부터 제거
+            while len(self._items) > self.max_entries:
+                self._remove(next(iter(self._items)))
+
+    def invalidate(self, scopes: list[str]):
+        with self._lock:
+            for scope in scopes:
+                for key in list(self._scopes.get(scope, ())):
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._scopes.clear()
+            self._key_scopes.clear()
+
+
+class RedisCache:
+    """Redis 공유 캐시 (값은 JSON 문자열로 저장)"""
+
+    blocking = True  # Redis 응답을 기다림 (장애 시 최대 REDIS_SOCKET_TIMEOUT 초)
+
+    def __init__(self, client, prefix: str = "cache", ttl: int = CACHE_TTL):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.fallback = LRUCache(ttl=ttl)
+        # 끊긴 동안의 무효화는 Redis에 반영되지 않았으므로 다시 연결되면 비움
+        client.on_recover(self.clear)
+
+    def _scope_key(self, scope: str):
+        return f"{self.prefix}:scope:{scope}"
+
+    def get(self, key: str):
+        if not self.client:
+            return self.fallback.get(key)
+        try:
+            raw = self.client.get(f"{self.prefix}:{key}")
+        except redis.RedisError:
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value, scopes: list[str] = (), ttl: int = None):
+        if not self.client:
+            return self.fallback.set(key, value, scopes, ttl)
+        full_key = f"{self.prefix}:{key}"
+        ttl = ttl or self.ttl
+        try:
+            pipe = self.client.pipeline()
+            pipe.setex(full_key, ttl, json.dumps(value, ensure_ascii=False))
+            for scope in scopes:
+                pipe.sadd(self._scope_key(scope), full_key)
+                pipe.expire(self._scope_key(scope), max(ttl, self.ttl) * 2)
+            pipe.execute()
+        except redis.RedisError:
+            pass
+
+    def invalidate(self, scopes: list[str]):
+        # 내부 LRU도 항상 같이 무효화 (Redis가 끊겼을 때 오래된 항목이 나오지 않도록)
+        self.fallback.invalidate(scopes)
+        if not self.client:
+            return
+        try:
+            for scope in scopes:
+                scope_key = self._scope_key(scope)
+                keys = self.client.smembers(scope_key)
+                self.client.delete(scope_key, *keys)
+        except redis.RedisError:
+            pass
+
+    def clear(self):
+        self.fallback.clear()
+        if not self.client:
+            return
+        try:
+            keys = list(self.client.scan_iter(f"{self.prefix}:*"))
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+async def run_cache_io(cache, func, *args):
+    """
+    async def 핸들러에서 cache를 사용하는 동기 함수 호출
+    - Redis 캐시면 스레드풀에서 실행 (Redis 응답 대기/장애 시 타임아웃 동안 이벤트 루프가 멈추지 않도록)
+    - 메모리 캐시면 그대로 호출 (스레드풀을 거치는 비용이 더 큼)
+    """
+    if cache.blocking:
+        return await run_in_threadpool(func, *args)
+    return func(*args)
+
+
+def create_cache(prefix: str, ttl: int = CACHE_TTL):
+    """설정(CACHE_BACKEND)에 맞는 캐시 백엔드 생성"""
+    if CACHE_BACKEND == "redis":
+        return RedisCache(redis_client, prefix=prefix, ttl=ttl)
+    return LRUCache(ttl=ttl)
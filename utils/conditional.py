@@ -0,0 +1,128 @@
+from fastapi import Request, Response
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import hashlib
+
+from models.post import Post
+from models.comment import Comment
+from models.user import User
+
+# 조건부 GET (ETag / Last-Modified / 304)
+# - 게시글 수정 시간, 가장 최근 댓글 시간, 댓글 수로 검증값을 만들고
+# - 브라우저가 보낸 If-None-Match / If-Modified-Since와 같으면 본문 없이 304 응답
+# - 조회수는 검증값에 포함하지 않음 (조회할 때마다 바뀌므로)
+# - 응답에 들어가는 작성자/댓글 작성자 닉네임이 바뀌면 User.updated_at이 바뀌므로 이것도 포함
+# - DB의 시간은 서버 로컬 시간 (모델 기본값과 라우터 모두 datetime.now) → 헤더에 쓰거나 비교할 때 UTC로 변환
+
+
+def to_utc(value: datetime) -> datetime:
+    """DB에 저장된 로컬 시간(시간대 없음) → UTC (HTTP 날짜는 초 단위)"""
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+class Validators:
+    def __init__(self, etag: str, last_modified: datetime = None):
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def headers(self) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.last_modified:
+            headers["Last-Modified"] = format_datetime(to_utc(self.last_modified), usegmt=True)
+        return headers
+
+    def apply(self, response: Response):
+        response.headers.update(self.headers())
+
+
+def post_validators_statement(post_id: int):
+    """
+    검증값 계산에 필요한 값 (쿼리 한 번)
+    - 게시글 수정 시간, 이미지 변환 결과, 최근 댓글 시간, 댓글 수
+    - 게시글 작성자와 댓글 작성자들의 정보 수정 시간 (닉네임 변경)
+    """
+    latest_comment = (
+        select(func.max(Comment.updated_at))
+        .where(Comment.post_id == Post.post_id)
+        .scalar_subquery()
+    )
+    comment_count = (
+        select(func.count(Comment.comment_id))
+        .where(Comment.post_id == Post.post_id)
+        .scalar_subquery()
+    )
+    author_updated = (
+        select(User.updated_at)
+        .where(User.user_id == Post.user_id)
+        .scalar_subquery()
+    )
+    commenters_updated = (
+        select(func.max(User.updated_at))
+        .join(Comment, Comment.user_id == User.user_id)
+        .where(Comment.post_id == Post.post_id)
+        .scalar_subquery()
+    )
+    return select(
+        Post.updated_at, Post.image_variants, latest_comment, comment_count, author_updated, commenters_updated
+    ).where(Post.post_id == post_id)
+
+
+def make_validators(kind: str, post_id: int, row):
+    if row is None:
+        return None
+
+    # 이미지 변환 결과는 수정 시간을 바꾸지 않고 기록되므로 검증값에 포함
+    updated_at, image_variants, latest, count, author_updated, commenters_updated = row
+    raw = f"{kind}:{post_id}:{updated_at}:{image_variants}:{latest}:{count}:{author_updated}:{commenters_updated}"
+    etag = 'W/"' + hashlib.md5(raw.encode()).hexdigest()[:20] + '"'
+
+    last_modified = max(
+        (dt for dt in (updated_at, latest, author_updated, commenters_updated) if dt), default=None
+    )
+    return Validators(etag, last_modified)
+
+
+def post_validators(db: Session, post_id: int, kind: str):
+    """
+    게시글의 검증값 조회 (쿼리 한 번), 게시글이 없으면 None
+    - kind: 응답 종류 ("post", "comments") — 같은 게시글이라도 응답마다 ETag를 다르게
+    - 조회수(view_count)는 게시글 응답 본문에 있지만 검증값에는 넣지 않음
+      → 304 응답을 받은 브라우저는 이전에 받은 조회수를 그대로 보여줌 (내용이 바뀔 때까지 조회수는 갱신되지 않음)
+      → 대신 같은 사람이 다시 조회해도 검증값이 바뀌지 않아 304로 응답할 수 있음
+        (조회수 반영(utils/view_counter.py)은 updated_at을 바꾸지 않음)
+    """
+    row = db.execute(post_validators_statement(post_id)).first()
+    return make_validators(kind, post_id, row)
+
+
+async def post_validators_async(db, post_id: int, kind: str):
+    """post_validators의 비동기 세션 버전"""
+    row = (await db.execute(post_validators_statement(post_id))).first()
+    return make_validators(kind, post_id, row)
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """요청의 조건부 헤더와 검증값이 같은지 확인 (If-None-Match 우선)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # 약한 비교: W/ 접두어는 무시
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or validators.etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validators.last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return to_utc(validators.last_modified) <= since
+
+    return False
+
+
+def not_modified_response(validators: Validators) -> Response:
+    return Response(status_code=304, headers=validators.headers())
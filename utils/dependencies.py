@@ -2,10 +2,15 @@ from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 from database import get_db
 from models.user import User
 from models.post import Post
+from utils.cache import create_cache
+import threading
+import hashlib
+import time
+import os
 
 SECRET_KEY = "TEST-ASDASDASDASDASDASDASDSA"
 ALGORITHM = "HS256"
@@ -13,41 +18,108 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# 인증된 사용자 캐시 (토큰 → 사용자 정보)
+# - 같은 토큰으로 다시 요청하면 JWT 검증과 DB 조회를 건너뜀
+# - 비밀번호 해시는 캐시하지 않음 (필요할 때 DB에서 불러옴)
+# - 프로필/비밀번호/권한이 바뀌면 invalidate_user()로 바로 제거
+AUTH_CACHE_TTL = int(os.getenv("AUTH_CACHE_TTL", "60"))
+user_cache = create_cache("auth:user", ttl=AUTH_CACHE_TTL)
+user_cache_stats = {"hits": 0, "misses": 0}
+_user_cache_stats_lock = threading.Lock()  # 동기 의존성이라 스레드풀의 여러 스레드에서 동시에 갱신됨
+
+CACHED_USER_FIELDS = ("user_id", "email", "name", "nickname", "role")
+
 def create_token(user_id: int):
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     token_data = {"sub": str(user_id), "exp": expire}
     return jwt.encode(token_data, SECRET_KEY, algorithm=ALGORITHM)
 
-# JWT 토큰 검증 dependency
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def user_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def count_user_cache(hit: bool):
+    with _user_cache_stats_lock:
+        user_cache_stats["hits" if hit else "misses"] += 1
+
+
+def user_cache_summary() -> dict:
+    """인증 캐시 적중/실패 횟수 (/health 에서 확인)"""
+    with _user_cache_stats_lock:
+        return dict(user_cache_stats)
+
+
+def invalidate_user(user_id: int):
+    """사용자 정보가 바뀌었을 때 그 사용자의 캐시를 모두 제거"""
+    user_cache.invalidate([f"user:{user_id}"])
+
+
+def cached_user(token: str):
+    """캐시에 있는 사용자 정보로 만든 (세션에 연결되지 않은) User 객체, 없으면 None"""
+    snapshot = user_cache.get(user_cache_key(token))
+    count_user_cache(hit=snapshot is not None)
+    if snapshot is None:
+        return None
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+def decode_user_id(token: str) -> tuple[int, float]:
+    """JWT 토큰 검증 후 (사용자 ID, 만료 시각) 반환"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id_str = payload.get("sub")
-        
-        if user_id_str is None:
-            raise HTTPException(status_code=401, detail="토큰이 유효하지 않습니다.")
-        
-        # 문자열을 다시 정수로 변환
-        user_id = int(user_id_str)
-        
-        # DB에서 사용자 조회
-        user = db.query(User).filter(User.user_id == user_id).first()
-        if user is None:
-            raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
-        
-        return user
     except JWTError:
         raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
 
+    user_id_str = payload.get("sub")
+    if user_id_str is None:
+        raise HTTPException(status_code=401, detail="토큰이 유효하지 않습니다.")
+
+    # 문자열을 다시 정수로 변환
+    return int(user_id_str), payload["exp"]
+
+
+def remember_user(token: str, user: User, expires_at: float):
+    """토큰 만료 시간을 넘지 않도록 캐시"""
+    if user is None:
+        raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
+
+    ttl = min(AUTH_CACHE_TTL, int(expires_at - time.time()))
+    if ttl > 0:
+        snapshot = {field: getattr(user, field) for field in CACHED_USER_FIELDS}
+        user_cache.set(user_cache_key(token), snapshot, [f"user:{user.user_id}"], ttl=ttl)
+
+
+# JWT 토큰 검증 dependency
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    # 캐시에 있으면 DB 조회 없이 세션에 연결된 User 객체로 복원
+    user = cached_user(token)
+    if user is not None:
+        return db.merge(user, load=False)
+
+    user_id, expires_at = decode_user_id(token)
+
+    # DB에서 사용자 조회
+    user = db.query(User).filter(User.user_id == user_id).first()
+    remember_user(token, user, expires_at)
+    return user
+
 # 관리자 권한 체크 dependency
-def get_current_admin(current_user: User = Depends(get_current_user)):
+def check_admin(current_user: User):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
     return current_user
 
+def get_current_admin(current_user: User = Depends(get_current_user)):
+    return check_admin(current_user)
+
 # 게시글 존재 확인
-def get_post_check(db: Session, post_id: int):
-    post = db.query(Post).filter(Post.post_id == post_id).first()
+def check_found(post: Post):
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
-    return post
\ No newline at end of file
+    return post
+
+def get_post_check(db: Session, post_id: int):
+    return check_found(db.query(Post).filter(Post.post_id == post_id).first())
+
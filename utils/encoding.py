@@ -0,0 +1,47 @@
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+
+# Accept-Encoding 협상 (q 값 포함)
+# - "gzip;q=0" 처럼 q=0 으로 거부한 인코딩은 사용하지 않음
+# - 목록에 없는 인코딩은 "*" 의 q 값을 따름 ("*" 도 없으면 사용하지 않음)
+# - Starlette의 GZipMiddleware는 헤더에 "gzip" 글자가 있는지만 보므로 q 값을 보는 버전으로 교체
+
+
+def accepted_encodings(header: str) -> dict[str, float]:
+    """Accept-Encoding 헤더 → {인코딩: q 값}"""
+    encodings = {}
+    for item in header.split(","):
+        name, *params = [part.strip() for part in item.split(";")]
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        encodings[name.lower()] = q
+    return encodings
+
+
+def accepts_encoding(header: str, encoding: str) -> bool:
+    encodings = accepted_encodings(header)
+    return encodings.get(encoding, encodings.get("*", 0.0)) > 0
+
+
+class NegotiatedGZipMiddleware(GZipMiddleware):
+    """q 값을 확인하는 GZipMiddleware (gzip;q=0 이면 압축하지 않음)"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if accepts_encoding(Headers(scope=scope).get("accept-encoding", ""), "gzip"):
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -0,0 +1,67 @@
+from jinja2 import Environment
+from markupsafe import Markup, escape
+from datetime import datetime
+import os
+
+from utils.assets import AssetLoader
+from utils.cache import create_cache, CACHE_TTL
+
+# 서버 렌더링 페이지(routers/pages.py)용 템플릿 환경과 HTML 조각 캐시
+# - 게시글 상세: 게시글 본문/댓글 목록 조각과 페이지에 넣을 데이터를 게시글마다 캐시 (scope "post:{id}")
+# - 게시글 목록: 목록 페이지마다 캐시 (scope는 목록 응답 캐시와 같은 "all", "category:...", "tag:...")
+# - 게시글 작성/수정/삭제(routers/blog.py), 댓글 작성/수정/삭제(routers/comment.py) 시 해당 scope 무효화
+#   이미지 변환 완료(utils/image_pipeline.py), 닉네임 변경(routers/auth.py) 때도 관련 게시글 scope 무효화
+# - 로그인한 사용자에 따라 달라지는 부분(수정/삭제 버튼 등)은 조각에 넣지 않고 브라우저에서 처리
+
+# 게시글 상세 조각에는 조회수를 넣지 않으므로 (routers/pages.py에서 매번 계산) 목록보다 오래 보관
+POST_FRAGMENT_TTL = int(os.getenv("POST_FRAGMENT_TTL", "300"))
+
+fragment_cache = create_cache("blog:fragment", ttl=CACHE_TTL)
+
+
+def post_scope(post_id: int) -> str:
+    return f"post:{post_id}"
+
+
+def cached_fragment(key: str, scopes: list[str], render, ttl: int = None) -> dict:
+    """캐시된 조각이 있으면 반환, 없으면 render()로 만들어서 저장"""
+    fragment = fragment_cache.get(key)
+    if fragment is None:
+        fragment = render()
+        fragment_cache.set(key, fragment, scopes, ttl=ttl)
+    return fragment
+
+
+def to_datetime(value) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def format_date(value) -> str:
+    """2025. 1. 5. (브라우저의 toLocaleDateString('ko-KR')과 같은 형식)"""
+    if not value:
+        return ""
+    value = to_datetime(value)
+    return f"{value.year}. {value.month}. {value.day}."
+
+
+def format_datetime(value) -> str:
+    """2025. 1. 5. 오후 3:07:09 (브라우저의 toLocaleString('ko-KR')과 같은 형식)"""
+    if not value:
+        return ""
+    value = to_datetime(value)
+    period = "오전" if value.hour < 12 else "오후"
+    return f"{format_date(value)} {period} {value.hour % 12 or 12}:{value.minute:02d}:{value.second:02d}"
+
+
+def nl2br(text: str) -> Markup:
+    """줄바꿈을 <br>로 변경 (내용은 이스케이프)"""
+    return Markup("<br>").join(escape(line) for line in (text or "").split("\n"))
+
+
+# Jinja2 템플릿 환경 (/static/ 주소는 해시 주소로 변경, utils/assets.py)
+template_env = Environment(loader=AssetLoader("templates"), autoescape=True)
+template_env.filters.update(date_ko=format_date, datetime_ko=format_datetime, nl2br=nl2br)
+
+
+def render(name: str, **context) -> str:
+    return template_env.get_template(name).render(**context)
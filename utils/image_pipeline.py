@@ -0,0 +1,105 @@
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy import update
+import multiprocessing
+import json
+import os
+
+from database import engine
+from models.post import Post
+from utils.images import build_variants, variant_formats, variant_path
+
+# 게시글 이미지 변환 파이프라인
+# - 이미지 업로드 요청은 원본만 저장하고 바로 응답, 변환은 프로세스 풀에서 실행
+# - 변환이 끝나면 그 이미지를 쓰는 게시글의 Post.image_variants 에 변환 파일 URL 기록
+#   + on_recorded로 등록한 함수 실행 (routers/blog.py: 해당 게시글의 목록/상세 캐시 무효화)
+# - 게시글 작성/수정 시에는 variants_for()로 이미 만들어진 변환 파일을 바로 기록
+#   (변환이 아직 안 끝났으면 끝날 때 위의 방식으로 기록됨)
+
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+
+def to_url(path: str) -> str:
+    return "/" + path.lstrip("/")
+
+
+def variants_for(image_url: str) -> dict[str, str] | None:
+    """원본 이미지의 변환 파일이 모두 만들어져 있으면 {종류: URL}, 아니면 None"""
+    if not image_url:
+        return None
+    source_path = image_url.lstrip("/")
+    variants = {}
+    for name, extension in variant_formats(source_path):
+        path = variant_path(source_path, name, extension)
+        if not os.path.exists(path):
+            return None
+        variants[name] = to_url(path)
+    return variants
+
+
+def variant_files(image_url: str) -> list[str]:
+    """원본 이미지의 변환 파일 경로 목록 (이미지 삭제 시 사용)"""
+    source_path = image_url.lstrip("/")
+    return [variant_path(source_path, name, extension) for name, extension in variant_formats(source_path)]
+
+
+def record_variants(image_url: str, variants: dict[str, str]):
+    """이 이미지를 쓰는 게시글에 변환 파일 URL 기록 (수정 시간은 그대로 유지)"""
+    with engine.begin() as conn:
+        conn.execute(
+            update(Post)
+            .where(Post.image_url == image_url)
+            .values(image_variants=json.dumps(variants), updated_at=Post.updated_at)
+        )
+
+
+class ImagePipeline:
+    def __init__(self, workers: int = IMAGE_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._recorded_callbacks = []
+
+    def on_recorded(self, callback):
+        """변환 결과를 게시글에 기록한 뒤 실행할 함수 등록 (callback(image_url), 캐시 무효화용)"""
+        self._recorded_callbacks.append(callback)
+
+    def _get_executor(self):
+        if self._executor is None:
+            # spawn: 작업 프로세스는 utils.images 만 임포트 (서버의 스레드/연결을 복사하지 않음)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def submit(self, image_url: str):
+        """업로드된 원본 이미지의 변환 작업 등록 (이미 변환된 이미지는 건너뜀)"""
+        if variants_for(image_url) is not None:
+            return None
+        future = self._get_executor().submit(build_variants, image_url.lstrip("/"))
+        future.add_done_callback(lambda done: self._on_done(image_url, done))
+        return future
+
+    def _on_done(self, image_url: str, future):
+        try:
+            paths = future.result()
+        except Exception as e:
+            print(f"이미지 변환 실패: {image_url} ({e})")
+            return
+        try:
+            record_variants(image_url, {name: to_url(path) for name, path in paths.items()})
+        except Exception as e:
+            print(f"이미지 변환 결과 저장 실패: {image_url} ({e})")
+            return
+        for callback in self._recorded_callbacks:
+            try:
+                callback(image_url)
+            except Exception as e:
+                print(f"이미지 변환 후 처리 실패: {callback} ({e})")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+image_pipeline = ImagePipeline()
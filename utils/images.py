@@ -0,0 +1,60 @@
+from PIL import Image, ImageOps, features
+import os
+
+# 게시글 이미지 변환 (썸네일/중간 크기/WebP)
+# - 프로세스 풀(utils/image_pipeline.py)의 작업 프로세스에서 실행되므로
+#   DB, Redis 등 다른 모듈은 임포트하지 않음
+# - 변환 파일 이름은 원본 이름 뒤에 _{종류} 를 붙여서 만듦
+#   예) uploads/posts/{sha256}.png → {sha256}_thumbnail.jpg, {sha256}_medium.webp
+
+# 종류 → 최대 크기 (가로, 세로)
+VARIANT_SIZES = {
+    "thumbnail": (320, 320),
+    "medium": (1024, 1024),
+}
+JPEG_QUALITY = 80
+WEBP_QUALITY = 75
+WEBP_ENABLED = features.check("webp")
+
+
+def variant_formats(source_path: str) -> list[tuple[str, str]]:
+    """만들 변환 파일 목록 [(종류, 확장자)] — PNG는 투명도를 유지하기 위해 PNG로 저장"""
+    extension = ".png" if source_path.lower().endswith(".png") else ".jpg"
+    formats = []
+    for name in VARIANT_SIZES:
+        formats.append((name, extension))
+        if WEBP_ENABLED:
+            formats.append((f"{name}_webp", ".webp"))
+    return formats
+
+
+def variant_path(source_path: str, name: str, extension: str) -> str:
+    stem = os.path.splitext(source_path)[0]
+    return f"{stem}_{name.removesuffix('_webp')}{extension}"
+
+
+def save_image(image: Image.Image, path: str, extension: str):
+    # 다 쓴 다음 이름을 바꿔서, 쓰는 중인 파일이 응답에 나가지 않도록 함
+    temp_path = f"{path}.part"
+    if extension == ".webp":
+        image.save(temp_path, "WEBP", quality=WEBP_QUALITY, method=4)
+    elif extension == ".png":
+        image.save(temp_path, "PNG", optimize=True)
+    else:
+        image.convert("RGB").save(temp_path, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    os.replace(temp_path, path)
+
+
+def build_variants(source_path: str) -> dict[str, str]:
+    """원본 이미지로 변환 파일을 만들고 {종류: 파일 경로} 반환"""
+    variants = {}
+    with Image.open(source_path) as source:
+        # 휴대폰 사진의 EXIF 회전 정보 반영
+        source = ImageOps.exif_transpose(source)
+        for name, extension in variant_formats(source_path):
+            image = source.copy()
+            image.thumbnail(VARIANT_SIZES[name.removesuffix("_webp")], Image.LANCZOS)
+            path = variant_path(source_path, name, extension)
+            save_image(image, path, extension)
+            variants[name] = path
+    return variants
@@ -0,0 +1,76 @@
+from sqlalchemy import Column, Integer, String, DateTime, text, inspect
+from datetime import datetime
+
+from database import Base
+
+# 간단한 스키마 마이그레이션
+# - create_all 은 없는 테이블만 만들기 때문에, 이미 운영 중인 blog.db 에는
+#   모델에 새로 추가한 인덱스/컬럼이 반영되지 않음
+# - 변경 사항을 MIGRATIONS 에 (버전, 이름, 함수) 로 순서대로 추가하면
+#   아직 적용되지 않은 것만 실행하고 SchemaMigration 테이블에 기록
+# - 각 마이그레이션은 한 트랜잭션 안에서 실행되고, 같은 DB에 여러 번 실행해도 안전하게 작성
+
+
+class SchemaMigration(Base):
+    """적용된 마이그레이션 기록"""
+    __tablename__ = "SchemaMigration"
+
+    version = Column(Integer, primary_key=True)
+    name = Column(String(255), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow)
+
+
+def create_model_indexes(conn):
+    """모델(__table_args__)에 정의된 인덱스 중 DB에 없는 것을 생성"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
+    # 인덱스 생성 후 쿼리 플래너 통계 갱신
+    conn.execute(text("ANALYZE"))
+
+
+def add_post_image_variants(conn):
+    """Post.image_variants 컬럼 추가 (변환 이미지 URL)"""
+    columns = {column["name"] for column in inspect(conn).get_columns("Post")}
+    if "image_variants" not in columns:
+        conn.execute(text('ALTER TABLE "Post" ADD COLUMN image_variants TEXT'))
+
+
+MIGRATIONS = [
+    (1, "query indexes (Post, Comment, PostTag, Problem, UserProblem)", create_model_indexes),
+    (2, "Post.image_variants", add_post_image_variants),
+]
+
+
+def run_migrations(engine) -> list[int]:
+    """아직 적용되지 않은 마이그레이션을 순서대로 실행하고, 적용한 버전 목록 반환"""
+    SchemaMigration.__table__.create(bind=engine, checkfirst=True)
+
+    with engine.connect() as conn:
+        applied = set(conn.execute(text('SELECT version FROM "SchemaMigration"')).scalars())
+
+    newly_applied = []
+    for version, name, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        with engine.begin() as conn:
+            migrate(conn)
+            conn.execute(
+                SchemaMigration.__table__.insert().values(version=version, name=name, applied_at=datetime.utcnow())
+            )
+        print(f"마이그레이션 적용: {version} {name}")
+        newly_applied.append(version)
+    return newly_applied
+
+
+if __name__ == "__main__":
+    # 운영 DB에 마이그레이션 적용: python -m utils.migrations
+    from database import engine
+    from models.user import User
+    from models.post import Post, Tag, PostTag, PostCount
+    from models.comment import Comment
+    from models.problem import Problem, UserProblem
+
+    Base.metadata.create_all(bind=engine)
+    applied = run_migrations(engine)
+    print(f"✅ 마이그레이션 완료 (새로 적용 {len(applied)}개)")
@@ -0,0 +1,124 @@
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, select, func
+from datetime import datetime
+from typing import Optional
+import base64
+
+from models.post import Post
+
+# 게시글 목록 페이지네이션
+# - 페이지 번호 방식: 기존 클라이언트 호환용 (OFFSET 사용, 뒤 페이지일수록 느려짐)
+# - 커서 방식: (created_at, post_id) 기준으로 바로 다음 위치를 찾아가므로 페이지 깊이와 무관하게 일정한 비용
+
+
+def encode_cursor(*values) -> str:
+    """마지막 항목의 정렬 기준 값들을 불투명한 커서 문자열로 변환"""
+    raw = "|".join(v.isoformat() if isinstance(v, datetime) else str(v) for v in values)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """커서 문자열을 다시 값으로 변환 (types: 각 값의 변환 함수)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded).decode().split("|")
+        if len(parts) != len(types):
+            raise ValueError(cursor)
+        return tuple(convert(part) for convert, part in zip(types, parts))
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+
+
+def order_posts(query, sort: str):
+    """작성 시간 기준 정렬 (같은 시간이면 ID로 순서 고정)"""
+    if sort == "desc":
+        return query.order_by(Post.created_at.desc(), Post.post_id.desc())
+    return query.order_by(Post.created_at.asc(), Post.post_id.asc())
+
+
+def seek_after(query, cursor: str, sort: str):
+    """커서 위치 다음 게시글부터 조회하도록 조건 추가"""
+    created_at, post_id = decode_cursor(cursor, datetime.fromisoformat, int)
+
+    if sort == "desc":
+        return query.filter(or_(
+            Post.created_at < created_at,
+            and_(Post.created_at == created_at, Post.post_id < post_id)
+        ))
+    return query.filter(or_(
+        Post.created_at > created_at,
+        and_(Post.created_at == created_at, Post.post_id > post_id)
+    ))
+
+
+def wants_total(include_total: Optional[bool], cursor: Optional[str]) -> bool:
+    """include_total을 지정하지 않았으면 페이지 번호 방식만 전체 개수 포함 (커서 방식은 COUNT 생략)"""
+    if include_total is None:
+        return not cursor
+    return include_total
+
+
+def page_query(query, page: int, limit: int, cursor: str = None, sort: str = "desc", keyset: bool = True):
+    """
+    이번 페이지 조회 쿼리 (Query, select() 모두 사용 가능)
+    - cursor가 있으면 커서 방식, 없으면 페이지 번호 방식
+    - 한 개 더 가져와서 다음 페이지가 있는지 확인
+    """
+    if cursor and keyset:
+        query = seek_after(query, cursor, sort)
+    else:
+        query = query.offset((page - 1) * limit)
+    return query.limit(limit + 1)
+
+
+def count_statement(stmt):
+    """select() 문의 전체 개수 조회 (비동기 세션용, 동기는 Query.count() 사용)"""
+    return select(func.count()).select_from(stmt.order_by(None).subquery())
+
+
+def page_result(posts: list, page: int, limit: int, keyset: bool, total) -> dict:
+    """page_query로 불러온 게시글로 페이지 응답 구성"""
+    has_more = len(posts) > limit
+    posts = posts[:limit]
+
+    next_cursor = None
+    if keyset and has_more:
+        next_cursor = encode_cursor(posts[-1].created_at, posts[-1].post_id)
+
+    return {
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "posts": posts
+    }
+
+
+def paginate_posts(query, page: int, limit: int, cursor: str = None, sort: str = "desc",
+                   include_total: Optional[bool] = None, keyset: bool = True, total: int = None):
+    """
+    정렬이 끝난 게시글 쿼리를 페이지 단위로 잘라서 반환
+    - cursor가 있으면 커서 방식, 없으면 페이지 번호 방식
+    - keyset=False (관련도순 정렬 등)이면 커서를 만들지 않음
+    - include_total=False이면 COUNT 쿼리를 생략 (total은 None), 지정하지 않으면 커서 방식일 때 생략
+    - total을 넘기면 (미리 집계된 게시글 수) COUNT 대신 그 값을 사용
+    """
+    if not wants_total(include_total, cursor):
+        total = None
+    elif total is None:
+        total = query.order_by(None).count()
+
+    posts = page_query(query, page, limit, cursor, sort, keyset).all()
+    return page_result(posts, page, limit, keyset, total)
+
+
+async def paginate_posts_async(db, stmt, page: int, limit: int, cursor: str = None, sort: str = "desc",
+                               include_total: Optional[bool] = None, keyset: bool = True, total: int = None):
+    """paginate_posts의 비동기 세션 버전 (stmt: 정렬이 끝난 select(Post) 문)"""
+    if not wants_total(include_total, cursor):
+        total = None
+    elif total is None:
+        total = await db.scalar(count_statement(stmt))
+
+    posts = (await db.scalars(page_query(stmt, page, limit, cursor, sort, keyset))).all()
+    return page_result(posts, page, limit, keyset, total)
@@ -0,0 +1,86 @@
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import asyncio
+import time
+import os
+
+# 비밀번호 해싱 전용 작업 풀
+# - bcrypt는 호출 한 번에 수백 ms의 CPU를 쓰므로 요청 처리용 스레드풀과 분리
+# - 동시에 처리/대기할 수 있는 개수를 제한하고, 가득 차면 바로 503으로 거절
+# - 대기 시간과 해싱 시간을 따로 집계 (/health 에서 확인)
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "32"))
+
+
+class PasswordHasher:
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_QUEUE):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self.capacity = workers + max_queue
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.stats = {
+            "completed": 0,
+            "rejected": 0,
+            "in_flight": 0,
+            "queue_wait_ms_total": 0.0,
+            "queue_wait_ms_max": 0.0,
+            "hash_ms_total": 0.0,
+            "hash_ms_max": 0.0,
+        }
+
+    def _acquire(self):
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.stats["rejected"] += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="요청이 많아 잠시 후 다시 시도해주세요.",
+                    headers={"Retry-After": "1"}
+                )
+            self._in_flight += 1
+            self.stats["in_flight"] = self._in_flight
+
+    def _run(self, func, args, submitted_at):
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            finished = time.perf_counter()
+            self._record((started - submitted_at) * 1000, (finished - started) * 1000)
+
+    def _record(self, wait_ms, hash_ms):
+        with self._lock:
+            self._in_flight -= 1
+            self.stats["in_flight"] = self._in_flight
+            self.stats["completed"] += 1
+            self.stats["queue_wait_ms_total"] += wait_ms
+            self.stats["queue_wait_ms_max"] = max(self.stats["queue_wait_ms_max"], wait_ms)
+            self.stats["hash_ms_total"] += hash_ms
+            self.stats["hash_ms_max"] = max(self.stats["hash_ms_max"], hash_ms)
+
+    async def _submit(self, func, *args):
+        self._acquire()
+        future = self.executor.submit(self._run, func, args, time.perf_counter())
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(pwd_context.verify, password, hashed)
+
+    def summary(self) -> dict:
+        with self._lock:
+            stats = dict(self.stats)
+        completed = stats["completed"] or 1
+        stats["queue_wait_ms_avg"] = stats["queue_wait_ms_total"] / completed
+        stats["hash_ms_avg"] = stats["hash_ms_total"] / completed
+        return stats
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,375 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert
+from contextlib import contextmanager
+from datetime import datetime
+import heapq
+import threading
+import time
+import os
+
+import redis
+
+from database import redis_client
+from models.problem import UserProblem, ProblemPopularity
+
+# 문제 인기도
+# - 원본: ProblemPopularity 테이블 (문제 선택 시 같은 트랜잭션 안에서 record_selection()으로 증가)
+# - 조회: Redis sorted set(popular_problems)이 있으면 Redis, 없거나 오류가 나면 프로세스 내부 순위표
+# - 서버 시작 시, 그리고 Redis가 끊겼다가 다시 연결될 때 reconcile_popularity()로
+#   SQL 기준으로 내부 순위표와 Redis sorted set을 다시 만듦 (Redis가 비워져도 인기도가 사라지지 않음)
+#
+# 기간별 인기 순위 (window)
+# - all: 전체 기간 (popular_problems)
+# - hour: 현재 1시간 버킷
+# - day: 최근 24개 1시간 버킷 합계
+# - week: 최근 7개 1일 버킷 합계
+# - 버킷은 popular_problems:hour:{시간 번호}, popular_problems:day:{일 번호} (UTC 기준),
+#   조회할 때 ZUNIONSTORE로 합산
+# - 기간별 순위는 Redis(또는 프로세스 내부)에만 있으므로 Redis가 비워지면 다시 쌓임
+#
+# Redis 반영은 선택할 때마다 하지 않고 메모리에 모아두었다가
+# POPULAR_FLUSH_INTERVAL 초마다 파이프라인 한 번으로 반영 (ViewCounter와 같은 방식)
+
+POPULAR_KEY = "popular_problems"
+POPULAR_FLUSH_INTERVAL = float(os.getenv("POPULAR_FLUSH_INTERVAL", "2"))
+POPULAR_MAX_PENDING = int(os.getenv("POPULAR_MAX_PENDING", "100000"))
+
+HOUR = 3600
+DAY = 24 * HOUR
+WINDOWS = ("all", "hour", "day", "week")
+
+
+def hour_bucket(timestamp: float = None) -> int:
+    return int((timestamp if timestamp is not None else time.time()) // HOUR)
+
+
+def hour_key(hour: int) -> str:
+    return f"{POPULAR_KEY}:hour:{hour}"
+
+
+def day_key(day: int) -> str:
+    return f"{POPULAR_KEY}:day:{day}"
+
+
+def window_buckets(window: str, hour: int) -> tuple[list[int], list[int]]:
+    """기간에 포함되는 (시간 버킷 목록, 일 버킷 목록)"""
+    if window == "hour":
+        return [hour], []
+    if window == "day":
+        return list(range(hour - 23, hour + 1)), []
+    if window == "week":
+        day = hour // 24
+        return [], list(range(day - 6, day + 1))
+    raise ValueError(f"알 수 없는 기간: {window}")
+
+
+def rank(counts: dict[int, int], k: int) -> list[tuple[int, int]]:
+    # 선택 수 내림차순, 같으면 문제 ID 순
+    return heapq.nsmallest(k, counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+class PopularityBoard:
+    """프로세스 내부 인기 순위표 (전체 기간 + 1시간/1일 버킷)"""
+
+    def __init__(self):
+        self._counts: dict[int, int] = {}
+        self._hours: dict[int, dict[int, int]] = {}  # 시간 번호 → {문제 ID: 선택 수}
+        self._days: dict[int, dict[int, int]] = {}   # 일 번호 → {문제 ID: 선택 수}
+        self._lock = threading.Lock()
+
+    def load(self, counts: dict[int, int]):
+        with self._lock:
+            self._counts = dict(counts)
+
+    def increment(self, problem_id: int, n: int = 1, hour: int = None):
+        hour = hour if hour is not None else hour_bucket()
+        with self._lock:
+            self._counts[problem_id] = self._counts.get(problem_id, 0) + n
+            for buckets, bucket in ((self._hours, hour), (self._days, hour // 24)):
+                counts = buckets.setdefault(bucket, {})
+                counts[problem_id] = counts.get(problem_id, 0) + n
+            self._prune(hour)
+
+    def _prune(self, hour: int):
+        for bucket in [bucket for bucket in self._hours if bucket <= hour - 24]:
+            del self._hours[bucket]
+        for bucket in [bucket for bucket in self._days if bucket <= hour // 24 - 7]:
+            del self._days[bucket]
+
+    def top(self, k: int, window: str = "all") -> list[tuple[int, int]]:
+        with self._lock:
+            if window == "all":
+                return rank(self._counts, k)
+            hours, days = window_buckets(window, hour_bucket())
+            counts = {}
+            for buckets, keys in ((self._hours, hours), (self._days, days)):
+                for bucket in keys:
+                    for problem_id, n in buckets.get(bucket, {}).items():
+                        counts[problem_id] = counts.get(problem_id, 0) + n
+        return rank(counts, k)
+
+
+class PopularityBuffer:
+    """
+    Redis 인기도 증가분을 모아서 파이프라인 한 번으로 반영
+    - Redis를 쓸 수 없는 동안에는 증가분을 버리지 않고 보관 (다시 연결되면 기간별 버킷에 반영)
+    - 보관하는 (시간 버킷, 문제 ID) 항목은 최대 POPULAR_MAX_PENDING개, 넘으면 오래된 시간 버킷부터 버림
+      (일주일보다 오래된 버킷은 어느 기간 순위에도 쓰이지 않으므로 항상 버림)
+    - 전체 기간 증가분은 따로 모아두고, Redis를 SQL 기준으로 다시 만들면(reconcile_popularity) 비움
+      (SQL 합계에 이미 들어 있으므로 다시 더하지 않도록)
+    - 다시 만드는 동안에는 rebuilding()으로 반영을 멈추고, snapshot()으로 SQL 합계 읽기와
+      전체 기간 증가분 비우기를 증가분 추가와 겹치지 않게 실행
+    """
+
+    def __init__(self, flush_interval: float = POPULAR_FLUSH_INTERVAL, max_pending: int = POPULAR_MAX_PENDING):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[tuple[int, int], int] = {}  # (시간 번호, 문제 ID) → 기간별 버킷 증가분
+        self._totals: dict[int, int] = {}               # 문제 ID → 전체 기간 증가분
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 반영(flush) 한 번, 또는 순위 다시 만들기 한 번씩
+        self._stop = threading.Event()
+        self._thread = None
+
+    def increment(self, problem_id: int, n: int = 1, hour: int = None):
+        key = (hour if hour is not None else hour_bucket(), problem_id)
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + n
+            self._totals[problem_id] = self._totals.get(problem_id, 0) + n
+
+    @contextmanager
+    def rebuilding(self):
+        """
+        블록이 끝날 때까지 Redis 반영(flush)을 멈춤 (Redis 전체 순위를 다시 만드는 동안)
+        - 다시 만들기 전에 꺼낸 증가분이 새 순위에 더해지거나, 다시 만드는 사이에 반영한 증가분이 지워지지 않도록
+        """
+        with self._flush_lock:
+            yield
+
+    def snapshot(self, load):
+        """
+        증가분 추가를 막은 채로 load()(SQL 합계 읽기) 실행 후 전체 기간 증가분 비우기
+        - 이미 모인 증가분은 커밋 후에 추가된 것이므로 읽은 SQL 합계에 들어 있음
+        - 읽는 동안 들어오는 증가분은 기다렸다가 비운 뒤에 추가됨 (다음 반영 때 더해짐)
+        - 기간별 버킷 증가분은 SQL에 없으므로 그대로 둠
+        """
+        with self._lock:
+            counts = load()
+            self._totals.clear()
+        return counts
+
+    def _trim(self):
+        """보관 중인 버킷 증가분 정리 (lock 안에서 호출)"""
+        oldest = hour_bucket() - 7 * 24
+        pending = {key: n for key, n in self._pending.items() if key[0] >= oldest}
+        if len(pending) > self.max_pending:
+            keep = sorted(pending, reverse=True)[:self.max_pending]
+            pending = {key: pending[key] for key in keep}
+        self._pending = pending
+
+    def _restore(self, batch: dict, totals: dict):
+        with self._lock:
+            for key, n in batch.items():
+                self._pending[key] = self._pending.get(key, 0) + n
+            for problem_id, n in totals.items():
+                self._totals[problem_id] = self._totals.get(problem_id, 0) + n
+            self._trim()
+
+    def flush(self) -> int:
+        """모아둔 증가분을 Redis에 반영, 반영한 항목 수 반환 (순위를 다시 만드는 중이면 끝날 때까지 기다림)"""
+        with self._flush_lock:
+            return self._flush()
+
+    def _flush(self) -> int:
+        if not redis_client:
+            # 다시 연결될 때까지 보관 (개수 제한)
+            with self._lock:
+                self._trim()
+            return 0
+
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            totals, self._totals = self._totals, {}
+
+        if not batch and not totals:
+            return 0
+
+        pipe = redis_client.pipeline(transaction=False)
+        for problem_id, n in totals.items():
+            pipe.zincrby(POPULAR_KEY, n, problem_id)
+        for (hour, problem_id), n in batch.items():
+            pipe.zincrby(hour_key(hour), n, problem_id)
+            pipe.zincrby(day_key(hour // 24), n, problem_id)
+        for hour in {hour for hour, _ in batch}:
+            # 버킷은 기간 계산에 필요한 동안만 보관
+            pipe.expire(hour_key(hour), 2 * DAY)
+            pipe.expire(day_key(hour // 24), 8 * DAY)
+        try:
+            pipe.execute()
+        except redis.RedisError as e:
+            # 실패하면 증가분을 되돌려 놓고 다음 주기에 다시 시도
+            # (연결 오류면 redis_client가 사용 불가로 바뀌어 다시 연결될 때까지 보관)
+            print(f"인기도 반영 실패: {e}")
+            self._restore(batch, totals)
+            return 0
+
+        return len(batch)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="popularity-buffer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """주기 반영을 멈추고 남은 증가분을 모두 반영 (서버 종료 시)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+popularity_board = PopularityBoard()
+popularity_buffer = PopularityBuffer()
+
+
+def record_selection_statement(problem_id: int, n: int = 1):
+    stmt = insert(ProblemPopularity).values(problem_id=problem_id, selection_count=n, updated_at=datetime.utcnow())
+    return stmt.on_conflict_do_update(
+        index_elements=[ProblemPopularity.problem_id],
+        set_={
+            "selection_count": ProblemPopularity.selection_count + stmt.excluded.selection_count,
+            "updated_at": stmt.excluded.updated_at
+        }
+    )
+
+
+def record_selection(db: Session, problem_id: int, n: int = 1):
+    """ProblemPopularity 증가 (커밋은 호출한 쪽에서, 커밋 후 publish_selection 호출)"""
+    db.execute(record_selection_statement(problem_id, n))
+
+
+def publish_selection(problem_id: int, n: int = 1):
+    """커밋된 선택을 내부 순위표와 Redis 반영 대기열에 추가"""
+    hour = hour_bucket()
+    # 대기열 먼저: 순위를 다시 만드는 중(snapshot)이면 끝날 때까지 기다린 뒤 내부 순위표에 더함
+    popularity_buffer.increment(problem_id, n, hour)
+    popularity_board.increment(problem_id, n, hour)
+
+
+def redis_top(k: int, window: str) -> list[tuple[int, int]]:
+    """Redis 인기 순위 (기간별 순위는 버킷을 ZUNIONSTORE로 합산, 왕복 한 번)"""
+    if window == "all":
+        rows = redis_client.zrevrange(POPULAR_KEY, 0, k - 1, withscores=True)
+    else:
+        hours, days = window_buckets(window, hour_bucket())
+        keys = [hour_key(hour) for hour in hours] + [day_key(day) for day in days]
+        dest = f"{POPULAR_KEY}:window:{window}"
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zunionstore(dest, keys)
+        pipe.expire(dest, 60)
+        pipe.zrevrange(dest, 0, k - 1, withscores=True)
+        rows = pipe.execute()[-1]
+    # Redis에서 가져온 데이터는 전부 문자열
+    return [(int(problem_id), int(score)) for problem_id, score in rows]
+
+
+def top_problems(k: int, window: str = "all") -> list[tuple[int, int]]:
+    """인기 문제 (문제 ID, 선택 수) 상위 k개"""
+    if redis_client:
+        try:
+            return redis_top(k, window)
+        except redis.RedisError:
+            pass
+    return popularity_board.top(k, window)
+
+
+def load_popularity(db: Session) -> dict[int, int]:
+    return dict(db.execute(select(ProblemPopularity.problem_id, ProblemPopularity.selection_count)).all())
+
+
+def backfill_popularity(db: Session) -> dict[int, int]:
+    """
+    ProblemPopularity가 비어 있을 때 (기존 DB) 처음 채우기
+    - UserProblem.selection_count 합계 기준
+    - 기존 Redis 점수가 더 크면 (선택 취소된 기록 포함) Redis 점수 사용
+    """
+    counts = dict(db.execute(
+        select(UserProblem.problem_id, func.sum(UserProblem.selection_count)).group_by(UserProblem.problem_id)
+    ).all())
+
+    if redis_client:
+        try:
+            for problem_id, score in redis_client.zrange(POPULAR_KEY, 0, -1, withscores=True):
+                if problem_id.isdigit():
+                    counts[int(problem_id)] = max(counts.get(int(problem_id), 0), int(score))
+        except redis.RedisError:
+            pass
+
+    if counts:
+        now = datetime.utcnow()
+        db.add_all([
+            ProblemPopularity(problem_id=problem_id, selection_count=count, updated_at=now)
+            for problem_id, count in counts.items()
+        ])
+        db.commit()
+    return counts
+
+
+def reconcile_popularity(db: Session) -> dict[int, int]:
+    """
+    SQL 기준으로 내부 순위표와 Redis sorted set 다시 만들기
+    - 끝날 때까지 Redis 반영을 멈추고, SQL 합계를 읽는 동안은 선택 반영(publish_selection)도 기다림
+      → 대기 중인 전체 기간 증가분은 SQL 합계에 들어 있으므로 비우고, 그 뒤의 증가분만 다음 반영 때 더함
+    - 커밋과 publish_selection 사이에 SQL 합계를 읽으면 그 선택은 한 번 더 더해질 수 있음 (커밋 직후라 드묾)
+    """
+    def load_counts():
+        counts = load_popularity(db)
+        popularity_board.load(counts)
+        return counts
+
+    with popularity_buffer.rebuilding():
+        counts = popularity_buffer.snapshot(load_counts)
+
+        if redis_client:
+            try:
+                pipe = redis_client.pipeline()
+                pipe.delete(POPULAR_KEY)
+                if counts:
+                    pipe.zadd(POPULAR_KEY, counts)
+                pipe.execute()
+            except redis.RedisError:
+                # 연결 오류면 다시 연결될 때 한 번 더 다시 만듦 (redis_client.on_recover)
+                print("Redis 인기 문제 순위를 다시 만들지 못했습니다. (내부 순위표 사용)")
+    return counts
+
+
+def ensure_popularity(session_factory):
+    """서버 시작 시: 기존 DB면 처음 채우고, 내부 순위표/Redis를 SQL 기준으로 맞춤"""
+    db = session_factory()
+    try:
+        if db.query(ProblemPopularity.problem_id).first() is None:
+            backfill_popularity(db)
+        reconcile_popularity(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    # Redis 인기 순위를 SQL 기준으로 다시 만들기: python -m utils.popularity
+    from database import SessionLocal, engine, Base
+    from models.user import User
+    from models.post import Post
+    from models.comment import Comment
+
+    Base.metadata.create_all(bind=engine)
+    redis_client.check()
+    ensure_popularity(SessionLocal)
+    print(f"✅ 인기 문제 순위를 다시 만들었습니다. (문제 {len(popularity_board.top(10 ** 9))}개)")
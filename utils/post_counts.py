@@ -0,0 +1,107 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert
+
+from models.post import Post, PostTag, PostCount
+
+# 게시글 수 카운터
+# - 목록 API의 total을 COUNT(*) 대신 PostCount 테이블에서 키 하나로 조회
+# - 게시글/태그 변경 시 같은 트랜잭션 안에서 adjust_counts()로 증감
+# - 어긋났을 때는 reconcile_counts()로 처음부터 다시 계산
+
+TOTAL_KEY = "total"
+
+
+def category_key(category: str) -> str:
+    return f"category:{category}"
+
+
+def tag_key(tag_id: int) -> str:
+    return f"tag:{tag_id}"
+
+
+def post_keys(category: str, tag_ids) -> list[str]:
+    """게시글 하나가 포함되는 카운터 키 목록"""
+    return [TOTAL_KEY, category_key(category)] + [tag_key(tag_id) for tag_id in tag_ids]
+
+
+def adjust_counts_statement(deltas: dict[str, int]):
+    """카운터 증감 INSERT ... ON CONFLICT 문 (바뀌는 값이 없으면 None)"""
+    rows = [{"key": key, "count": delta} for key, delta in deltas.items() if delta]
+    if not rows:
+        return None
+
+    stmt = insert(PostCount).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[PostCount.key],
+        set_={"count": PostCount.count + stmt.excluded.count}
+    )
+
+
+def adjust_counts(db: Session, deltas: dict[str, int]):
+    """카운터 증감 (커밋은 호출한 쪽에서)"""
+    stmt = adjust_counts_statement(deltas)
+    if stmt is not None:
+        db.execute(stmt)
+
+
+def count_statement(key: str):
+    return select(PostCount.count).where(PostCount.key == key)
+
+
+def get_count(db: Session, key: str) -> int:
+    count = db.scalar(count_statement(key))
+    return count or 0
+
+
+async def get_count_async(db, key: str) -> int:
+    count = await db.scalar(count_statement(key))
+    return count or 0
+
+
+def reconcile_counts(db: Session) -> dict[str, int]:
+    """게시글/태그 테이블 기준으로 모든 카운터를 다시 계산"""
+    counts = {TOTAL_KEY: db.query(func.count(Post.post_id)).scalar()}
+
+    for category, count in db.execute(
+        select(Post.category, func.count(Post.post_id)).group_by(Post.category)
+    ):
+        counts[category_key(category)] = count
+
+    for tag_id, count in db.execute(
+        select(PostTag.tag_id, func.count(PostTag.post_tag_id)).group_by(PostTag.tag_id)
+    ):
+        counts[tag_key(tag_id)] = count
+
+    db.query(PostCount).delete()
+    db.add_all([PostCount(key=key, count=count) for key, count in counts.items()])
+    db.commit()
+
+    return counts
+
+
+def ensure_post_counts(session_factory):
+    """카운터가 한 번도 계산되지 않았다면 (기존 DB) 새로 계산"""
+    db = session_factory()
+    try:
+        if db.get(PostCount, TOTAL_KEY) is None:
+            reconcile_counts(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    # 카운터 재계산: python -m utils.post_counts
+    from database import SessionLocal, engine, Base
+    from models.user import User
+    from models.comment import Comment
+    from models.problem import Problem, UserProblem
+
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        counts = reconcile_counts(db)
+        print(f"✅ 게시글 카운터를 재계산했습니다. (전체 {counts[TOTAL_KEY]}개, 키 {len(counts)}개)")
+    finally:
+        db.close()
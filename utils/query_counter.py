@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+
+from database import engine as sync_engine, read_engine, async_engine
+
+# SQL 실행 횟수 측정 도구 (N+1 쿼리 회귀 확인용)
+#
+# 사용 예)
+#     with query_budget(3):
+#         client.get("/blog?limit=100")
+#
+# 블록 안에서 실행된 SQL 문이 예산을 넘으면 AssertionError 발생
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine=None):
+    """블록 안에서 실행된 SQL 문을 기록하는 QueryCounter를 반환"""
+    # 기본값: 동기 엔진(쓰기/읽기) + (DB_MODE=async 이면) 비동기 엔진
+    if engine is not None:
+        engines = [engine]
+    else:
+        engines = list({sync_engine, read_engine}) + ([async_engine.sync_engine] if async_engine else [])
+    counter = QueryCounter()
+
+    for target in engines:
+        event.listen(target, "before_cursor_execute", counter._on_execute)
+    try:
+        yield counter
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", counter._on_execute)
+
+
+@contextmanager
+def query_budget(budget: int, engine=None):
+    """블록 안의 SQL 실행 횟수가 budget을 넘으면 실패"""
+    with count_queries(engine) as counter:
+        yield counter
+
+    if counter.count > budget:
+        executed = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(counter.statements, 1))
+        raise AssertionError(
+            f"쿼리 예산 초과: {counter.count}개 실행 (허용 {budget}개)\n{executed}"
+        )
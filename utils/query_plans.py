@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+import re
+
+from database import engine as sync_engine, read_engine, async_engine
+
+# EXPLAIN QUERY PLAN 검사 도구 (인덱스 누락 회귀 확인용)
+#
+# 사용 예)
+#     with query_plan_check():
+#         client.get("/blog?category=영어지식")
+#
+# 블록 안에서 실행된 SELECT/UPDATE/DELETE 문마다 같은 연결에서 EXPLAIN QUERY PLAN 을 실행하고,
+# 인덱스 없이 테이블 전체를 읽는 단계(SCAN <테이블>)가 있으면 AssertionError 발생
+# - 인덱스를 따라 읽는 SCAN ... USING INDEX, FTS 가상 테이블, 서브쿼리 결과 SCAN 은 허용
+# - 3글자 미만 검색어는 LIKE 로 처리되어 항상 전체 스캔 (utils/search.py 참고)
+# - 의도적으로 전체를 읽는 테이블(작은 테이블, 관리용 재계산 등)은 allow 로 제외
+# - 모든 API 경로의 검사는 tests/test_query_plans.py
+
+FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?"?(\w+)"?(?: AS \w+)?$')
+# 이름 있는 서브쿼리 결과 (예: CO-ROUTINE anon_1) → 이후의 SCAN anon_1 은 테이블 스캔이 아님
+SUBQUERY = re.compile(r'^(?:CO-ROUTINE|MATERIALIZE) "?(\w+)"?$')
+
+
+def full_scans(plan: list[str]) -> list[str]:
+    """계획에서 인덱스 없이 테이블 전체를 읽는 테이블 이름 목록"""
+    subqueries = {match.group(1) for detail in plan if (match := SUBQUERY.match(detail.strip()))}
+    tables = []
+    for detail in plan:
+        match = FULL_SCAN.match(detail.strip())
+        if match and match.group(1) not in subqueries:
+            tables.append(match.group(1))
+    return tables
+
+
+class QueryPlanCheck:
+    def __init__(self, allow=()):
+        self.allow = set(allow)
+        self.plans = []       # (SQL, 계획)
+        self.violations = []  # (SQL, 계획, 전체 스캔 테이블)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().upper().startswith(("SELECT", "WITH", "UPDATE", "DELETE")):
+            return
+        # EXPLAIN 실행 중에는 이 이벤트가 다시 불리지 않도록 드라이버 커서를 직접 사용
+        # (aiosqlite 어댑터 커서의 execute는 커서를 반환하지 않으므로 따로 fetchall)
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plan = [row[-1] for row in cursor.fetchall()]
+        self.plans.append((statement, plan))
+        tables = [table for table in full_scans(plan) if table not in self.allow]
+        if tables:
+            self.violations.append((statement, plan, tables))
+
+    def report(self) -> str:
+        lines = []
+        for statement, plan, tables in self.violations:
+            lines.append(f"- 전체 스캔: {', '.join(tables)}")
+            lines.append("  " + " ".join(statement.split()))
+            lines.extend(f"    {detail}" for detail in plan)
+        return "\n".join(lines)
+
+
+@contextmanager
+def query_plan_check(allow=(), engine=None):
+    """블록 안의 SELECT/UPDATE/DELETE 문 중 테이블 전체 스캔이 있으면 실패"""
+    if engine is not None:
+        engines = [engine]
+    else:
+        engines = list({sync_engine, read_engine}) + ([async_engine.sync_engine] if async_engine else [])
+    checker = QueryPlanCheck(allow)
+
+    for target in engines:
+        event.listen(target, "before_cursor_execute", checker._on_execute)
+    try:
+        yield checker
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", checker._on_execute)
+
+    if checker.violations:
+        raise AssertionError(f"인덱스를 사용하지 않는 쿼리 {len(checker.violations)}개\n{checker.report()}")
+
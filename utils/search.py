@@ -0,0 +1,126 @@
+from sqlalchemy import select, text, table, literal_column, bindparam
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import OperationalError
+
+# 게시글 전문 검색 인덱스 (SQLite FTS5 + trigram 토크나이저)
+# - trigram은 공백 단위가 아니라 3글자 단위로 색인하므로 한글 부분 문자열도 검색 가능
+# - rowid = Post.post_id 로 맞춰서 게시글과 1:1로 연결
+SEARCH_TABLE = "PostSearch"
+
+# trigram 인덱스는 3글자 이상 검색어만 사용할 수 있음 (짧은 검색어는 LIKE로 처리)
+MIN_MATCH_LENGTH = 3
+
+# FTS5를 지원하지 않는 SQLite 빌드에서는 False로 바뀌고 LIKE 검색으로 동작
+search_enabled = True
+
+
+def create_search_index(engine):
+    """검색 인덱스 테이블 생성 (없을 때만), 새로 만들었다면 기존 게시글로 채움"""
+    global search_enabled
+
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": SEARCH_TABLE}
+            ).first()
+            if exists:
+                return
+
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE {SEARCH_TABLE} "
+                f"USING fts5(title, content, tokenize = 'trigram')"
+            ))
+            conn.execute(text(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, title, content) "
+                f"SELECT post_id, title, content FROM Post"
+            ))
+    except OperationalError as e:
+        print(f"검색 인덱스를 사용할 수 없습니다. LIKE 검색으로 동작합니다: {e}")
+        search_enabled = False
+
+
+def index_post_statements(post) -> list:
+    """게시글 작성/수정 시 검색 인덱스 갱신 문 목록 [(문, 파라미터)]"""
+    if not search_enabled:
+        return []
+
+    return [
+        (text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :post_id"), {"post_id": post.post_id}),
+        (
+            text(f"INSERT INTO {SEARCH_TABLE} (rowid, title, content) VALUES (:post_id, :title, :content)"),
+            {"post_id": post.post_id, "title": post.title, "content": post.content}
+        )
+    ]
+
+
+def index_post(db: Session, post):
+    """게시글 작성/수정 시 검색 인덱스 갱신 (호출한 쪽의 트랜잭션에 포함됨)"""
+    for stmt, params in index_post_statements(post):
+        db.execute(stmt, params)
+
+
+def remove_posts(db: Session, post_ids: list[int]):
+    """게시글 삭제 시 검색 인덱스에서도 제거"""
+    if not search_enabled or not post_ids:
+        return
+
+    db.execute(
+        text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN :post_ids")
+        .bindparams(bindparam("post_ids", expanding=True)),
+        {"post_ids": list(post_ids)}
+    )
+
+
+def can_match(keyword: str) -> bool:
+    """검색 인덱스로 처리 가능한 검색어인지 확인"""
+    return search_enabled and len(keyword.strip()) >= MIN_MATCH_LENGTH
+
+
+def to_match_query(keyword: str) -> str:
+    # 검색어 전체를 하나의 구문(phrase)으로 검색 → LIKE '%검색어%'와 같은 의미
+    return '"' + keyword.strip().replace('"', '""') + '"'
+
+
+def search_subquery(keyword: str):
+    """
+    검색어와 일치하는 게시글 ID와 관련도 점수를 돌려주는 서브쿼리
+    - rank는 bm25 점수 (작을수록 관련도 높음), 제목 일치에 가중치 부여
+    """
+    return (
+        select(
+            literal_column("rowid").label("post_id"),
+            literal_column(f"bm25({SEARCH_TABLE}, 10.0, 1.0)").label("rank")
+        )
+        .select_from(table(SEARCH_TABLE))
+        .where(text(f"{SEARCH_TABLE} MATCH :keyword").bindparams(keyword=to_match_query(keyword)))
+        .subquery()
+    )
+
+
+def rebuild_search_index(db: Session):
+    """검색 인덱스를 게시글 테이블 기준으로 처음부터 다시 생성"""
+    db.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    db.execute(text(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, content) "
+        f"SELECT post_id, title, content FROM Post"
+    ))
+    db.commit()
+
+    return db.execute(text(f"SELECT count(*) FROM {SEARCH_TABLE}")).scalar()
+
+
+if __name__ == "__main__":
+    # 검색 인덱스 재생성: python -m utils.search
+    from database import SessionLocal, engine
+
+    create_search_index(engine)
+    if not search_enabled:
+        raise SystemExit(1)
+
+    db = SessionLocal()
+    try:
+        count = rebuild_search_index(db)
+        print(f"✅ 검색 인덱스를 재생성했습니다. (게시글 {count}개)")
+    finally:
+        db.close()
@@ -0,0 +1,29 @@
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from functools import lru_cache
+
+# 빠른 JSON 응답
+# - FastAPI는 dict를 반환하면 jsonable_encoder로 모든 값을 파이썬에서 순회하고,
+#   response_model이 있으면 검증 → 파이썬 객체로 변환 → JSON 직렬화를 따로 함
+# - json_response()는 응답 스키마로 검증과 JSON 직렬화를 pydantic-core에서 한 번에 처리
+# - 라우터에는 response_model도 같이 지정 (API 문서용, 반환값이 Response라서 다시 검증하지 않음)
+# - 캐시/템플릿에 넣을 dict도 jsonable_encoder 대신 같은 TypeAdapter로 만듦 (json_data)
+
+
+@lru_cache(maxsize=None)
+def adapter_for(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def json_data(schema, content):
+    """content를 schema로 검증해서 JSON으로 바꿀 수 있는 값(dict 등)으로 변환 (캐시 저장, 템플릿 데이터용)"""
+    adapter = adapter_for(schema)
+    return adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json", exclude_unset=True)
+
+
+def json_response(schema, content, status_code: int = 200, headers: dict = None) -> Response:
+    """content를 schema로 검증해서 JSON 응답 생성 (dict, ORM 객체 모두 가능)"""
+    adapter = adapter_for(schema)
+    # exclude_unset: 응답 dict에 없던 선택 항목(예: 검색어 keyword)은 그대로 생략
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True), exclude_unset=True)
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
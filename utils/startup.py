@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+import time
+
+# 서버 시작 시간 측정
+# - main.py의 import와 lifespan 시작 단계(DB 연결, 스키마 확인, Redis 연결 등)별 소요 시간을 기록
+# - 시작이 끝나면 한 줄로 출력하고, /health 응답의 startup 항목으로도 확인
+
+
+class StartupReport:
+    def __init__(self):
+        self.steps: dict[str, float] = {}  # 단계 이름 → 소요 시간(초), 기록한 순서대로
+
+    def record(self, name: str, seconds: float):
+        self.steps[name] = self.steps.get(name, 0) + seconds
+
+    @contextmanager
+    def step(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def summary(self) -> dict:
+        return {
+            "total_ms": round(sum(self.steps.values()) * 1000, 1),
+            "steps_ms": {name: round(seconds * 1000, 1) for name, seconds in self.steps.items()}
+        }
+
+    def print(self):
+        summary = self.summary()
+        steps = ", ".join(f"{name} {ms}ms" for name, ms in summary["steps_ms"].items())
+        print(f"서버 시작 {summary['total_ms']}ms ({steps})")
+
+
+startup_report = StartupReport()
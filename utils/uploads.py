@@ -0,0 +1,138 @@
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from urllib.parse import urlencode
+import anyio
+import threading
+import hashlib
+import tempfile
+import time
+import os
+
+# 업로드 파일 저장
+# - 파일을 UPLOAD_CHUNK_SIZE 단위로 읽어서 스레드풀에서 디스크에 쓰고 (이벤트 루프를 막지 않음)
+#   쓰는 동안 SHA-256 해시를 같이 계산
+# - 요청 본문 크기는 본문을 받는 단계에서 제한 (UploadLimitMiddleware, main.py에서 등록)
+#   Starlette는 multipart 본문 전체를 받아서 임시 파일에 넣은 뒤에 핸들러를 호출하므로
+#   핸들러 안의 검사만으로는 큰 요청을 다 받은 뒤에야 거절할 수 있음
+# - save_upload는 파싱이 끝난 파일 하나의 크기를 다시 확인 (최대 크기를 넘으면 413)
+# - 파일 이름은 내용의 해시({sha256}{확장자}) → 같은 파일을 다시 올리면 한 번만 저장
+#   (이미 있는 파일이면 수정 시각만 갱신: 게시글 삭제 후 이미지 정리에서 최근에 다시 올린 파일은 남김)
+# - 임시 파일 생성/삭제도 스레드풀에서 실행
+# - 다운로드할 때 보여줄 이름이 필요하면 download_url로 주소에 붙임 (예: 문제 파일 2024_6_1.pdf)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_IMAGE_SIZE = int(os.getenv("MAX_IMAGE_SIZE", str(10 * 1024 * 1024)))
+MAX_PROBLEM_FILE_SIZE = int(os.getenv("MAX_PROBLEM_FILE_SIZE", str(50 * 1024 * 1024)))
+# 최근 UPLOAD_GRACE_SECONDS 초 안에 올린 파일은 삭제하지 않음 (업로드 후 게시글을 작성하는 중일 수 있음)
+UPLOAD_GRACE_SECONDS = int(os.getenv("UPLOAD_GRACE_SECONDS", "3600"))
+# 요청 본문 제한 = 파일 최대 크기 + 다른 폼 필드와 multipart 경계에 쓰이는 여유분
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+
+# 해시 이름 파일 저장과 삭제를 한 번에 하나씩 (저장 직후의 파일을 정리 작업이 지우지 않도록)
+upload_file_lock = threading.Lock()
+
+
+def too_large(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"파일이 너무 큽니다. 최대 {max_size // (1024 * 1024)}MB까지 업로드할 수 있습니다."
+    )
+
+
+def write_chunk(buffer, hasher, chunk: bytes):
+    hasher.update(chunk)
+    buffer.write(chunk)
+
+
+def remove_file(path: str):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def download_url(file_path: str, download_name: str) -> str:
+    """저장된 파일 주소 + 다운로드 파일 이름 (UploadFiles가 Content-Disposition으로 응답, utils/assets.py)"""
+    return f"/{file_path}?{urlencode({'download': download_name})}"
+
+
+def store_file(temp_path: str, directory: str, digest: str, extension: str) -> str:
+    """임시 파일을 해시 이름으로 옮김 (같은 내용의 파일이 이미 있으면 임시 파일만 삭제)"""
+    file_path = os.path.join(directory, f"{digest}{extension}")
+    with upload_file_lock:
+        if os.path.exists(file_path):
+            os.utime(file_path)
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, file_path)
+    return file_path
+
+
+def recently_uploaded(path: str) -> bool:
+    """UPLOAD_GRACE_SECONDS 안에 저장(또는 같은 내용으로 다시 업로드)된 파일인지"""
+    try:
+        return os.path.getmtime(path) > time.time() - UPLOAD_GRACE_SECONDS
+    except FileNotFoundError:
+        return False
+
+
+class UploadLimitMiddleware:
+    """
+    업로드 API의 요청 본문 크기 제한 (limits: 경로 → 파일 최대 크기)
+    - Content-Length가 제한을 넘으면 본문을 읽지 않고 바로 413 응답
+    - Content-Length가 없으면 (chunked) 받은 바이트 수를 세다가 제한을 넘는 순간 413
+      (본문 파싱 중에 HTTPException을 일으키면 FastAPI가 그대로 응답으로 바꿈)
+    """
+
+    def __init__(self, app, limits: dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        max_size = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if max_size is None:
+            await self.app(scope, receive, send)
+            return
+
+        limit = max_size + UPLOAD_FORM_OVERHEAD
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > limit:
+            response = ORJSONResponse({"detail": too_large(max_size).detail}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise too_large(max_size)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+async def save_upload(upload: UploadFile, directory: str, extension: str, max_size: int) -> str:
+    """업로드 파일을 스트리밍으로 저장하고 저장된 경로 반환 (요청 본문 크기는 UploadLimitMiddleware에서 먼저 제한)"""
+    if upload.size is not None and upload.size > max_size:
+        raise too_large(max_size)
+
+    fd, temp_path = await run_in_threadpool(tempfile.mkstemp, dir=directory, suffix=".part")
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise too_large(max_size)
+                await run_in_threadpool(write_chunk, buffer, hasher, chunk)
+        return await run_in_threadpool(store_file, temp_path, directory, hasher.hexdigest(), extension)
+    except BaseException:
+        # 요청이 취소된 경우에도 임시 파일은 지우도록 정리하는 동안은 취소를 막음
+        with anyio.CancelScope(shield=True):
+            await run_in_threadpool(remove_file, temp_path)
+        raise
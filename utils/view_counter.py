@@ -0,0 +1,98 @@
+from sqlalchemy import update, bindparam, func
+import threading
+import os
+
+from database import engine
+from models.post import Post
+
+# 게시글 조회수 집계기 (write-behind)
+# - 조회할 때마다 DB에 커밋하지 않고 메모리에 증가분만 모아둠
+# - 일정 주기마다 UPDATE Post SET view_count = view_count + n 을 한 번에 실행
+#   (수정 시간은 그대로 유지: 조회만으로 게시글이 수정된 것처럼 보이거나 ETag가 바뀌지 않도록)
+# - 아직 반영되지 않은 증가분은 pending()으로 응답에 합쳐서 보여줌
+
+# 반영 주기 (초)
+VIEW_COUNT_FLUSH_INTERVAL = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "5"))
+
+
+class ViewCounter:
+    def __init__(self, flush_interval: float = VIEW_COUNT_FLUSH_INTERVAL, bind=engine):
+        self.flush_interval = flush_interval
+        self.bind = bind  # 반영할 DB 엔진 (쓰기 엔진)
+        self._pending: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def increment(self, post_id: int, n: int = 1):
+        with self._lock:
+            self._pending[post_id] = self._pending.get(post_id, 0) + n
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수 증가분"""
+        return self._pending.get(post_id, 0)
+
+    def merged(self, post_id: int, stored: int) -> int:
+        """DB에 저장된 조회수 + 반영 대기 중인 증가분"""
+        return (stored or 0) + self.pending(post_id)
+
+    def discard(self, post_ids: list[int]):
+        """삭제된 게시글의 대기 중인 증가분 제거"""
+        with self._lock:
+            for post_id in post_ids:
+                self._pending.pop(post_id, None)
+
+    def flush(self) -> int:
+        """모아둔 증가분을 UPDATE 한 번(executemany)으로 반영, 반영한 게시글 수 반환"""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+
+        if not batch:
+            return 0
+
+        stmt = (
+            update(Post)
+            .where(Post.post_id == bindparam("b_post_id"))
+            .values(
+                # 조회수가 NULL인 기존 게시글은 0부터 계산
+                view_count=func.coalesce(Post.view_count, 0) + bindparam("b_delta"),
+                updated_at=Post.updated_at
+            )
+        )
+        try:
+            with self.bind.begin() as conn:
+                conn.execute(stmt, [
+                    {"b_post_id": post_id, "b_delta": delta}
+                    for post_id, delta in batch.items()
+                ])
+        except Exception as e:
+            # 실패하면 증가분을 되돌려 놓고 다음 주기에 다시 시도
+            print(f"조회수 반영 실패: {e}")
+            with self._lock:
+                for post_id, delta in batch.items():
+                    self._pending[post_id] = self._pending.get(post_id, 0) + delta
+            return 0
+
+        return len(batch)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """주기 반영을 멈추고 남은 증가분을 모두 반영 (서버 종료 시)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+view_counter = ViewCounter()